@@ -1,13 +1,18 @@
 from __future__ import annotations
-from audioop import alaw2lin
-from os import access
+import io
+import json
+import unittest
+from enum import Enum
+from time import perf_counter
 from pokemon import Venusaur, Squirtle, Charizard, Gastly
 from print_screen import print_game_screen
 from poke_team import Action, PokeTeam, Criterion
+from pokemon_base import PokemonBase
 from random_gen import RandomGen
 """
 
-This file demonstrates the implementation of the Battle Class, a class that effectively runs a conflict/battle between two PokeTeams
+This file demonstrates the implementation of the Battle Class, a class that effectively runs a conflict/battle between two PokeTeams.
+Also defines UnitTests for the rendering policies, run with python -m unittest battle
 
 September 2022
 """
@@ -23,25 +28,248 @@ All methods have a best/worst case time complexity O(1), constant time unless ot
 # Some importated libraries needed to facilitate the creation/testing of the Battle Class
 
 
+class RenderPolicy(Enum):
+    """ Class for how often a battle draws the game screen, the value is the matching verbosity integer"""
+    HEADLESS = 0
+    FINAL_FRAME = 1
+    EVERY_N_TURNS = 2
+    FULL = 3
+
+
+class BattleMetrics:
+    """
+
+    This class collects opt-in instrumentation of battles: the time spent in each phase and counts of battle events,
+    totalled over every battle played with it, and optionally written as one JSON line per battle
+
+    Phases (seconds): ai (choosing actions), retrieve and return (taking Pokemon out of and back into a team),
+    resort (returning Pokemon to a battle mode 2 team, where the sorted list places them), special, render and battle (the whole battle)
+
+    Counters: battles, turns, attacks, swaps, specials, heals, evolutions, faints, resorts (times a battle mode 2 sorted list is
+    reordered: one per Pokemon returned into it and one per special), team1_wins, team2_wins and draws. The sort keys hold the
+    tie-breakers, so a resort never needs a separate tie-break pass
+
+    Instance Attributes:
+        timings (dict): Seconds spent in each phase
+        counters (dict): The count of each event
+        sink (file): Where a JSON line is written after each battle, None to only keep the totals
+    """
+
+    PHASES = ('ai', 'retrieve', 'return', 'resort', 'special', 'render', 'battle')
+    COUNTERS = ('battles', 'turns', 'attacks', 'swaps', 'specials', 'heals', 'evolutions', 'faints', 'resorts',
+                'team1_wins', 'team2_wins', 'draws')
+    # The counter of each action chosen
+    ACTION_COUNTERS = {Action.ATTACK: 'attacks', Action.SWAP: 'swaps', Action.SPECIAL: 'specials', Action.HEAL: 'heals'}
+    RESULT_COUNTERS = ('draws', 'team1_wins', 'team2_wins')
+
+    def __init__(self, sink=None) -> None:
+        """
+
+        This is the constructor method for the BattleMetrics Class
+
+        Parameters:
+            sink (file): A text file (anything with a write method) receiving one JSON line per battle, None for totals only
+        """
+
+        self.timings = dict.fromkeys(self.PHASES, 0.0)
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.sink = sink
+        self.battle_start = None
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """ Adds n to a counter """
+        self.counters[counter] += n
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """ Adds time spent in a phase """
+        self.timings[phase] += seconds
+
+    def start_battle(self) -> None:
+        """
+
+        This method marks the start of a battle, remembering the totals so far for its JSON line
+
+        Complexity analysis:
+            Best/worst case O(P + C) where P is the number of phases and C the number of counters
+        """
+
+        self.battle_start = (dict(self.timings), dict(self.counters))
+
+    def end_battle(self, result: int, turns: int, seconds: float) -> None:
+        """
+
+        This method records the end of a battle, writing its JSON line to the sink
+
+        Parameters:
+            result (int): The battle result, 1 or 2 for the winning team, 0 for a draw
+            turns (int): The number of turns the battle lasted
+            seconds (float): The time the whole battle took
+
+        Complexity analysis:
+            Best/worst case O(P + C) where P is the number of phases and C the number of counters
+        """
+
+        self.count('battles')
+        self.count('turns', turns)
+        self.count(self.RESULT_COUNTERS[result])
+        self.add_time('battle', seconds)
+        if self.sink is not None:
+            timings, counters = self.battle_start
+            record = {'result': result,
+                      'timings': {phase: self.timings[phase] - timings[phase] for phase in self.PHASES},
+                      'counters': {counter: self.counters[counter] - counters[counter] for counter in self.COUNTERS}}
+            self.sink.write(json.dumps(record) + '\n')
+        self.battle_start = None
+
+    def as_dict(self) -> dict:
+        """ The totals over every battle, as {'timings': {phase: seconds}, 'counters': {counter: count}} """
+        return {'timings': dict(self.timings), 'counters': dict(self.counters)}
+
+    def to_json(self) -> str:
+        """ The totals over every battle, see as_dict, as one JSON line """
+        return json.dumps(self.as_dict())
+
+
+class MeteredTeam:
+    """
+
+    This class wraps a PokeTeam for an instrumented battle, timing and counting the calls the battle makes to the team.
+    Every other attribute is the team's own
+
+    Instance Attributes:
+        team (PokeTeam): The wrapped team
+        metrics (BattleMetrics): Where the timings and counts go
+    """
+
+    def __init__(self, team: PokeTeam, metrics: BattleMetrics) -> None:
+        self.team = team
+        self.metrics = metrics
+
+    def __getattr__(self, name: str):
+        return getattr(self.team, name)
+
+    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase, random_gen: RandomGen | None = None) -> Action:
+        start = perf_counter()
+        action = self.team.choose_battle_option(my_pokemon, their_pokemon, random_gen)
+        self.metrics.add_time('ai', perf_counter() - start)
+        if action is not None:
+            self.metrics.count(BattleMetrics.ACTION_COUNTERS[action])
+        return action
+
+    def retrieve_pokemon(self) -> PokemonBase | None:
+        start = perf_counter()
+        poke = self.team.retrieve_pokemon()
+        self.metrics.add_time('retrieve', perf_counter() - start)
+        return poke
+
+    def return_pokemon(self, poke: PokemonBase) -> None:
+        # Fainted Pokemon are dropped, they never reach the sorted list
+        resorted = self.team.battle_mode == 2 and not poke.is_fainted()
+        start = perf_counter()
+        self.team.return_pokemon(poke)
+        self.metrics.add_time('resort' if resorted else 'return', perf_counter() - start)
+        if resorted:
+            self.metrics.count('resorts')
+
+    def special(self) -> None:
+        start = perf_counter()
+        self.team.special()
+        self.metrics.add_time('special', perf_counter() - start)
+        if self.team.battle_mode == 2:
+            self.metrics.count('resorts')
+
+
 class Battle:
     """
 
     This class is an object represnting the "Battle" or conflict between two PokeTeams
 
     Instance Attributes:
-        verbosity (int): An arbritary integer used for the print_game_screen method
+        verbosity (int): An integer (or RenderPolicy) choosing how often the game screen is drawn
+        render_policy (RenderPolicy): The RenderPolicy matching verbosity
+        render_every (int): Number of turns between drawn frames, 0 if frames are never drawn during the battle
+        turns (int): The number of turns the last battle lasted
+        last_frame (tuple): The renderer arguments of the last turn's frame, kept only for the FINAL_FRAME policy
+        renderer (callable): The function drawing a frame, taking the same arguments as print_game_screen
+        random_gen (RandomGen): The random stream used for attacks and AI choices, None to leave it to the teams and the default stream
+        metrics (BattleMetrics): Collects timings and counts of the battles, None (the default) plays them uninstrumented
+        replay (ReplayWriter): Records every turn of the battles in a binary replay log (see replay.py), None to not record them
     """
 
-    def __init__(self, verbosity=0) -> None:
+    def __init__(self, verbosity=0, render_every=1, renderer=None, random_gen: RandomGen | None = None, metrics: BattleMetrics | None = None,
+                 replay=None) -> None:
         """
 
         This is the constructor method for the Battle Class
 
         Parameters:
-            verbosity (int): An abritary integer used for the print_game_screen method 
+            verbosity (int): An integer or RenderPolicy choosing the rendering policy
+                0 (HEADLESS) never draws the screen, 1 (FINAL_FRAME) draws the last turn only,
+                2 (EVERY_N_TURNS) draws every render_every turns and 3 (FULL) draws every turn, any other value draws every turn
+            render_every (int): Number of turns between frames for the EVERY_N_TURNS policy
+            renderer (callable): Draws a frame, print_game_screen when not given (e.g. DiffRenderer().print_game_screen)
+            random_gen (RandomGen): The random stream used for every attack and AI choice of the battles,
+                when None attacks use the default stream and AI choices the team's own stream
+            metrics (BattleMetrics): Collects timings and counts of the battles, None plays them uninstrumented
+            replay (ReplayWriter): Records every turn of the battles, None to not record them
         """
 
         self.verbosity = verbosity
+        try:
+            self.render_policy = RenderPolicy(
+                verbosity.value if isinstance(verbosity, RenderPolicy) else verbosity)
+        except ValueError:
+            # Battles used to draw every turn whatever the verbosity, other values keep doing so
+            self.render_policy = RenderPolicy.FULL
+        if self.render_policy == RenderPolicy.EVERY_N_TURNS:
+            if not isinstance(render_every, int) or render_every < 1:
+                raise ValueError('render_every must be a positive integer')
+            self.render_every = render_every
+        elif self.render_policy == RenderPolicy.FULL:
+            self.render_every = 1
+        else:
+            # Headless and final frame battles never draw inside the turn loop
+            self.render_every = 0
+        self.turns = 0
+        self.last_frame = None
+        self.renderer = renderer if renderer is not None else print_game_screen
+        self.random_gen = random_gen
+        self.metrics = metrics
+        self.replay = replay
+
+    def render(self, poke1: PokemonBase, poke2: PokemonBase, team1: PokeTeam, team2: PokeTeam) -> None:
+        """
+
+        This method draws the game screen for the two Pokemon currently on the field
+
+        Parameters:
+            poke1 (PokemonBase): Team 1's Pokemon on the field
+            poke2 (PokemonBase): Team 2's Pokemon on the field
+            team1 (PokeTeam): The PokeTeam of poke1
+            team2 (PokeTeam): The PokeTeam of poke2
+        """
+
+        self.renderer(*self.frame(poke1, poke2, team1, team2))
+
+    def frame(self, poke1: PokemonBase, poke2: PokemonBase, team1: PokeTeam, team2: PokeTeam) -> tuple:
+        """
+
+        This method captures the renderer arguments of the game screen for the two Pokemon currently on the field,
+        so the frame can be drawn later even after the battle has changed the Pokemon
+
+        Parameters:
+            poke1 (PokemonBase): Team 1's Pokemon on the field
+            poke2 (PokemonBase): Team 2's Pokemon on the field
+            team1 (PokeTeam): The PokeTeam of poke1
+            team2 (PokeTeam): The PokeTeam of poke2
+
+        Returns:
+            tuple: The arguments of print_game_screen
+        """
+
+        # Fainted Pokemon can have negative hp, the screen only shows down to 0
+        return (poke1.get_poke_name(), poke2.get_poke_name(), max(poke1.get_hp(), 0), poke1.max_hp, max(poke2.get_hp(), 0),
+                poke2.max_hp, poke1.get_level(), poke2.get_level(), poke1.get_status(), poke2.get_status(), len(team1.team_adt), len(team2.team_adt))
 
     def battle(self, team1: PokeTeam, team2: PokeTeam) -> int:
         """
@@ -60,18 +288,98 @@ class Battle:
             Worst case O(n * comp(==)) Where n is the number of actions which are called
         """
 
+        self.turns = 0
+        self.last_frame = None
+        if self.replay is not None:
+            self.replay.start_battle(team1, team2)
+        if self.metrics is not None:
+            result = self.metered_battle(team1, team2)
+        else:
+            result = self.play_turns(team1, team2)
+            # The final frame is drawn once the result is known
+            if self.render_policy == RenderPolicy.FINAL_FRAME and self.last_frame is not None:
+                self.renderer(*self.last_frame)
+        if self.replay is not None:
+            self.replay.end_battle(result, self.turns, team1, team2)
+        return result
+
+    def metered_battle(self, team1: PokeTeam, team2: PokeTeam) -> int:
+        """
+
+        This method plays a battle as the battle method does, recording its timings and counts in metrics
+
+        Paramters:
+            team1 (PokeTeam): A PokeTeam object representing one of the teams battling
+            team2 (PokeTeam): A PokeTeam object representing another team that is battling
+
+        Returns:
+            integer (int): 1 if team1 has won the battle, 2 for team2 and 0 for a draw
+        """
+
+        metrics = self.metrics
+        renderer = self.renderer
+
+        def metered_renderer(*args):
+            start = perf_counter()
+            renderer(*args)
+            metrics.add_time('render', perf_counter() - start)
+
+        metrics.start_battle()
+        start = perf_counter()
+        self.renderer = metered_renderer
+        try:
+            team1 = MeteredTeam(team1, metrics)
+            team2 = MeteredTeam(team2, metrics)
+            result = self.play_turns(team1, team2)
+            if self.render_policy == RenderPolicy.FINAL_FRAME and self.last_frame is not None:
+                self.renderer(*self.last_frame)
+        finally:
+            self.renderer = renderer
+        metrics.end_battle(result, self.turns, perf_counter() - start)
+        return result
+
+    def play_turns(self, team1: PokeTeam, team2: PokeTeam) -> int:
+        """
+
+        This method runs the turns of a battle, drawing the screen as per the rendering policy
+
+        Paramters:
+            team1 (PokeTeam): A PokeTeam object representing one of the teams battling
+            team2 (PokeTeam): A PokeTeam object representing another team that is battling
+
+        Returns:
+            integer (int): 1 if team1 has won the battle, 2 for team2 and 0 for a draw
+
+        Complexity analysis:
+            Best case O(m * comp(==)) Where m is the number of pokemon in the smallest team
+            Worst case O(n * comp(==)) Where n is the number of actions which are called
+        """
+
+        # Headless battles only pay for these two checks each turn, no formatting or printing
+        render_every = self.render_every
+        keep_final = self.render_policy == RenderPolicy.FINAL_FRAME
+        random_gen = self.random_gen
+        # Only faints and evolutions are counted here, every other measure is taken around the calls to the teams
+        metrics = self.metrics
+        replay = self.replay
         # retrieving the first Pokemon from team1's PokeTeam as per the Team battlemode's rules
         poke1 = team1.retrieve_pokemon()
         # retrieving the first Pokemon from team2's PokeTeam as per the Team battlemode's rules
         poke2 = team2.retrieve_pokemon()
         # Running a loop for as long as the Pokemon are not a NoneType (Meaning they are not fainted)
         while poke1 != None and poke2 != None:
-            print_game_screen(poke1.get_poke_name(), poke2.get_poke_name(), poke1.get_hp(), poke1.max_hp, poke2.get_hp(
-            ), poke2.max_hp, poke1.get_level(), poke2.get_level(), poke1.get_status(), poke2.get_status(), len(team1.team_adt), len(team2.team_adt))
+            self.turns += 1
+            if render_every and (self.turns - 1) % render_every == 0:
+                self.render(poke1, poke2, team1, team2)
+            elif keep_final:
+                # The frame is captured now, the Pokemon keep changing until the battle ends
+                self.last_frame = self.frame(poke1, poke2, team1, team2)
             # Returns Action object -> This is team 1's pokemon action
-            action1 = team1.choose_battle_option(poke1, poke2)
+            action1 = team1.choose_battle_option(poke1, poke2, random_gen)
             # Returns Action object -> This is team 2's pokemon action
-            action2 = team2.choose_battle_option(poke2, poke1)
+            action2 = team2.choose_battle_option(poke2, poke1, random_gen)
+            if replay is not None:
+                replay.write_turn(self.turns, poke1, poke2, action1, action2, team1, team2)
             # If team1's action is none (either all pokemon have fainted or have tried to heal more than 3 times) team 2 wins
             if action1 == None:
                 return 2
@@ -136,17 +444,17 @@ class Battle:
                 # If Team 2 has chosen to attack and its current pokemon's speed exceeds the other team's current Pokemon
                 if t2_attacked and poke2.get_speed() > poke1.get_speed():
                     # Team 2's current Pokemon attacks Team 1's current Pokemon
-                    poke2.attack(poke1)
+                    poke2.attack(poke1, random_gen)
                 if t1_attacked and not poke1.is_fainted():  # If Team 1 has chosen to Attack and Team 1 is not fainted
                     # Team 1's current Pokemon attacks Team 2's current Pokemon
-                    poke1.attack(poke2)
+                    poke1.attack(poke2, random_gen)
                 # If Team 2 has chosen to attack and Team 2's current Pokemon's speed is less than Team 1's Current Pokemon's speed and Team 2's Current Pokemon is not fainted
                 if t2_attacked and poke2.get_speed() < poke1.get_speed() and not poke2.is_fainted():
                     # Team 2's current Pokemon attacks Team 1's current Pokemon
-                    poke2.attack(poke1)
+                    poke2.attack(poke1, random_gen)
                 if t2_attacked and poke2.get_speed() == poke1.get_speed():  # If team 2 has chosen to attack and team 2
                     # Team 2's current Pokemon attacks Team 1's current Pokemon
-                    poke2.attack(poke1)
+                    poke2.attack(poke1, random_gen)
 
             if (not poke1.is_fainted()) and (not poke2.is_fainted()):  # This if they've both not fainted
                 poke1.lose_hp(1)  # Team 1's Current Pokemon loses 1 hp
@@ -155,16 +463,18 @@ class Battle:
             # If gastly, turn it into a haunter
             # If Team1's current Pokemon is a Gastly and it is not fainted
             if poke1.name == 'Gastly' and not poke1.is_fainted():
-                poke1 = poke1.check_evolution()  # Evolving the Gastly to a Haunter
+                poke1 = self.evolve(poke1)  # Evolving the Gastly to a Haunter
             # If Team2's current Pokemon is a Gastly and it is not fainted
             if poke2.name == 'Gastly' and not poke2.is_fainted():
-                poke2 = poke2.check_evolution()  # Evolving the Gastly to a Haunter
+                poke2 = self.evolve(poke2)  # Evolving the Gastly to a Haunter
 
             # If Team1's current pokemon is fainted while Team 2's current Pokemon is not fainted
             if (poke1.is_fainted()) and (not poke2.is_fainted()):
+                if metrics is not None:
+                    metrics.count('faints')
                 poke2.level_up()  # Levelling up team 2's current Pokemon
                 # Now check if poke2 can and should evolve, make it evolve
-                poke2 = poke2.check_evolution()
+                poke2 = self.evolve(poke2)
                 # Fainted Pokemon are returned -> Won't actually return
                 # returning Team 1's current Pokemon
                 team1.return_pokemon(poke1)
@@ -175,9 +485,11 @@ class Battle:
                     poke1 = team1.retrieve_pokemon()
             # If Team2's current pokemon is fainted while Team 1's current Pokemon is not fainted
             elif (not poke1.is_fainted()) and (poke2.is_fainted()):
+                if metrics is not None:
+                    metrics.count('faints')
                 poke1.level_up()  # Levelling up Team 1's current Pokemon
                 # Now check if poke1 can and should evolve, make it evolve
-                poke1 = poke1.check_evolution()
+                poke1 = self.evolve(poke1)
                 # Fainted Pokemon are returned
                 team2.return_pokemon(poke2)
                 if team2.is_empty():  # If Team 2's entire team is fainted
@@ -187,6 +499,8 @@ class Battle:
                     poke2 = team2.retrieve_pokemon()
             # Otherwise if both Team 1 and Team 2's current pokemon are fainted
             elif (poke1.is_fainted()) and (poke2.is_fainted()):
+                if metrics is not None:
+                    metrics.count('faints', 2)
                 # Simply don't return either pokemon
                 # If the length of the team 1's adt is equal to 0, meaning every Pokemon in the team is fainted
                 if len(team1.team_adt) == 0:
@@ -215,9 +529,78 @@ class Battle:
                 # If both teams are empty, no need to return anything as it won't actually return any pokemon
                 return 0
 
+    def evolve(self, poke: PokemonBase) -> PokemonBase:
+        """
+
+        This method evolves a Pokemon if it can and should evolve, counting the evolution in metrics
+
+        Parameters:
+            poke (PokemonBase): The Pokemon on the field
+
+        Returns:
+            PokemonBase: The evolved Pokemon, or poke itself
+        """
+
+        evolved = poke.check_evolution()
+        if evolved is not poke and self.metrics is not None:
+            self.metrics.count('evolutions')
+        return evolved
+
+
+class TestBattle(unittest.TestCase):
+    """ Tests the frames each rendering policy draws, and the metrics of metered battles, under the same seeds. """
+    SEEDS = range(20)
+
+    @staticmethod
+    def seeded_battle(seed: int, **kwargs) -> tuple[Battle, list[tuple], int]:
+        """ Plays a seeded battle with a recording renderer, returns the battle, the frames it drew and its result """
+        random_gen = RandomGen(seed)
+        battle_mode = seed % 3
+        team1 = PokeTeam.random_team('A', battle_mode, criterion=Criterion.HP, random_gen=random_gen)
+        team2 = PokeTeam.random_team('B', battle_mode, criterion=Criterion.LV, random_gen=random_gen)
+        frames = []
+        battle = Battle(renderer=lambda *frame: frames.append(frame), random_gen=random_gen, **kwargs)
+        return battle, frames, battle.battle(team1, team2)
+
+    def test_final_frame(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                _, full, res = self.seeded_battle(seed, verbosity=RenderPolicy.FULL)
+                _, final, final_res = self.seeded_battle(seed, verbosity=RenderPolicy.FINAL_FRAME)
+                self.assertEqual(final_res, res)
+                self.assertEqual(final, full[-1:])
+
+    def test_out_of_range_verbosity(self):
+        for seed in self.SEEDS:
+            _, full, res = self.seeded_battle(seed, verbosity=RenderPolicy.FULL)
+            for verbosity in (-1, 4, 7):
+                with self.subTest(seed=seed, verbosity=verbosity):
+                    battle, frames, other_res = self.seeded_battle(seed, verbosity=verbosity)
+                    self.assertEqual(battle.render_policy, RenderPolicy.FULL)
+                    self.assertEqual((frames, other_res), (full, res))
+
+    def test_metrics(self):
+        sink = io.StringIO()
+        metrics = BattleMetrics(sink)
+        battle, _, res = self.seeded_battle(2, metrics=metrics)
+        self.assertEqual((res, battle.turns), (2, 29))
+        self.assertEqual(metrics.as_dict()['counters'],
+                         {'battles': 1, 'turns': 29, 'attacks': 20, 'swaps': 13, 'specials': 19, 'heals': 6, 'evolutions': 3,
+                          'faints': 6, 'resorts': 52, 'team1_wins': 0, 'team2_wins': 1, 'draws': 0})
+        self.assertEqual(json.loads(sink.getvalue())['counters'], metrics.as_dict()['counters'])
+
+    def test_metrics_leave_battles_unchanged(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                plain, plain_frames, plain_res = self.seeded_battle(seed, verbosity=RenderPolicy.FULL)
+                metrics = BattleMetrics()
+                metered, metered_frames, metered_res = self.seeded_battle(seed, verbosity=RenderPolicy.FULL, metrics=metrics)
+                self.assertEqual((metered_res, metered.turns, metered_frames), (plain_res, plain.turns, plain_frames))
+                self.assertEqual(metrics.counters['turns'], plain.turns)
+
 
 if __name__ == '__main__':
-    b = Battle()
+    b = Battle(verbosity=RenderPolicy.FULL)
     team1 = PokeTeam.random_team('Chen', 0, 6, ai_mode=PokeTeam.AI.RANDOM)
     team2 = PokeTeam.random_team('Chen', 1, 6, ai_mode=PokeTeam.AI.RANDOM)
     res = b.battle(team1, team2)
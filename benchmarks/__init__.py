@@ -0,0 +1,10 @@
+"""
+Throughput benchmarks for the battle simulator.
+
+Each bench_* module is a standalone script, run from the repository root, e.g.
+    python -m benchmarks.bench_rendering
+
+test_hot_paths.py is a pytest-benchmark suite tracking the hot paths against saved
+baselines, run with
+    python -m benchmarks
+"""
@@ -0,0 +1,62 @@
+"""
+Runs the pytest-benchmark suite, saving a baseline or comparing against the latest one.
+
+Baselines are kept per machine under benchmarks/.baselines, as pytest-benchmark stores them.
+
+Usage:
+    python -m benchmarks --save [name]     # record a baseline
+    python -m benchmarks [--threshold 15]  # fail if a benchmark is more than 15% slower than the latest baseline
+
+Runs are compared by their fastest round, the statistic least affected by other load on the machine.
+Every benchmark is warmed up first and timed over at least MIN_ROUNDS rounds with the garbage collector
+off, so that an unchanged run does not fail the comparison by chance.
+"""
+
+import argparse
+import os
+import sys
+
+import pytest
+from pytest_benchmark.session import PerformanceRegression
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_DIR = os.path.join(BENCHMARKS_DIR, ".baselines")
+DEFAULT_THRESHOLD = 15
+MIN_ROUNDS = 50
+# Smallest time a timed round may take, in seconds, short benchmarks are repeated within a round to reach it
+MIN_TIME = 0.0005
+
+
+def has_baseline() -> bool:
+    """ Whether any baseline has been saved, for any machine. """
+    for _, _, files in os.walk(BASELINES_DIR):
+        if any(name.endswith(".json") for name in files):
+            return True
+    return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--save", nargs="?", const="baseline", metavar="NAME", help="save the run as a baseline")
+    parser.add_argument("--threshold", type=int, default=DEFAULT_THRESHOLD,
+                        help="slowdown of the fastest round, in percent, that fails the comparison (default %(default)s)")
+    args, pytest_args = parser.parse_known_args(argv)
+
+    options = [BENCHMARKS_DIR, "-q", "--benchmark-only", f"--benchmark-storage=file://{BASELINES_DIR}",
+               "--benchmark-columns=min,median,mean,stddev,rounds", "--benchmark-warmup=on",
+               "--benchmark-disable-gc", f"--benchmark-min-rounds={MIN_ROUNDS}", f"--benchmark-min-time={MIN_TIME}"]
+    if args.save:
+        options.append(f"--benchmark-save={args.save}")
+    elif has_baseline():
+        options += ["--benchmark-compare", f"--benchmark-compare-fail=min:{args.threshold}%"]
+    else:
+        print("No baseline saved yet, run with --save to record one", file=sys.stderr)
+    try:
+        return pytest.main(options + pytest_args)
+    except PerformanceRegression:
+        # pytest-benchmark has already listed the benchmarks that regressed
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""
+End-to-end throughput of the leaderboard: the leaderboard team against random
+opponents, each generated and battled on its own substream, so every run plays
+exactly the same battles.
+
+"serial" plays every opponent in this process, "parallel" shards them over a
+process pool of os.cpu_count() workers.
+
+Usage:
+    python -m benchmarks.bench_leaderboard [opponents]
+"""
+
+import os
+import sys
+import time
+
+from leaderboard import run_leaderboard
+from poke_team import PokeTeam
+
+DEFAULT_OPPONENTS = 5000
+
+
+def time_leaderboard(n: int, workers: int) -> tuple[float, dict]:
+    """ Returns (opponents per second, leaderboard stats). """
+    start = time.perf_counter()
+    stats = run_leaderboard(PokeTeam.LEADERBOARD_SPEC, n, workers)
+    return n / (time.perf_counter() - start), stats
+
+
+def main(n: int = DEFAULT_OPPONENTS) -> None:
+    for name, workers in (("serial", 1), ("parallel", os.cpu_count() or 1)):
+        rate, stats = time_leaderboard(n, workers)
+        print(f"{name:>8}: {rate:10.1f} opponents/sec with {workers} workers, "
+              f"won {stats['won']} lost {stats['lost']} drew {stats['draws']} streak {stats['longest_streak']}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPPONENTS)
@@ -0,0 +1,33 @@
+"""
+PokeTeam.random_team throughput for each battle mode.
+
+Usage:
+    python -m benchmarks.bench_random_team [teams]
+"""
+
+import sys
+import time
+
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+
+SEED = 2022
+DEFAULT_TEAMS = 20000
+
+
+def time_mode(battle_mode: int, n: int) -> float:
+    """ Returns random teams per second for one battle mode. """
+    gen = RandomGen(SEED)
+    start = time.perf_counter()
+    for i in range(n):
+        PokeTeam.random_team("T", battle_mode, criterion=Criterion.HP, random_gen=gen)
+    return n / (time.perf_counter() - start)
+
+
+def main(n: int = DEFAULT_TEAMS) -> None:
+    for battle_mode in range(3):
+        print(f"mode {battle_mode}: {time_mode(battle_mode, n):10.1f} teams/sec")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TEAMS)
@@ -0,0 +1,63 @@
+"""
+Battles per second for each Battle rendering policy.
+
+Usage:
+    python -m benchmarks.bench_rendering [battles]
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+from battle import Battle, RenderPolicy
+from poke_team import PokeTeam, Criterion
+from print_screen import DiffRenderer
+from random_gen import RandomGen
+
+SEED = 2022
+DEFAULT_BATTLES = 300
+
+
+def make_teams(n: int) -> list[tuple[PokeTeam, PokeTeam]]:
+    """ Builds n pairs of random teams from a fixed seed. """
+    RandomGen.set_seed(SEED)
+    return [(PokeTeam.random_team(f"A{i}", i % 3, ai_mode=PokeTeam.AI.ALWAYS_ATTACK, criterion=Criterion.HP),
+             PokeTeam.random_team(f"B{i}", (i + 1) % 3, ai_mode=PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=Criterion.SPD))
+            for i in range(n)]
+
+
+def run_policy(battle: Battle, pairs: list[tuple[PokeTeam, PokeTeam]]) -> float:
+    """ Plays every pair once and returns battles per second. Frames are written to os.devnull. """
+    RandomGen.set_seed(SEED)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for team1, team2 in pairs:
+            team1.regenerate_team()
+            team2.regenerate_team()
+            battle.battle(team1, team2)
+        elapsed = time.perf_counter() - start
+    return len(pairs) / elapsed
+
+
+def main(n: int = DEFAULT_BATTLES) -> None:
+    pairs = make_teams(n)
+    policies = [
+        ("headless", Battle(RenderPolicy.HEADLESS)),
+        ("final frame", Battle(RenderPolicy.FINAL_FRAME)),
+        ("every 5 turns", Battle(RenderPolicy.EVERY_N_TURNS, render_every=5)),
+        ("full", Battle(RenderPolicy.FULL)),
+        ("full, diffed", Battle(RenderPolicy.FULL, renderer=DiffRenderer().print_game_screen)),
+    ]
+    for name, battle in policies:
+        try:
+            rate = run_policy(battle, pairs)
+        except FileNotFoundError as e:
+            # Sprites are read from pokemon_printing/ relative to the working directory
+            print(f"{name:>14}: skipped ({e.filename} not found)")
+        else:
+            print(f"{name:>14}: {rate:10.1f} battles/sec")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATTLES)
@@ -0,0 +1,66 @@
+"""
+Cost of the battle mode 2 swap/return path.
+
+"return/retrieve" cycles a full team's Pokemon out and back in, "special"
+flips the team order, and "battles" plays SWAP_ON_SUPER_EFFECTIVE mode 2
+teams against each other, the AI that returns a Pokemon most often.
+
+Usage:
+    python -m benchmarks.bench_sorted_team [battles]
+"""
+
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+
+SEED = 2022
+DEFAULT_BATTLES = 3000
+
+
+def mode_2_team(name: str, criterion: Criterion, random_gen: RandomGen) -> PokeTeam:
+    return PokeTeam.random_team(name, 2, team_size=6, ai_mode=PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE,
+                                criterion=criterion, random_gen=random_gen)
+
+
+def time_cycles(n: int) -> float:
+    """ Returns return_pokemon + retrieve_pokemon pairs per second. """
+    team = mode_2_team("A", Criterion.SPD, RandomGen(SEED))
+    start = time.perf_counter()
+    for _ in range(n):
+        team.return_pokemon(team.retrieve_pokemon())
+    return n / (time.perf_counter() - start)
+
+
+def time_special(n: int) -> float:
+    """ Returns special() calls per second on a team of 6. """
+    team = mode_2_team("A", Criterion.HP, RandomGen(SEED))
+    start = time.perf_counter()
+    for _ in range(n):
+        team.special()
+    return n / (time.perf_counter() - start)
+
+
+def time_battles(n: int) -> float:
+    """ Returns mode 2 battles per second. """
+    gen = RandomGen(SEED)
+    criteria = list(Criterion)
+    pairs = [(mode_2_team(f"A{i}", criteria[i % 4], gen), mode_2_team(f"B{i}", criteria[(i + 1) % 4], gen))
+             for i in range(n)]
+    battle = Battle(random_gen=gen)
+    start = time.perf_counter()
+    for team1, team2 in pairs:
+        battle.battle(team1, team2)
+    return n / (time.perf_counter() - start)
+
+
+def main(n: int = DEFAULT_BATTLES) -> None:
+    print(f"return/retrieve: {time_cycles(n * 20):10.1f} cycles/sec")
+    print(f"        special: {time_special(n * 5):10.1f} calls/sec")
+    print(f"        battles: {time_battles(n):10.1f} battles/sec")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATTLES)
@@ -0,0 +1,74 @@
+"""
+Cost of building teams: teams per second and bytes allocated per team.
+
+"eager" also builds every member's chain of evolved forms, as the Pokemon
+constructors did before evolution was resolved through the species registry,
+so the two rows compare team creation before and after.
+
+Usage:
+    python -m benchmarks.bench_team_creation [teams]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from poke_team import PokeTeam, Criterion
+from pokemon import Charmander, Bulbasaur, Squirtle, Gastly, Eevee
+from pokemon_base import PokemonBase
+from random_gen import RandomGen
+
+SEED = 2022
+DEFAULT_TEAMS = 20000
+# Species created for each index of team_numbers
+BASE_SPECIES = [Charmander, Bulbasaur, Squirtle, Gastly, Eevee]
+
+
+def eager_evolutions(team: PokeTeam) -> list[PokemonBase]:
+    """ Builds the evolved forms the old constructors built for every member of the team. """
+    built = []
+    for base, count in zip(BASE_SPECIES, team.team_numbers):
+        for _ in range(count):
+            species = base
+            while species.EVOLVES_INTO is not None:
+                species = PokemonBase.SPECIES[species.EVOLVES_INTO]
+                built.append(species())
+    return built
+
+
+def build_teams(n: int, eager: bool) -> list:
+    """ Creates n random teams over all battle modes, then regenerates each once. """
+    gen = RandomGen(SEED)
+    teams = []
+    for i in range(n):
+        team = PokeTeam.random_team(f"T{i}", i % 3, criterion=Criterion.HP, random_gen=gen)
+        team.regenerate_team()
+        if eager:
+            # Once for the replaced team, once for the team that is kept
+            eager_evolutions(team)
+            teams.append((team, eager_evolutions(team)))
+        else:
+            teams.append(team)
+    return teams
+
+
+def measure(n: int, eager: bool) -> tuple[float, float]:
+    """ Returns (teams per second, bytes still allocated per team). """
+    start = time.perf_counter()
+    build_teams(n, eager)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    teams = build_teams(n // 10 or 1, eager)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n / elapsed, size / len(teams)
+
+
+def main(n: int = DEFAULT_TEAMS) -> None:
+    for name, eager in (("eager", True), ("lazy", False)):
+        rate, size = measure(n, eager)
+        print(f"{name:>6}: {rate:10.1f} teams/sec {size:10.1f} bytes/team")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TEAMS)
@@ -0,0 +1,67 @@
+"""
+Tournament cost as the number of players grows.
+
+"schedule" replaces battles with a fixed result, isolating the cost of
+finding and recording each match; "battles" plays every match. Brackets are
+balanced, or a "chain" of every player followed by every '+', which puts
+the first match at the end of the string.
+
+Usage:
+    python -m benchmarks.bench_tournament [players]
+"""
+
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam
+from random_gen import RandomGen
+from tournament import Tournament
+
+SEED = 2022
+DEFAULT_PLAYERS = 16384
+
+
+class FirstPlayerWins(Battle):
+    """ A battle that skips the fight, player 1 always wins. """
+
+    def battle(self, team1: PokeTeam, team2: PokeTeam) -> int:
+        return 1
+
+
+def tournament_str(players: int, chain: bool = False) -> str:
+    """ A balanced (or chain) bracket over the given number of players, in postfix form. """
+    if chain:
+        return " ".join([f"p{i}" for i in range(players)] + ["+"] * (players - 1))
+    def bracket(lo: int, hi: int) -> list[str]:
+        if hi - lo == 1:
+            return [f"p{lo}"]
+        mid = (lo + hi) // 2
+        return bracket(lo, mid) + bracket(mid, hi) + ["+"]
+    return " ".join(bracket(0, players))
+
+
+def time_tournament(players: int, battle: Battle, chain: bool = False) -> tuple[float, float]:
+    """ Returns (seconds to start, seconds to play every match). """
+    tournament = Tournament(battle, random_gen=RandomGen(SEED))
+    tournament.set_battle_mode(1)
+    text = tournament_str(players, chain)
+    start = time.perf_counter()
+    tournament.start_tournament(text)
+    started = time.perf_counter()
+    tournament.linked_list_of_games()
+    return started - start, time.perf_counter() - started
+
+
+def main(players: int = DEFAULT_PLAYERS) -> None:
+    sys.setrecursionlimit(max(1000, 4 * players.bit_length()))
+    runs = (("schedule", FirstPlayerWins(), False), ("chain", FirstPlayerWins(), True),
+            ("battles", Battle(random_gen=RandomGen(SEED)), False))
+    for name, battle, chain in runs:
+        start, play = time_tournament(players, battle, chain)
+        print(f"{name:>8}: {players} players, start {start:8.3f}s, {players - 1} matches {play:8.3f}s"
+              f" ({(players - 1) / play:10.1f} matches/sec)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PLAYERS)
@@ -0,0 +1,132 @@
+"""
+pytest-benchmark suite over the simulator's hot paths, every input drawn from fixed seeds.
+
+Run it, save a baseline and compare against it with the runner:
+    python -m benchmarks --save        # record a baseline for this machine
+    python -m benchmarks               # fail if any fastest round is more than 15% slower than the latest baseline
+or directly, e.g.
+    python -m pytest benchmarks --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from pokemon import Charmander, Bulbasaur, Squirtle, Gengar, Eevee
+from random_gen import RandomGen
+from tournament import Tournament
+from tower import BattleTower
+
+SEED = 2022
+# Untimed rounds before the timed ones of the benchmarks that set their own rounds
+WARMUP_ROUNDS = 3
+# Random numbers drawn per benchmark call
+DRAWS = 1000
+TEAM_NUMBERS = [2, 1, 1, 1, 1]
+PLAYERS = 64
+TOWER_TEAMS = 10
+
+
+def balanced_tournament(players: int) -> str:
+    """ A balanced bracket over the given number of players, in postfix form. """
+    names = [f"p{i}" for i in range(players)]
+    while len(names) > 1:
+        names = [f"{names[i]} {names[i + 1]} +" for i in range(0, len(names), 2)]
+    return names[0]
+
+
+def test_random(benchmark):
+    random_gen = RandomGen(SEED)
+
+    def draw():
+        for _ in range(DRAWS):
+            random_gen.random()
+    benchmark(draw)
+
+
+def test_randint(benchmark):
+    random_gen = RandomGen(SEED)
+
+    def draw():
+        for _ in range(DRAWS):
+            random_gen.randint(1, 100)
+    benchmark(draw)
+
+
+def test_attack_defend(benchmark):
+    random_gen = RandomGen(SEED)
+    pairs = [(species_1(), species_2()) for species_1, species_2 in
+             ((Charmander, Bulbasaur), (Squirtle, Charmander), (Gengar, Eevee), (Eevee, Squirtle))]
+
+    def exchange():
+        for poke_1, poke_2 in pairs:
+            poke_1.reset()
+            poke_2.reset()
+            poke_1.attack(poke_2, random_gen)
+            poke_2.attack(poke_1, random_gen)
+    benchmark(exchange)
+
+
+@pytest.mark.parametrize("battle_mode", [0, 1, 2])
+def test_create_team(benchmark, battle_mode):
+    criterion = Criterion.HP if battle_mode == 2 else None
+    benchmark(PokeTeam, "A", list(TEAM_NUMBERS), battle_mode, PokeTeam.AI.ALWAYS_ATTACK, criterion)
+
+
+def test_tie_breaker_order(benchmark):
+    team = PokeTeam("A", [1, 1, 1, 2, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, Criterion.LV)
+    benchmark(team.tie_breaker_order)
+
+
+@pytest.mark.parametrize("battle_mode", [0, 1, 2])
+def test_battle(benchmark, battle_mode):
+    random_gen = RandomGen(SEED)
+    criterion = Criterion.SPD if battle_mode == 2 else None
+    teams = [(PokeTeam.random_team(f"A{i}", battle_mode, ai_mode=PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=criterion, random_gen=random_gen),
+              PokeTeam.random_team(f"B{i}", battle_mode, ai_mode=PokeTeam.AI.RANDOM, criterion=criterion, random_gen=random_gen))
+             for i in range(20)]
+    battle = Battle()
+
+    def setup():
+        # Every round plays the same battles on the same stream
+        battle.random_gen = RandomGen(SEED)
+        for team_1, team_2 in teams:
+            team_1.regenerate_team()
+            team_2.regenerate_team()
+            team_1.num_heals = team_2.num_heals = 0
+
+    def play():
+        for team_1, team_2 in teams:
+            battle.battle(team_1, team_2)
+    benchmark.pedantic(play, setup=setup, rounds=40, warmup_rounds=WARMUP_ROUNDS)
+
+
+def test_advance_tournament(benchmark):
+    text = balanced_tournament(PLAYERS)
+
+    def setup():
+        tournament = Tournament(random_gen=RandomGen(SEED))
+        tournament.set_battle_mode(1)
+        tournament.start_tournament(text)
+        return (tournament,), {}
+
+    def play(tournament):
+        while tournament.advance_tournament() is not None:
+            pass
+    benchmark.pedantic(play, setup=setup, rounds=30, warmup_rounds=WARMUP_ROUNDS)
+
+
+def test_battle_tower_iterator(benchmark):
+    def setup():
+        random_gen = RandomGen(SEED)
+        tower = BattleTower(random_gen=random_gen)
+        tower.set_my_team(PokeTeam.random_team("Me", 2, team_size=6, criterion=Criterion.HP, random_gen=random_gen))
+        tower.generate_teams(TOWER_TEAMS)
+        return (tower,), {}
+
+    def play(tower):
+        for _ in tower:
+            pass
+    benchmark.pedantic(play, setup=setup, rounds=60, warmup_rounds=WARMUP_ROUNDS)
@@ -1,50 +1,242 @@
 """
 Run leaderboard matches against the leaderboard team.
+
+Every opponent is independent of the others: opponent i is generated, and its battle
+played, on substream i of the leaderboard seed's RandomGen stream, against the
+leaderboard team restored to its initial state. The opponents are sharded over a
+process pool, and the shard results are merged in opponent order, so the percentages
+and the longest streak are identical whatever the number of workers or the chunking.
+
+Usage:
+```
+python leaderboard.py [opponents] [workers]
+```
+Also defines UnitTests for merging streaks and for results not depending on the workers, run with
+`python -m unittest leaderboard`.
 """
+from __future__ import annotations
+
+__author__ = "Code by Daniel Liu, Ben Abraham, Johnny Ta, Bangze Han"
+
+import json
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable
 
 from battle import Battle
 from poke_team import PokeTeam, Criterion
 from random_gen import RandomGen
 
+LEADERBOARD_SEED = (1 << 16) + 1029348
+DEFAULT_OPPONENTS = 1000
+# Largest number of opponents handed to a worker at a time, so progress is reported regularly
+MAX_CHUNK_SIZE = 1000
+# Leaderboard teams already built in this process, by their spec, so every chunk a worker plays reuses the team
+CHAMPIONS = {}
 
-def leaderboard():
-    RandomGen.set_seed((1 << 16) + 1029348)
 
-    leaderboard_team = PokeTeam.leaderboard_team()
-    teams = [
-        PokeTeam.random_team(f"Team {x}", RandomGen.randint(
-            0, 2), criterion=Criterion(RandomGen.randint(1, len(Criterion))))
-        for x in range(1000)
-    ]
+def random_opponent(index: int, stream: RandomGen) -> tuple[PokeTeam, RandomGen]:
+    """
+    Generates opponent `index` on its own substream of the stream.
 
-    streak = 0
-    max_streak = 0
-    played = 0
-    won = 0
-    draw = 0
-    loss = 0
-    b = Battle()
-    for team in teams:
-        res = b.battle(leaderboard_team, team)
-        if res == 0:
-            draw += 1
-        elif res == 1:
-            won += 1
+    :returns: (the opponent, its substream, to play its battle on)
+    Complexity: O(T + log index) where T is the cost of random_team
+    """
+    random_gen = stream.substream(index)
+    battle_mode = random_gen.randint(0, 2)
+    criterion = Criterion(random_gen.randint(1, len(Criterion)))
+    return PokeTeam.random_team(f"Team {index}", battle_mode, criterion=criterion, random_gen=random_gen), random_gen
+
+
+def champion_team(champion_spec: dict) -> PokeTeam:
+    """
+    Returns the leaderboard team of the spec, built once per process. The team create_team built is kept as its
+    initial state, so regenerate_team restores it in place between battles instead of creating it again.
+
+    Complexity: O(1) once built, (Complexity of create_team) the first time
+    """
+    key = json.dumps(champion_spec, sort_keys=True, default=str)
+    if key not in CHAMPIONS:
+        CHAMPIONS[key] = PokeTeam.from_spec(champion_spec)
+    return CHAMPIONS[key]
+
+
+def play_opponents(champion_spec: dict, seed: int, start: int, stop: int) -> tuple[list[int], tuple[int, int, int, bool]]:
+    """
+    Plays the leaderboard team against opponents start..stop-1.
+
+    A streak counts the leaderboard team's wins, it is only broken by a loss.
+
+    :returns: ([draws, wins, losses], (wins before the first loss, wins after the last loss, longest streak, whether any battle was lost))
+    Complexity: O((stop - start) * B) where B is the cost of generating and battling an opponent
+    """
+    stream = RandomGen(seed)
+    battle = Battle()
+    champion = champion_team(champion_spec)
+    outcomes = [0, 0, 0]
+    leading = streak = max_streak = 0
+    lost = False
+    for index in range(start, stop):
+        opponent, battle.random_gen = random_opponent(index, stream)
+        champion.regenerate_team()
+        champion.num_heals = 0
+        res = battle.battle(champion, opponent)
+        outcomes[res] += 1
+        if res == 1:
             streak += 1
             max_streak = max(max_streak, streak)
+            if not lost:
+                leading += 1
         elif res == 2:
-            loss += 1
             streak = 0
-        played += 1
-        leaderboard_team.regenerate_team()
+            lost = True
+    return outcomes, (leading, streak, max_streak, lost)
+
+
+def merge_streaks(first: tuple[int, int, int, bool], second: tuple[int, int, int, bool]) -> tuple[int, int, int, bool]:
+    """
+    Combines the streaks of two consecutive runs of opponents, see play_opponents.
+
+    Complexity: O(1)
+    """
+    leading_1, trailing_1, best_1, lost_1 = first
+    leading_2, trailing_2, best_2, lost_2 = second
+    leading = leading_1 if lost_1 else leading_1 + leading_2
+    trailing = trailing_2 if lost_2 else trailing_1 + trailing_2
+    # The longest streak may run across the two
+    best = max(best_1, best_2, trailing_1 + leading_2)
+    return leading, trailing, best, lost_1 or lost_2
+
 
+def run_leaderboard(champion_spec: dict, opponents: int = DEFAULT_OPPONENTS, workers: int | None = None, seed: int = LEADERBOARD_SEED,
+                    chunk_size: int | None = None, progress: Callable[[int, int], None] | None = None) -> dict:
+    """
+    Plays the team given by champion_spec (see PokeTeam.from_spec) against `opponents` random teams.
+
+    :param workers: number of processes, os.cpu_count() when None, 1 plays every battle in this process
+    :param seed: seed of the stream every opponent's substream is split from
+    :param chunk_size: opponents handed to a worker at a time, about 4 chunks per worker (at most MAX_CHUNK_SIZE) when None
+    :param progress: called with (opponents played, opponents) each time a chunk finishes
+    :returns: {"played", "won", "draws", "lost", "longest_streak"} from the leaderboard team's side
+    Complexity: O(n * B / workers) where n is the number of opponents and B is the cost of generating and battling one
+    """
+    if opponents < 0:
+        raise ValueError('opponents must not be negative')
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = min(max(1, -(-opponents // (workers * 4))), MAX_CHUNK_SIZE)
+    bounds = [(start, min(start + chunk_size, opponents)) for start in range(0, opponents, chunk_size)]
+
+    results = [None] * len(bounds)
+    played = 0
+    if workers == 1 or len(bounds) <= 1:
+        for chunk, (start, stop) in enumerate(bounds):
+            results[chunk] = play_opponents(champion_spec, seed, start, stop)
+            played += stop - start
+            if progress is not None:
+                progress(played, opponents)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(play_opponents, champion_spec, seed, start, stop): chunk
+                       for chunk, (start, stop) in enumerate(bounds)}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                results[chunk] = future.result()
+                played += bounds[chunk][1] - bounds[chunk][0]
+                if progress is not None:
+                    progress(played, opponents)
+
+    # Merged in opponent order, the streaks depend on it
+    outcomes = [0, 0, 0]
+    streaks = (0, 0, 0, False)
+    for chunk_outcomes, chunk_streaks in results:
+        for i in range(3):
+            outcomes[i] += chunk_outcomes[i]
+        streaks = merge_streaks(streaks, chunk_streaks)
+    return {
+        "played": opponents,
+        "won": outcomes[1],
+        "draws": outcomes[0],
+        "lost": outcomes[2],
+        "longest_streak": streaks[2],
+    }
+
+
+def leaderboard(opponents: int = DEFAULT_OPPONENTS, workers: int | None = None, progress: Callable[[int, int], None] | None = None):
+    if opponents < 1:
+        raise ValueError('opponents must be at least 1')
+    stats = run_leaderboard(PokeTeam.LEADERBOARD_SPEC, opponents, workers, progress=progress)
+    played = stats["played"]
     return [
-        {"name": "Percentage Won", "value": f"{100*won/played:.2f}%"},
-        {"name": "Percentage Lost", "value": f"{100*loss/played:.2f}%"},
-        {"name": "Percentage Draw", "value": f"{100*draw/played:.2f}%"},
-        {"name": "Longest Streak", "value": f"{max_streak}"},
+        {"name": "Percentage Won", "value": f"{100*stats['won']/played:.2f}%"},
+        {"name": "Percentage Lost", "value": f"{100*stats['lost']/played:.2f}%"},
+        {"name": "Percentage Draw", "value": f"{100*stats['draws']/played:.2f}%"},
+        {"name": "Longest Streak", "value": f"{stats['longest_streak']}"},
     ]
 
 
+def print_progress(played: int, opponents: int) -> None:
+    print(f"\r{played}/{opponents} opponents played", end="" if played < opponents else "\n", file=sys.stderr)
+
+
+class TestLeaderboard(unittest.TestCase):
+    """ Tests merging the streaks of shards, and that the leaderboard does not depend on the number of workers. """
+
+    @staticmethod
+    def streaks(results: list[int]) -> tuple[int, int, int, bool]:
+        """ The streaks of a run of battle results, counted as play_opponents does """
+        leading = streak = best = 0
+        lost = False
+        for res in results:
+            if res == 1:
+                streak += 1
+                best = max(best, streak)
+                if not lost:
+                    leading += 1
+            elif res == 2:
+                streak = 0
+                lost = True
+        return leading, streak, best, lost
+
+    def test_merge_identity(self):
+        empty = (0, 0, 0, False)
+        for streaks in ((3, 1, 4, True), (5, 5, 5, False), empty):
+            self.assertEqual(merge_streaks(empty, streaks), streaks)
+            self.assertEqual(merge_streaks(streaks, empty), streaks)
+
+    def test_merge_all_wins(self):
+        partial = self.streaks([1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1])
+        self.assertEqual(partial, (2, 3, 4, True))
+        self.assertEqual(merge_streaks(partial, (5, 5, 5, False)), (2, 8, 8, True))
+        self.assertEqual(merge_streaks((5, 5, 5, False), partial), (7, 3, 7, True))
+
+    def test_merge_associative(self):
+        random_gen = RandomGen(2022)
+        for _ in range(200):
+            results = [random_gen.randint(0, 2) for _ in range(random_gen.randint(0, 30))]
+            cut1 = random_gen.randint(0, len(results))
+            cut2 = random_gen.randint(cut1, len(results))
+            a, b, c = (self.streaks(part) for part in (results[:cut1], results[cut1:cut2], results[cut2:]))
+            self.assertEqual(merge_streaks(merge_streaks(a, b), c), merge_streaks(a, merge_streaks(b, c)))
+            self.assertEqual(merge_streaks(merge_streaks(a, b), c), self.streaks(results))
+
+    def test_workers(self):
+        self.assertEqual(leaderboard(opponents=50, workers=1), leaderboard(opponents=50, workers=2))
+        # The leaderboard team wins every one of those, a weak team's streaks are broken across the chunks
+        weak = {'team_name': 'Weak', 'team_numbers': [1, 1, 0, 0, 0], 'battle_mode': 0, 'ai_type': 'ALWAYS_ATTACK', 'criterion': None}
+        serial = run_leaderboard(weak, 60, workers=1)
+        self.assertGreater(serial['lost'], 0)
+        for chunk_size in (None, 1, 7):
+            self.assertEqual(run_leaderboard(weak, 60, workers=2, chunk_size=chunk_size), serial)
+
+    def test_no_opponents(self):
+        with self.assertRaises(ValueError):
+            leaderboard(opponents=0)
+
+
 if __name__ == "__main__":
-    print(leaderboard())
+    opponents = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OPPONENTS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    print(leaderboard(opponents, workers, progress=print_progress))
@@ -11,7 +11,9 @@ from array_sorted_list import *
 from random_gen import RandomGen
 from pokemon_base import PokemonBase
 from enum import Enum, auto
+from typing import Iterator
 from queue_adt import CircularQueue
+from bset import BSet
 from pokemon import Charmander, Charizard, Venusaur, Bulbasaur, Blastoise, Squirtle, Gengar, Haunter, Gastly, Eevee
 
 
@@ -54,16 +56,28 @@ class PokeTeam:
         criterion_value (int): An integer that represents the pokemon attribute value
         num_heals (int): An intger that represents the number of heals that the team has used
         num_lives (None): Represents an integer that will be set in Tower 
+        random_gen (RandomGen): The random stream used by the AI, None for the default stream
+        descending (bool): Whether a battle mode 2 team lists the highest criterion value first, flipped by special
+        initial_state (tuple): (battle mode, criterion, team data structure, members) of the team create_team built,
+            members are the Pokemon in retrieval order, (ListItem, key) pairs in battle mode 2
+        poke_teams_beat (BSet): The types of the teams this team has beaten in a tournament, see type_mask
 
     """
 
+    # Weights packing (criterion value, pokedex id, unique id) into the battle mode 2 sort key
+    CRITERION_WEIGHT = 10000
+    ID_WEIGHT = 100
+    # The team every leaderboard opponent battles, see leaderboard_team
+    LEADERBOARD_SPEC = {'team_name': 'Leaderboard Champion', 'team_numbers': [1, 1, 1, 1, 2], 'battle_mode': 2,
+                        'ai_type': 'SWAP_ON_SUPER_EFFECTIVE', 'criterion': 'HP'}
+
     class AI(Enum):
         ALWAYS_ATTACK = auto()
         SWAP_ON_SUPER_EFFECTIVE = auto()
         RANDOM = auto()
         USER_INPUT = auto()
 
-    def __init__(self, team_name: str, team_numbers: list[int], battle_mode: int, ai_type: PokeTeam.AI, criterion=None, criterion_value=None) -> None:
+    def __init__(self, team_name: str, team_numbers: list[int], battle_mode: int, ai_type: PokeTeam.AI, criterion=None, criterion_value=None, random_gen: RandomGen | None = None) -> None:
         """ 
         Initialises the PokeTeam and instance variables
 
@@ -73,6 +87,7 @@ class PokeTeam:
         :ai_type: The ai mode used in battle
         :criterion: A pokemon attribute
         :criterion_value: The pokemon attribute value
+        :random_gen: The random stream used by the AI, None for the default stream
         :return: None
 
 
@@ -106,12 +121,14 @@ class PokeTeam:
         self.ai_type = ai_type
         self.criterion = criterion
         self.criterion_value = criterion_value
+        self.random_gen = random_gen
+        self.descending = True
         # Create local variable so you only need to create stack/queue/sorted list once:
         self.create_team(battle_mode, criterion)
         self.num_heals = 0    # Number of heal actions used.
         self.num_lives = None
-        # Stores poke teams that have been beaten
-        self.poke_teams_beat = None
+        # Stores the types of the poke teams that have been beaten, bit i set for the type at index i of team_numbers
+        self.poke_teams_beat = BSet()
 
     def get_criteria_key(self, criterion: Criterion, poke: PokemonBase) -> int:
         """ Interprets criteria name and returns the appropriate attribute value from the Pokemon
@@ -136,6 +153,22 @@ class PokeTeam:
         else:
             return poke.get_defence()
 
+    def get_sort_key(self, criterion: Criterion, poke: PokemonBase) -> int:
+        """ Composite key of a Pokemon in a battle mode 2 team, packing (criterion value, pokedex id, unique id)
+        into one integer so that ascending keys give the team order: the criterion value descending (ascending after
+        special), ties broken by ascending pokedex id and then ascending unique id
+        :param criterion: the criterion the team is sorted by
+        :param poke: the Pokemon to key
+        :return: the composite key
+
+        Pre-Condition:
+            poke.id < ID_WEIGHT and poke.unique_id < ID_WEIGHT
+        """
+        value = self.get_criteria_key(criterion, poke)
+        if self.descending:
+            value = -value
+        return value * PokeTeam.CRITERION_WEIGHT + poke.id * PokeTeam.ID_WEIGHT + poke.unique_id
+
     def create_team(self, battle_mode: int, criterion: Criterion = None) -> None:
         """
         Creates new random team using team_numbers which is the list
@@ -189,42 +222,31 @@ class PokeTeam:
             self.team_adt = my_team
         # Battle mode 2 uses a SortedList
         else:
-            # Create sorted array for team
+            # Create sorted array for team, a new team lists the highest criterion first
             my_team = ArraySortedList(6)
+            self.descending = True
             # Iterate through team numbers
             for num_poke_index in range(len(self.team_numbers)):
                 poke_counter = 0  # initialise a counter for the number of the same pokemon created
-                # Create another sorted list for tiebreakers
-                if self.team_numbers[num_poke_index] != 0:
-                    poke_specific_sorted_list = ArraySortedList(
-                        self.team_numbers[num_poke_index])  # specific pokemon
-                    # Create pokemon(s) based on the number on the current index
-                    for _ in range(0, self.team_numbers[num_poke_index]):
-                        poke_obj = create_poke(num_poke_index)
-                        # Save counter as unique id, used to keep track of initial ordering
-                        poke_counter += 1
-                        poke_obj.unique_id = poke_counter
-                        # Get sort key
-                        criteria_key = self.get_criteria_key(
-                            criterion, poke_obj)
-                        # Add to tiebreak list
-                        poke_specific_sorted_list.add(
-                            ListItem(poke_obj, criteria_key * - 1+poke_obj.unique_id))
-                    # Iterate again and create pokemon team
-                    for _ in range(self.team_numbers[num_poke_index]):
-                        # Get pokemon from tiebreak list, add to team
-                        poke_specific_sorted_list[len(poke_specific_sorted_list)-1].key -= poke_specific_sorted_list[len(
-                            poke_specific_sorted_list)-1].value.unique_id  # resetting values
-                        item = poke_specific_sorted_list.delete_at_index(
-                            len(poke_specific_sorted_list)-1)
-                        my_team.add(ListItem(item.value, item.key))
-                # Save team and check for tiebreaks if there are any upon creation
-                self.team_adt = my_team
-                self.tie_breaker_order()
+                # Create pokemon(s) based on the number on the current index
+                for _ in range(0, self.team_numbers[num_poke_index]):
+                    poke_obj = create_poke(num_poke_index)
+                    # Save counter as unique id, used to keep track of initial ordering
+                    poke_counter += 1
+                    poke_obj.unique_id = poke_counter
+                    # The composite key already breaks ties, so insertion alone gives the team order
+                    my_team.add(ListItem(poke_obj, self.get_sort_key(criterion, poke_obj)))
+            self.team_adt = my_team
+        # Remember the new team so regenerate_team can put it back in place
+        if battle_mode == 2:
+            members = [(item, item.key) for item in self.team_adt]
+        else:
+            members = list(self.team_adt)
+        self.initial_state = (battle_mode, criterion, self.team_adt, members)
 
     # Thus always call this class method first to create new poketeam, then do p = PokeTeam.random_team() to refer to our new PokeTeam.
     @classmethod
-    def random_team(cls, team_name: str, battle_mode: int, team_size=None, ai_mode=None, **kwargs) -> PokeTeam:
+    def random_team(cls, team_name: str, battle_mode: int, team_size=None, ai_mode=None, random_gen: RandomGen | None = None, **kwargs) -> PokeTeam:
         """ 
         Generates a random team given a team size (3-6 if no team size)
 
@@ -232,49 +254,106 @@ class PokeTeam:
         :param battle_mode: Battle option used in battles
         :param team_size: Size of the team to be created
         :param ai_mode: AI option used in battles
+        :param random_gen: The random stream drawing the team, also used by the team's AI, None for the default stream
         :**kwargs: Used to provide optional keyword arguments like criterion
         :returns: A PokeTeam representing the pokemon team
 
+        """
+        if random_gen is None:
+            random_gen = RandomGen.default
+        team_numbers = cls.random_team_numbers(team_size, random_gen)
+        # Create PokeTeam, its constructor builds the team once
+        if not ai_mode:
+            ai_mode = PokeTeam.AI.RANDOM
+        return cls(team_name, team_numbers, battle_mode, ai_mode,
+                   random_gen=random_gen, **kwargs)
+
+    @staticmethod
+    def random_team_numbers(team_size: int | None, random_gen: RandomGen) -> list[int]:
+        """ 
+        Draws a random team composition, without creating any Pokemon
+
+        :param team_size: Size of the team, drawn from 3-6 if None
+        :param random_gen: The random stream to draw from
+        :returns: The team_numbers of the team
+
+        Complexity analysis:
+        Best/worst case O(1), a constant number of draws and a sort of 6 numbers
         """
         if not team_size:
             # Randomgen.randint is 3-6 inclusive.
-            team_size = RandomGen.randint(3, 6)
-        # Create sorted list,
-        SortedL = ArraySortedList(6)  # assume max size given in spec pg 16
-        # Add 0 and team_size to list
-        # ListItem(value, key), key is the value to be sorted by
-        SortedL.add(ListItem(0, 0))
-        SortedL.add(ListItem(team_size, 6))
-        # Generate 4 random numbers from 0 to team size
-        for i in range(0, 4):
-            num = RandomGen.randint(0, team_size)
-            item = ListItem(num, num)
-            SortedL.add(item)
+            team_size = random_gen.randint(3, 6)
+        # Sort 0, team_size and 4 random numbers from 0 to team size
+        cuts = sorted([0, team_size] + [random_gen.randint(0, team_size) for _ in range(4)])
         # For each adjacent value in the list, their difference specifies how many
         # Charmanders/Bulbasaurs/Squirtles/Gastlys/Eevees should be added to the team
-        l = [0] * 5
-        for i in range(1, len(SortedL)):
-            l[i-1] = SortedL[i].value-SortedL[i-1].value
-        # Create PokeTeam
-        if not ai_mode:
-            ai_mode = PokeTeam.AI.RANDOM
-        new_team = PokeTeam(team_name, l, battle_mode, ai_mode,
-                            **kwargs)
-        if len(kwargs) != 0:
-            # Creating sorted list (as criterion is specified)
-            new_team.create_team(battle_mode, kwargs['criterion'])
-        else:
-            # Creating Queue/Stack (as criterion not specified)
-            new_team.create_team(battle_mode)
-        return new_team
+        return [cuts[i] - cuts[i-1] for i in range(1, len(cuts))]
+
+    @classmethod
+    def from_spec(cls, spec: dict, random_gen: RandomGen | None = None) -> PokeTeam:
+        """ 
+        Creates a team from a team spec, a dictionary of plain values that can be pickled or written as JSON
+
+        :param spec: A dictionary with the keys team_name, team_numbers, battle_mode, ai_type and optionally criterion,
+            ai_type and criterion may be given as enum members or as their names (e.g. "ALWAYS_ATTACK", "HP")
+        :param random_gen: The random stream used by the team's AI, None for the default stream
+        :returns: A PokeTeam representing the pokemon team
+
+        Complexity analysis: (Complexity of create_team)
+        Best case O(n * p) Where n is the length of team_numbers and p is the number of pokemon in the team
+        Worst case O(n * 2p)
+        """
+        ai_type = spec['ai_type']
+        if isinstance(ai_type, str):
+            ai_type = PokeTeam.AI[ai_type]
+        criterion = spec.get('criterion')
+        if isinstance(criterion, str):
+            criterion = Criterion[criterion]
+        return cls(spec['team_name'], list(spec['team_numbers']), spec['battle_mode'], ai_type, criterion, random_gen=random_gen)
+
+    @classmethod
+    def leaderboard_team(cls, random_gen: RandomGen | None = None) -> PokeTeam:
+        """ 
+        Creates the team every leaderboard opponent battles, from LEADERBOARD_SPEC
+
+        :param random_gen: The random stream used by the team's AI, None for the default stream
+        :returns: A PokeTeam representing the leaderboard team
+
+        Complexity analysis: (Complexity of create_team)
+        """
+        return cls.from_spec(cls.LEADERBOARD_SPEC, random_gen)
+
+    def type_mask(self) -> BSet:
+        """ 
+        The types present in the team, as a BSet holding i + 1 for every non-zero team_numbers[i]
+
+        :complexity: Best/worst case O(1), team_numbers has a fixed length of 5
+        """
+        mask = BSet()
+        for i, count in enumerate(self.team_numbers):
+            if count != 0:
+                mask.add(i + 1)
+        return mask
+
+    def to_spec(self) -> dict:
+        """ 
+        The team spec of the team, see from_spec, with the AI type and criterion given by name
+
+        :returns: A dictionary of plain values that can be pickled or written as JSON
+        """
+        return {'team_name': self.team_name,
+                'team_numbers': list(self.team_numbers),
+                'battle_mode': self.battle_mode,
+                'ai_type': self.ai_type.name,
+                'criterion': None if self.criterion is None else self.criterion.name}
 
     def tie_breaker_order(self):
         """ 
-        Method to tiebreak pokemon ordering in battle mode 2
-        This is a bubble sort as we are only comparing adjacent values
+        Method to rebuild the order of a battle mode 2 team from the composite key of every Pokemon.
+        Keys already break ties on insertion, so battles never need this
 
         Complexity analysis:
-            Best/worst case O(n^2) where n is the length of the SortedList
+            Best/worst case O(n^2) where n is the length of the SortedList (n re-insertions)
             :return: None
 
         Pre-Condition:
@@ -283,15 +362,10 @@ class PokeTeam:
         Post-Condition:
             The PokeTeam's ADT is organised as per PokeDex order
         """
-        for _ in range(len(self.team_adt)-1):
-            for i in range(len(self.team_adt)-1):
-                if self.team_adt[i].key == self.team_adt[i+1].key:
-                    # If they have the same key but different id (i.e: Not same type of object -> Like one squirtle, one charmander)
-                    if self.team_adt[i].value.id > self.team_adt[i+1].value.id:
-                        self.team_adt.swap_items(i, i+1)
-                    # If they have the same key and same id (i.e: Same type of object -> Like two charmanders) and not in correct order, change it:
-                    elif self.team_adt[i].value.id == self.team_adt[i+1].value.id and self.team_adt[i].value.unique_id > self.team_adt[i+1].value.unique_id:
-                        self.team_adt.swap_items(i, i+1)
+        items = [self.team_adt.delete_at_index(0) for _ in range(len(self.team_adt))]
+        for item in items:
+            item.key = self.get_sort_key(self.criterion, item.value)
+            self.team_adt.add(item)
 
     def return_pokemon(self, poke: PokemonBase) -> None:
         """ 
@@ -323,23 +397,8 @@ class PokeTeam:
                 self.team_adt.append(poke)
         if self.battle_mode == 2:
             if not poke.is_fainted():
-                # Inserts actual ListItem from original pokemon (poke) -> Where you implement returning of pokemon:
-                # Check if sorted in ascending or descending order
-                if self.team_adt[0].key < 0:
-                    # Add poke to team
-                    added_item = ListItem(
-                        poke, -1 * self.get_criteria_key(self.criterion, poke))
-                    self.team_adt.add(added_item)
-                    # Check for ties
-                    self.tie_breaker_order()
-                # Ascending order
-                else:
-                    # Add poke to team
-                    added_item = ListItem(
-                        poke, self.get_criteria_key(self.criterion, poke))
-                    self.team_adt.add(added_item)
-                    # Check for ties
-                    self.tie_breaker_order()
+                # The composite key puts the pokemon straight into its place, ties included
+                self.team_adt.add(ListItem(poke, self.get_sort_key(self.criterion, poke)))
 
     def retrieve_pokemon(self) -> PokemonBase | None:
         """ 
@@ -375,21 +434,45 @@ class PokeTeam:
 
     def regenerate_team(self) -> None:
         """ 
-        Method to regenerate team to full health
+        Method to regenerate team to full health, by restoring the team create_team built in place:
+        its Pokemon are reset to their base stats and put back in their initial order, without creating any objects
             :return: None
 
-        Complexity analysis: (Complexity of create_team)
-        Best case O(n * p) Where n is the length of team_numbers and p is the number of pokemon in the team
-        Worst case O(n * 2p)
+        Complexity analysis:
+        Best/worst case O(p) where p is the number of pokemon in the team, (Complexity of create_team) if the battle mode or criterion changed
         """
-        self.create_team(self.battle_mode, self.criterion)
-
-    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase) -> Action:
+        battle_mode, criterion, team_adt, members = self.initial_state
+        if battle_mode != self.battle_mode or criterion != self.criterion:
+            self.create_team(self.battle_mode, self.criterion)
+            return
+        # Evolved Pokemon are dropped, the Pokemon they evolved from are reset instead
+        team_adt.clear()
+        if battle_mode == 0:
+            # Push in reverse so the first Pokemon ends on top
+            for poke in reversed(members):
+                poke.reset()
+                team_adt.push(poke)
+        elif battle_mode == 1:
+            for poke in members:
+                poke.reset()
+                team_adt.append(poke)
+        else:
+            self.descending = True
+            # Already in order, so every add lands at the end
+            for item, key in members:
+                item.value.reset()
+                item.key = key
+                team_adt.add(item)
+        # special() in battle mode 2 replaces the sorted list
+        self.team_adt = team_adt
+
+    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase, random_gen: RandomGen | None = None) -> Action:
         """ 
         Handles actions in battle
 
             :param my_pokemon: Pokemon 1 in battle (on friendly side)
             :param their_pokemon: Pokemon 2 in battle (on opposing side)
+            :param random_gen: The random stream of the battle, the team's own stream (or the default stream) is used if None
             :return: An Action representing attack, swap and heal.
 
         Pre-condition: 
@@ -409,17 +492,19 @@ class PokeTeam:
                 return Action(1)
 
         elif self.ai_type.value == 3:  # RANDOM -> Randomly selects an action
+            if random_gen is None:
+                random_gen = RandomGen.default if self.random_gen is None else self.random_gen
             # If used all heals, remove the option
             if self.num_heals == 3:
                 actions = list(Action)
                 actions.remove(Action.HEAL)
                 # Adjust random so it doesnt account for heal option
-                outcome = RandomGen.randint(0, len(actions)-1)
+                outcome = random_gen.randint(0, len(actions)-1)
                 number = actions[outcome]
                 return Action(number)
             # Otherwise just pick random option
             else:
-                number = RandomGen.randint(1, 4)
+                number = random_gen.randint(1, 4)
                 # Increment heal count if it is picked
                 if number == 3:
                     self.num_heals += 1
@@ -445,38 +530,41 @@ class PokeTeam:
             Complexity analysis:
             Best/worst case O(n) where n is the length of the pokemon team data structure
         """
-        returned_str = f"{self.team_name} ({self.battle_mode}): ["
-        if self.battle_mode == 0:
-            # Make a copy of the stack, store length
-            team_adt = self.team_adt
-            n = len(self.team_adt)
-            # Pop each item from stack, add it to string
-            for index in range(n):
-                if index != n - 1:
-                    popped = team_adt.pop()
-                    returned_str += f'{popped.__str__()}, '
-                # Add ending part to string
-                else:
-                    popped = team_adt.pop()
-                    returned_str += f'{popped.__str__()}]'
-            return returned_str
-        elif self.battle_mode == 1:
-            # Make copy of queue, store length
-            team_adt = self.team_adt
-            n = len(self.team_adt)
-            # Serve each item and add returned value into string
-            for index in range(n):
-                if index != n - 1:
-                    served = team_adt.serve()
-                    returned_str += f'{served.__str__()}, '
-                # Add ending part to string
-                else:
-                    served = team_adt.serve()
-                    returned_str += f'{served.__str__()}]'
-            return returned_str
-            # Use method in SortedList
-        elif self.battle_mode == 2:
-            return f"{self.team_name} ({self.battle_mode}): {self.team_adt.__str__()}"
+        # Reads the team in place, the team is left as it was
+        return f"{self.team_name} ({self.battle_mode}): [{', '.join(str(poke) for poke in self)}]"
+
+    def __iter__(self) -> Iterator[PokemonBase]:
+        """ 
+        Iterates over the Pokemon in the team in the order they would be retrieved, without changing the team
+
+            :return: An iterator of the Pokemon in the team
+
+            Complexity analysis:
+            Best/worst case O(1) per Pokemon, O(n) in total where n is the length of the pokemon team data structure
+        """
+        if self.battle_mode == 2:
+            return (item.value for item in self.team_adt)
+        return iter(self.team_adt)
+
+    def __len__(self) -> int:
+        """ 
+        Magic method, the number of Pokemon in the team (not counting a Pokemon on the field)
+
+            :return: The length of the team data structure
+        """
+        return len(self.team_adt)
+
+    def snapshot(self) -> list[PokemonBase]:
+        """ 
+        The Pokemon in the team, in the order they would be retrieved, for logging or inspection mid-battle.
+        The list does not change when the team does, but holds the same Pokemon objects
+
+            :return: A list of the Pokemon in the team
+
+            Complexity analysis:
+            Best/worst case O(n) where n is the length of the pokemon team data structure
+        """
+        return list(self)
 
     def special(self) -> None:
         """ 
@@ -531,13 +619,14 @@ class PokeTeam:
         # Swap sorting order
         else:
             # Create new SortedList and add to it in reversed order
+            self.descending = not self.descending
             new_sorted_lst = ArraySortedList(len(self.team_adt))
             # Iterate through old SortedList
             for i in range(len(self.team_adt)):
                 item = self.team_adt.delete_at_index(0)
-                # Multiply by -1 to invert sorting key so it sorts in reverse order
-                item.key = item.key * -1
+                # Invert the criterion part of the key so it sorts in reverse order, ties keep their order
+                value, tie_break = divmod(item.key, PokeTeam.CRITERION_WEIGHT)
+                item.key = -value * PokeTeam.CRITERION_WEIGHT + tie_break
                 new_sorted_lst.add(item)
-            # Save new list and check for tiebreaks
+            # Save new list
             self.team_adt = new_sorted_lst
-            self.tie_breaker_order()
@@ -1,13 +1,14 @@
 from __future__ import annotations
 """
 
-This file demonstrates the implementation of the PokemonBase class, effectively giving the basic properties and general capabilities shared between all Pokemon
+This file demonstrates the implementation of the PokemonBase class, effectively giving the basic properties and general capabilities shared between all Pokemon,
+and of the Species class holding the constants of a species
 
 September 2022
 """
 
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from random_gen import RandomGen
 
 
@@ -21,19 +22,120 @@ All methods have a best/worst case time complexity O(1), constant time.
 """
 
 
+class Species:
+    """
+
+    One row of the species table: the constants shared by every Pokemon of a species (a flyweight)
+
+    Instance Attributes:
+        name (str): The species name
+        id (int): The ID of the species referring to its Pokedex order
+        poke_type (str): The type of the species (Fire or Water etc)
+        type_code (int): The integer code of poke_type, see PokemonBase.TYPE_CODES
+        level, hp, attack_damage, speed, defence (int): The stats of a newly created Pokemon of this species
+        hp_growth, attack_growth, defence_growth, speed_growth (tuple): (base, multiplier, divisor) giving the stat after a level up
+            as base + (multiplier * level) // divisor, None if the stat does not grow
+        defend_rule (tuple): (threshold multiplier, threshold offset, above, below multiplier, below divisor), a Pokemon loses
+            damage * above when damage > threshold multiplier * defence + threshold offset, otherwise (damage * below multiplier) // below divisor
+        evolves_into (str): Name of the species it evolves into, None if it does not evolve
+        evolution_level (int): The level at which it evolves, None if it does not evolve
+    """
+
+    __slots__ = ('name', 'id', 'poke_type', 'type_code', 'level', 'hp', 'attack_damage', 'speed', 'defence',
+                 'hp_growth', 'attack_growth', 'defence_growth', 'speed_growth', 'defend_rule',
+                 'evolves_into', 'evolution_level')
+
+    def __init__(self, name: str, id: int, poke_type: str, level: int, hp: int, attack_damage: int, speed: int, defence: int,
+                 hp_growth: tuple | None, attack_growth: tuple | None, defence_growth: tuple | None, speed_growth: tuple | None,
+                 defend_rule: tuple, evolves_into: str | None = None, evolution_level: int | None = None) -> None:
+        """
+
+        This is the constructor method for the Species Class
+
+        Parameters:
+            See the Instance Attributes of the class
+
+        Pre-condition:
+            - HP should be an integer and greater than 0
+            - Poke_type should be a string and be one of the pokemon types
+
+        """
+        if not isinstance(hp, int):
+            raise TypeError("Incorrect value for hp")
+        if not isinstance(poke_type, str):
+            raise TypeError("Incorrect type for poke_type")
+        if hp <= 0:
+            raise ValueError("Hp must be greater than 0")
+        if poke_type.lower() not in PokemonBase.POKEMON_TYPES:
+            raise ValueError("Incorrect pokemon type")
+        self.name = name
+        self.id = id
+        self.poke_type = poke_type
+        self.type_code = PokemonBase.TYPE_CODES[poke_type.lower()]
+        self.level = level
+        self.hp = hp
+        self.attack_damage = attack_damage
+        self.speed = speed
+        self.defence = defence
+        self.hp_growth = hp_growth
+        self.attack_growth = attack_growth
+        self.defence_growth = defence_growth
+        self.speed_growth = speed_growth
+        self.defend_rule = defend_rule
+        self.evolves_into = evolves_into
+        self.evolution_level = evolution_level
+
+    @staticmethod
+    def grow(growth: tuple, level: int) -> int:
+        """
+
+        Gives a stat at a level from its growth rule
+
+        Parameters:
+            growth (tuple): (base, multiplier, divisor)
+            level (int): The level reached
+
+        Returns:
+            stat (int): base + (multiplier * level) // divisor
+        """
+
+        base, multiplier, divisor = growth
+        return base + (multiplier * level) // divisor
+
+
 class PokemonBase(ABC):
     """
 
     This is the implementation of the abstract PokemonBase Class, effectively providing the basic functionality and attributes shared by all Pokemon
 
-    This class inherits from the Python ABC module to get the functionality to become a Base Class
+    This class inherits from the Python ABC module to get the functionality to become a Base Class. A Pokemon class only sets its species,
+    its constants are class attributes read from that Species and its instances hold nothing but the stats that change, in __slots__.
 
     Class Attributes:
         EFFECTIVE_MULTIPLIER_LST (PythonList): A list of lists that gives the effective multiplier combinations between all Pokemon Types
+        TYPE_CODES (dict): The integer code of each type, its index in EFFECTIVE_MULTIPLIER_LST
+        EFFECTIVE_MULTIPLIER_FLAT (PythonList): EFFECTIVE_MULTIPLIER_LST flattened, indexed by attacker code * TYPE_COUNT + defender code
+        STATUS_BY_TYPE (PythonList): The status inflicted by an attacker of each type code
+        SPECIES (dict): The species registry, mapping each Pokemon class name to its class
+        species (Species): The species table row of the Pokemon class
+        name (str): A string giving the Pokemon's name
+        id (int): The ID of the Pokemon referring to its Pokedex order
+        poke_type (str): A string giving the type of pokemon that the pokemon in question is (Fire or Water etc)
+        type_code (int): The integer code of poke_type
+        EVOLVES_INTO (str): Name of the species this Pokemon evolves into, None if it does not evolve
+        EVOLUTION_LEVEL (int): The level at which this Pokemon evolves (the base level of its evolved form)
 
     Instance Attributes:
+        level (int): An integer giving the Pokemon's level
+        hp (int): An integer giving the hitpoints of the Pokemon
         max_hp (int): An integer giving the maximum health of a pokemon (aka hitpoints (hp))
-        poke_type (str): A string giving the type of pokemon that the pokemon in question is (Fire or Water etc)
+        attack_damage (int): An integer giving the Pokemon's attack damage
+        speed (int): An integer giving the Pokemon's speed (mainly used for attack order)
+        max_speed (int): An integer representing the maximum speed of a pokemon
+        defence (int): An integer giving the Pokemon's defence
+        status (str): A string representing the current status of the pokemon
+        can_attack (bool): Whether the Pokemon's last attack went through
+        unique_id (int): An integer representing the unique id given to a pokemon
     """
 
     EFFECTIVE_MULTIPLIER_LST = [[1, 2, 0.5, 1, 1],
@@ -44,30 +146,87 @@ class PokemonBase(ABC):
 
     POKEMON_TYPES = ['fire', 'water', 'grass', 'normal', 'ghost']
 
-    def __init__(self, hp: int, poke_type: str) -> None:
+    # Type code of each type, the row/column of the type in EFFECTIVE_MULTIPLIER_LST
+    TYPE_CODES = {'fire': 0, 'grass': 1, 'water': 2, 'ghost': 3, 'normal': 4}
+    TYPE_COUNT = len(TYPE_CODES)
+
+    # EFFECTIVE_MULTIPLIER_LST row by row, the entry of (attacker, defender) is at attacker * TYPE_COUNT + defender
+    EFFECTIVE_MULTIPLIER_FLAT = [multiplier for row in EFFECTIVE_MULTIPLIER_LST for multiplier in row]
+
+    # Status a successful status attack inflicts, by type code of the attacker
+    STATUS_BY_TYPE = ['burn', 'poison', 'paralysis', 'sleep', 'confuse']
+
+    effective_multiplier_cache = None
+
+    SPECIES = {}
+
+    species = None
+
+    EVOLVES_INTO = None
+    EVOLUTION_LEVEL = None
+
+    __slots__ = ('level', 'hp', 'max_hp', 'attack_damage', 'speed', 'max_speed', 'defence', 'status', 'can_attack', 'unique_id')
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+
+        Registers every Pokemon class in the species registry, so an evolved form is looked up by name and only built when the evolution happens,
+        and copies the constants of its species onto the class
+
+        Parameters:
+            None
+        """
+
+        super().__init_subclass__(**kwargs)
+        PokemonBase.SPECIES[cls.__name__] = cls
+        species = cls.__dict__.get('species')
+        if species is not None:
+            cls.name = species.name
+            cls.id = species.id
+            cls.poke_type = species.poke_type
+            cls.type_code = species.type_code
+            cls.EVOLVES_INTO = species.evolves_into
+            cls.EVOLUTION_LEVEL = species.evolution_level
+
+    def __init__(self) -> None:
         """
 
-        This is the constructor method for the PokemonBase Class
+        This is the constructor method for the PokemonBase Class, a new Pokemon starts at the base stats of its species
 
         Parameters:
-            hp (int): An integer giving the hitpoints of a pokemon
-            poke_type (str): A string giving the type of the pokemon
+            None
 
         Pre-condition:
-            - HP should be an integer and greater than 0
-            - Poke_type should be a string and be one of the pokemon types
+            The Pokemon class has a species
 
         """
-        if not isinstance(hp, int):
-            raise TypeError("Incorrect value for hp")
-        if not isinstance(poke_type, str):
-            raise TypeError("Incorrect type for poke_type")
-        if hp <= 0:
-            raise ValueError("Hp must be greater than 0")
-        if poke_type.lower() not in PokemonBase.POKEMON_TYPES:
-            raise ValueError("Incorrect pokemon type")
-        self.max_hp = hp
-        self.poke_type = poke_type
+        if self.species is None:
+            raise TypeError(f"{type(self).__name__} has no species")
+        self.reset()
+        self.unique_id = 0
+
+    def reset(self) -> None:
+        """
+
+        This method effectively puts the Pokemon back to the base stats of its species, full hp and no status, keeping its unique id
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        species = self.species
+        self.level = species.level
+        self.hp = species.hp
+        self.max_hp = species.hp
+        self.attack_damage = species.attack_damage
+        self.speed = species.speed
+        self.max_speed = species.speed
+        self.defence = species.defence
+        self.can_attack = True
+        self.status = "free"
 
     def is_fainted(self) -> bool:
         """
@@ -88,7 +247,7 @@ class PokemonBase(ABC):
     def level_up(self) -> None:
         """
 
-        This method effectively increments a pokemon's level up by 1
+        This method effectively increments a pokemon's level up by 1 and grows its stats by the growth rules of its species, unless it reaches its evolution level
 
         Parameters:
             None
@@ -104,6 +263,19 @@ class PokemonBase(ABC):
         """
 
         self.level += 1
+        if not self.should_evolve():
+            species = self.species
+            difference_hp = self.max_hp - self.hp   # Difference in hp used
+            if species.hp_growth is not None:
+                self.max_hp = Species.grow(species.hp_growth, self.level)
+            self.hp = self.max_hp - difference_hp
+            if species.attack_growth is not None:
+                self.attack_damage = Species.grow(species.attack_growth, self.level)
+            if species.defence_growth is not None:
+                self.defence = Species.grow(species.defence_growth, self.level)
+            if species.speed_growth is not None:
+                self.speed = Species.grow(species.speed_growth, self.level)
+                self.max_speed = self.speed
 
     def heal(self) -> None:
         """
@@ -120,80 +292,75 @@ class PokemonBase(ABC):
         self.hp = self.max_hp
         self.status = "free"
 
-    @abstractmethod
     def get_hp(self) -> int:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current hp of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return an integer representing the current hp of the Pokemon
+            self.hp (int): An integer representing the current hp of the Pokemon
         """
 
-        pass
+        return self.hp
 
-    @abstractmethod
     def get_status(self) -> str:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current status of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            String (int): The child class's method will return a string representing the current status of the Pokemon (eg. Burnt)
+            self.status (str): A string representing the current status of the Pokemon
         """
 
-        pass
+        return self.status
 
-    @abstractmethod
     def get_speed(self) -> int:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current speed of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return an integer representing the current speed of the Pokemon
+            self.speed (int): An integer representing the current speed of the Pokemon
         """
 
-        pass
+        return self.speed
 
-    @abstractmethod
     def get_attack_damage(self) -> int:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current attack damage of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return an integer representing the current attack damage of the Pokemon
+            self.attack_damage (int): An integer representing the current attack damage of the Pokemon
         """
 
-        pass
+        return self.attack_damage
 
-    @abstractmethod
     def get_defence(self) -> int:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current defence of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return an integer representing the current defence of the Pokemon
+            self.defence (int): An integer representing the current defence of the Pokemon
         """
 
-        pass
+        return self.defence
 
     def lose_hp(self, lost_hp: int) -> None:
         """
@@ -215,14 +382,13 @@ class PokemonBase(ABC):
 
         self.hp -= lost_hp
 
-    @abstractmethod
     def defend(self, damage: int) -> None:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method essentially runs the defence calculation of the Pokemon's species, see Species.defend_rule
 
         Parameters:
-            None
+            damage (int): An integer represnting the damage inflicted on the Pokemon in question
 
         Returns:
             None
@@ -232,18 +398,22 @@ class PokemonBase(ABC):
 
         Post-Condition:
             The Defending Pokemon loses damage according to its defence calculation
-
         """
 
-        pass
+        threshold_multiplier, threshold_offset, above, below_multiplier, below_divisor = self.species.defend_rule
+        if damage > threshold_multiplier * self.get_defence() + threshold_offset:
+            self.lose_hp(damage * above)
+        else:
+            self.lose_hp((damage * below_multiplier) // below_divisor)
 
-    def attack(self, other: PokemonBase) -> None:
+    def attack(self, other: PokemonBase, random_gen: RandomGen | None = None) -> None:
         """
 
         This method effectively facilitates one Pokemon's attack onto another Pokemon
 
         Parameters:
             other (PokemonBase): An instantiation of the PokemonBase Class representing another Pokemon
+            random_gen (RandomGen): The random stream used for status chances, the default stream if None
 
         Returns:
             None
@@ -255,9 +425,11 @@ class PokemonBase(ABC):
             Defending Pokemon's hp is lower by the Attacking Pokemon's effective attack ran through the defending Pokemon's defend method
         """
 
+        if random_gen is None:
+            random_gen = RandomGen.default
         self.can_attack = True
         # Step 1: Status effects on attack damage / redirecting attacks
-        self.status_effect_for_attack()
+        self.status_effect_for_attack(random_gen)
         if self.can_attack:
             # self.can_attack means if it can attack 'successfully'
             # If it can attack, it'll attack 'successfully', regardless of whether it loses damage
@@ -272,7 +444,7 @@ class PokemonBase(ABC):
             # If it successfully attacks (i.e: even does damage of 0), it'll lose hp
             self.status_effect_hp()
 
-        if self.can_attack and RandomGen.random_chance(0.2):
+        if self.can_attack and random_gen.random_chance(0.2):
             # Must check can_attack to see if it attacked 'successfully', only then can it implement a status effect on another pokemon
             self.set_status(other)
 
@@ -285,36 +457,34 @@ class PokemonBase(ABC):
             other (Pokemon): A Pokemon Object representing the Pokemon that is being attacked
 
         Returns:
-            PokemonBase.EFFECTIVE_MULTIPLIER_LST[attack_index][defend_index] (int): An integer representing the effective multiplier that the attacking Pokemon has on the defending Pokemon
+            multiplier (float): The EFFECTIVE_MULTIPLIER_LST entry of the two type codes, representing the effective multiplier that the attacking Pokemon has on the defending Pokemon
         """
 
-        def calc_index(type_poke):
-            """
+        # Type codes are fixed at class creation, so an attack does no string work
+        return PokemonBase.EFFECTIVE_MULTIPLIER_FLAT[self.type_code * PokemonBase.TYPE_COUNT + other.type_code]
 
-            This nested method essentially gives an integer representing the index as per the structure of the EFFECTIVE_MULTIPLIER_LST class variable, basically an index giving the type of the attacking pokemon
+    @classmethod
+    def effective_multiplier_array(cls):
+        """
 
-            Parameters:
-                type_poke (str): A string representing the type of the Pokemon
+        This method gives EFFECTIVE_MULTIPLIER_LST as a NumPy array for batch engines, indexed [attacker code, defender code]
 
-            Returns:
-                integer (int): An integer representing the index of the Attacking Pokemon as per the structure of the EFFECTIVE_MULTIPLIER_LST
-            """
+        Parameters:
+            None
 
-            if type_poke == 'fire':
-                return 0
-            if type_poke == 'grass':
-                return 1
-            if type_poke == 'water':
-                return 2
-            if type_poke == 'ghost':
-                return 3
-            if type_poke == 'normal':
-                return 4
+        Returns:
+            multipliers (ndarray): A float64 array of shape (TYPE_COUNT, TYPE_COUNT), built on the first call
 
-        attack_index = calc_index(self.poke_type.lower())
-        defend_index = calc_index(other.poke_type.lower())
+        Pre-Condition:
+            NumPy is installed
+        """
 
-        return PokemonBase.EFFECTIVE_MULTIPLIER_LST[attack_index][defend_index]
+        if PokemonBase.effective_multiplier_cache is None:
+            import numpy as np  # Only batch engines need NumPy
+            multipliers = np.array(cls.EFFECTIVE_MULTIPLIER_LST, dtype=np.float64)
+            multipliers.flags.writeable = False
+            PokemonBase.effective_multiplier_cache = multipliers
+        return PokemonBase.effective_multiplier_cache
 
     def set_status(self, other_poke: PokemonBase):
         """
@@ -335,24 +505,15 @@ class PokemonBase(ABC):
         """
 
         # Other pokemon might get the status of attacker pokemons status
-        if self.poke_type.lower() == 'fire':
-            other_poke.status = 'burn'
-        elif self.poke_type.lower() == 'grass':
-            other_poke.status = 'poison'
-        elif self.poke_type.lower() == 'water':
-            other_poke.status = 'paralysis'
-        elif self.poke_type.lower() == 'ghost':
-            other_poke.status = 'sleep'
-        else:
-            other_poke.status = 'confuse'
+        other_poke.status = PokemonBase.STATUS_BY_TYPE[self.type_code]
 
-    def status_effect_for_attack(self):
+    def status_effect_for_attack(self, random_gen: RandomGen | None = None):
         """
 
         A method which essentially checks the two status's that effect a Pokemon's capacity to attack another Pokemon (Confusion and Sleep) and switches of Attack Capability accordingly
 
         Parameters:
-            None
+            random_gen (RandomGen): The random stream used for the confusion chance, the default stream if None
 
         Returns:
             None
@@ -368,7 +529,7 @@ class PokemonBase(ABC):
             self.can_attack = False  # if the pokemon is asleep, it cannot attack
         elif self.status == "confuse":
             # if the 50% chance is satisfied, then damage itself when it is confused
-            if RandomGen.random_chance(0.5):
+            if (RandomGen.default if random_gen is None else random_gen).random_chance(0.5):
                 self.defend(int(self.check_effective_multiplier(
                     self) * self.get_attack_damage()))
                 self.can_attack = False  # it cannot attack because it attacks itself
@@ -399,35 +560,33 @@ class PokemonBase(ABC):
         if self.status == "poison":
             self.lose_hp(3)
 
-    @abstractmethod
     def get_level(self) -> int:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the current level of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return an integer representing the current level of the Pokemon
+            self.level (int): An integer representing the current level of the Pokemon
         """
 
-        pass
+        return self.level
 
-    @abstractmethod
     def get_poke_name(self) -> str:
         """
 
-        This method is an abstract method that will be concretely implemented in its child class, the Pokemon Class
+        This method provides the name of the Pokemon
 
         Parameters:
             None
 
         Returns:
-            Integer (int): The child class's method will return a string representing the name of the Pokemon
+            self.name (str): A string representing the name of the Pokemon
         """
 
-        pass
+        return self.name
 
     def __str__(self) -> str:
         """
@@ -458,12 +617,8 @@ class PokemonBase(ABC):
             N/A
         """
 
-        try:
-            if self.level == self.evolved_version.level:  # Base level of new initialized evolved object
-                return True  # returns True if the level is at the sufficient level for evolution
-            return False
-        except AttributeError:
-            return False
+        # The evolved form is not built here, its base level is stored on the class
+        return self.EVOLVES_INTO is not None and self.level == self.EVOLUTION_LEVEL
 
     def can_evolve(self) -> bool:
         """
@@ -484,7 +639,7 @@ class PokemonBase(ABC):
         """
 
         # If there is an evolved version then we check if the pokemon is not fainted
-        if self.evolved_version != None:
+        if self.EVOLVES_INTO is not None:
             if not self.is_fainted():
                 return True  # if it isn't fainted, then it can evolve
             else:
@@ -512,7 +667,8 @@ class PokemonBase(ABC):
 
         if self.can_evolve():
             difference_hp = self.max_hp - self.hp
-            evolved_poke = self.evolved_version  # Retrieve evolved version
+            # Build the evolved version now, from the species registry
+            evolved_poke = PokemonBase.SPECIES[self.EVOLVES_INTO]()
             # Computes the hp for the evolved pokemon
             evolved_poke.hp = evolved_poke.max_hp - difference_hp
             evolved_poke.status = self.status  # Set status to old poke
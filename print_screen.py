@@ -1,5 +1,11 @@
+import contextlib
+import io
 import os
-import copy
+import re
+import shutil
+import sys
+import unittest
+from unittest import mock
 TEMPLATE_WINDOW = list(map(list, """\
   ........................................................................................................................................  
  *O                                                                                                                                      O. 
@@ -62,16 +68,85 @@ POKEMON_COLORS = {
 }
 
 
-def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
-    BATTLE_WINDOW = copy.deepcopy(TEMPLATE_WINDOW)
-    team1_pokemon_name = team1_pokemon_name.lower()
-    team2_pokemon_name = team2_pokemon_name.lower()
+SPRITE_DIR = "pokemon_printing"
+
+# Rows holding the HP, level, status and remaining pokemon cells, rewritten every frame
+DYNAMIC_ROWS = (6, 8, 9, 21, 23, 24)
+
+# (lowercase pokemon name, facing) -> sprite lines, facing is "front" or "back"
+_SPRITE_CACHE = {}
+# (team1 pokemon name, team2 pokemon name) -> template with both names and sprites drawn
+_BASE_FRAME_CACHE = {}
+
+
+def load_sprite(pokemon_name, facing):
+    """Returns the sprite lines of a pokemon, reading its file only the first time it is asked for."""
+    key = (pokemon_name, facing)
+    if key not in _SPRITE_CACHE:
+        suffix = "_back.txt" if facing == "back" else ".txt"
+        with open(SPRITE_DIR + "/" + pokemon_name + suffix, "r") as f:
+            _SPRITE_CACHE[key] = f.read().split("\n")
+    return _SPRITE_CACHE[key]
+
+
+def clear_caches():
+    """Forgets every cached sprite and base frame, e.g. after the sprite files changed."""
+    _SPRITE_CACHE.clear()
+    _BASE_FRAME_CACHE.clear()
+
+
+def base_frame(team1_pokemon_name, team2_pokemon_name):
+    """Returns the window with the names and sprites of both pokemon already drawn.
+    Built once per pairing, the returned rows must not be modified."""
+    key = (team1_pokemon_name, team2_pokemon_name)
+    if key in _BASE_FRAME_CACHE:
+        return _BASE_FRAME_CACHE[key]
+    BATTLE_WINDOW = [row[:] for row in TEMPLATE_WINDOW]
     # NAMES
     for i, c in enumerate(team1_pokemon_name.upper()):
         BATTLE_WINDOW[21][82 + i] = c
     for i, c in enumerate(team2_pokemon_name.upper()):
         BATTLE_WINDOW[6][12 + i] = c
 
+    # SPRITES
+    team1_color = POKEMON_COLORS[team1_pokemon_name]
+    team1_lines = load_sprite(team1_pokemon_name, "back")
+    team1_sprite_width = len(team1_lines[0])
+    team1_sprite_height = len(team1_lines)
+    for x in range(team1_sprite_height):
+        for y in range(team1_sprite_width):
+            xind = 27 - team1_sprite_height + x
+            yind = 31 - team1_sprite_width // 2 + y
+            if 12 <= xind <= 27 and 5 <= yind <= 75 and y < len(team1_lines[x]):
+                BATTLE_WINDOW[xind][yind] = (team1_color if y == 0 else "") + team1_lines[x][y] + (
+                    CLEAR if y == team1_sprite_width - 1 else "")
+
+    team2_color = POKEMON_COLORS[team2_pokemon_name]
+    team2_lines = load_sprite(team2_pokemon_name, "front")
+    team2_sprite_width = len(team2_lines[0])
+    team2_sprite_height = len(team2_lines)
+    for x in range(team2_sprite_height):
+        for y in range(team2_sprite_width):
+            xind = 17 - team2_sprite_height + x
+            yind = 101 - team2_sprite_width // 2 + y
+            if 1 <= xind <= 17 and 65 <= yind <= 136 and y < len(team2_lines[x]):
+                BATTLE_WINDOW[xind][yind] = (team2_color if y == 0 else "") + team2_lines[x][y] + (
+                    CLEAR if y == team2_sprite_width - 1 else "")
+
+    _BASE_FRAME_CACHE[key] = BATTLE_WINDOW
+    return BATTLE_WINDOW
+
+
+def build_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
+    """Returns the battle window as a list of rows of cells.
+    Static rows are shared with the cached base frame, only DYNAMIC_ROWS are copied and patched."""
+    team1_pokemon_name = team1_pokemon_name.lower()
+    team2_pokemon_name = team2_pokemon_name.lower()
+    BASE_WINDOW = base_frame(team1_pokemon_name, team2_pokemon_name)
+    BATTLE_WINDOW = list(BASE_WINDOW)
+    for row in DYNAMIC_ROWS:
+        BATTLE_WINDOW[row] = BASE_WINDOW[row][:]
+
     # LVL
     BATTLE_WINDOW[23][86], BATTLE_WINDOW[23][87] = str(team1_lvl).zfill(2)
     BATTLE_WINDOW[8][16], BATTLE_WINDOW[8][17] = str(team2_lvl).zfill(2)
@@ -119,36 +194,181 @@ def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team
         BATTLE_WINDOW[21][112 + 3 *
                           x] = "█" if x < team1_remaining_pokemon else "*"
 
-    # SPRITES
-    team1_color = POKEMON_COLORS[team1_pokemon_name]
-    with open("pokemon_printing/" + team1_pokemon_name + "_back.txt", "r") as f:
-        team1_lines = f.read().split("\n")
-    team1_sprite_width = len(team1_lines[0])
-    team1_sprite_height = len(team1_lines)
-    for x in range(team1_sprite_height):
-        for y in range(team1_sprite_width):
-            xind = 27 - team1_sprite_height + x
-            yind = 31 - team1_sprite_width // 2 + y
-            if 12 <= xind <= 27 and 5 <= yind <= 75 and y < len(team1_lines[x]):
-                BATTLE_WINDOW[xind][yind] = (team1_color if y == 0 else "") + team1_lines[x][y] + (
-                    CLEAR if y == team1_sprite_width - 1 else "")
+    return BATTLE_WINDOW
 
-    team2_color = POKEMON_COLORS[team2_pokemon_name]
-    with open("pokemon_printing/" + team2_pokemon_name + ".txt", "r") as f:
-        team2_lines = f.read().split("\n")
-    team2_sprite_width = len(team2_lines[0])
-    team2_sprite_height = len(team2_lines)
-    for x in range(team2_sprite_height):
-        for y in range(team2_sprite_width):
-            xind = 17 - team2_sprite_height + x
-            yind = 101 - team2_sprite_width // 2 + y
-            if 1 <= xind <= 17 and 65 <= yind <= 136 and y < len(team2_lines[x]):
-                BATTLE_WINDOW[xind][yind] = (team2_color if y == 0 else "") + team2_lines[x][y] + (
-                    CLEAR if y == team2_sprite_width - 1 else "")
 
+def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
+    BATTLE_WINDOW = build_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp,
+                                      team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon)
     print("\n".join(map(lambda z: "".join(z), BATTLE_WINDOW)))
 
 
+ESCAPE_PATTERN = re.compile("\x1b\\[[0-9;]*m")
+
+
+def apply_escapes(style, text):
+    """Returns the colour escapes in effect after writing text with `style` in effect."""
+    for escape in ESCAPE_PATTERN.findall(text):
+        style = "" if escape == CLEAR else style + escape
+    return style
+
+
+def cell_styles(row, style=""):
+    """Returns the colour escapes in effect at the start of each cell of a row, given the
+    escapes in effect before the row, and the escapes still in effect after it."""
+    styles = []
+    for cell in row:
+        styles.append(style)
+        if "\x1b" in cell:
+            style = apply_escapes(style, cell)
+    return styles, style
+
+
+class DiffRenderer:
+    """Draws battle windows by rewriting only the cells that changed since the previous frame.
+
+    Changed cells are reached with cursor-positioning escapes. The first frame, and any frame
+    after the terminal has been resized, is drawn in full. When the terminal is too small for
+    the whole window, frames are printed in full one after the other, without positioning.
+
+    Usage:
+    ```
+    renderer = DiffRenderer()
+    battle = Battle(RenderPolicy.FULL, renderer=renderer.print_game_screen)
+    ```
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.last_frame = None
+        self.terminal_size = None
+
+    def reset(self):
+        """Forces the next frame to be drawn in full."""
+        self.last_frame = None
+
+    def draw(self, frame):
+        """Writes a frame, a list of rows of cells, as produced by build_game_screen."""
+        stream = self.stream if self.stream is not None else sys.stdout
+        size = shutil.get_terminal_size()
+        if size.lines < len(frame) + 1 or size.columns < max(map(len, frame), default=0):
+            # The window does not fit, so positioned writes would land on the wrong cells once it scrolls or wraps.
+            # Frames are printed one after the other instead, as print_game_screen does
+            stream.write("\n".join(map(lambda z: "".join(z), frame)) + "\n")
+            stream.flush()
+            self.last_frame = None
+            self.terminal_size = size
+            return
+        if self.last_frame is None or size != self.terminal_size or len(frame) != len(self.last_frame):
+            output = "\x1b[H\x1b[2J" + \
+                "\n".join(map(lambda z: "".join(z), frame)) + "\n"
+        else:
+            output = self.diff(self.last_frame, frame)
+            if output:
+                # Leave the cursor below the window, where a full redraw would have left it
+                output += f"\x1b[{len(frame) + 1};1H"
+        stream.write(output)
+        stream.flush()
+        self.last_frame = frame
+        self.terminal_size = size
+
+    @staticmethod
+    def diff(old_frame, new_frame):
+        """Returns the escapes and cells turning old_frame into new_frame on the terminal.
+        A cell counts as changed when its text or the colour it is drawn in changed. Colours
+        are followed across rows, as an empty HP bar leaves its colour open until the next reset."""
+        parts = []
+        old_style = new_style = ""
+        for r in range(len(new_frame)):
+            new_row = new_frame[r]
+            old_row = old_frame[r]
+            # Static rows are shared with the base frame, so most rows are skipped here
+            if (new_row is old_row or new_row == old_row) and new_style == old_style:
+                old_style = new_style = apply_escapes(new_style, "".join(new_row))
+                continue
+            if len(new_row) != len(old_row):
+                parts.append(f"\x1b[{r + 1};1H\x1b[K" + CLEAR + new_style + "".join(new_row) + CLEAR)
+                old_style = apply_escapes(old_style, "".join(old_row))
+                new_style = apply_escapes(new_style, "".join(new_row))
+                continue
+            new_styles, new_style = cell_styles(new_row, new_style)
+            old_styles, old_style = cell_styles(old_row, old_style)
+            c = 0
+            while c < len(new_row):
+                if new_row[c] == old_row[c] and new_styles[c] == old_styles[c]:
+                    c += 1
+                    continue
+                start = c
+                while c < len(new_row) and (new_row[c] != old_row[c] or new_styles[c] != old_styles[c]):
+                    c += 1
+                parts.append(f"\x1b[{r + 1};{start + 1}H" + CLEAR +
+                             new_styles[start] + "".join(new_row[start:c]) + CLEAR)
+        return "".join(parts)
+
+    def print_game_screen(self, team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
+        """Drop-in replacement for the module level print_game_screen."""
+        self.draw(build_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp,
+                                    team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon))
+
+
+class TestDiffRenderer(unittest.TestCase):
+    """Tests the output of DiffRenderer on small frames, in a terminal that fits them and in one that does not."""
+    ROWS = 5
+    COLUMNS = 10
+
+    def blank_frame(self):
+        return [["."] * self.COLUMNS for _ in range(self.ROWS)]
+
+    def draw(self, renderer, frame, columns=200, lines=60):
+        """Returns what drawing a frame writes to stdout, in a terminal of the given size."""
+        output = io.StringIO()
+        with mock.patch("shutil.get_terminal_size", return_value=os.terminal_size((columns, lines))), \
+                contextlib.redirect_stdout(output):
+            renderer.draw(frame)
+        return output.getvalue()
+
+    @staticmethod
+    def plain(frame):
+        return "\n".join("".join(row) for row in frame) + "\n"
+
+    def test_changed_cells_only(self):
+        renderer = DiffRenderer()
+        first = self.blank_frame()
+        self.assertEqual(self.draw(renderer, first), "\x1b[H\x1b[2J" + self.plain(first))
+        second = self.blank_frame()
+        second[1][2:4] = ["X", "X"]
+        second[3][7] = "Y"
+        self.assertEqual(self.draw(renderer, second),
+                         "\x1b[2;3H" + CLEAR + "XX" + CLEAR + "\x1b[4;8H" + CLEAR + "Y" + CLEAR + f"\x1b[{self.ROWS + 1};1H")
+        self.assertEqual(self.draw(renderer, [list(row) for row in second]), "")
+
+    def test_changed_colour(self):
+        renderer = DiffRenderer()
+        self.draw(renderer, self.blank_frame())
+        coloured = self.blank_frame()
+        coloured[2][4] = "\x1b[31m."
+        coloured[2][6] = CLEAR + "."
+        # The cell after the colour escape is drawn in its colour, so it changed too, the reset ends the run
+        self.assertEqual(self.draw(renderer, coloured),
+                         "\x1b[3;5H" + CLEAR + "\x1b[31m." + "." + CLEAR + "." + CLEAR + f"\x1b[{self.ROWS + 1};1H")
+
+    def test_resized(self):
+        renderer = DiffRenderer()
+        self.draw(renderer, self.blank_frame())
+        self.assertTrue(self.draw(renderer, self.blank_frame(), columns=150).startswith("\x1b[H\x1b[2J"))
+
+    def test_undersized_terminal(self):
+        renderer = DiffRenderer()
+        self.draw(renderer, self.blank_frame())
+        frame = self.blank_frame()
+        frame[0][0] = "X"
+        for columns, lines in ((self.COLUMNS, self.ROWS), (self.COLUMNS - 1, 60)):
+            with self.subTest(columns=columns, lines=lines):
+                self.assertEqual(self.draw(renderer, frame, columns, lines), self.plain(frame))
+        # Once the window fits again it is drawn in full
+        self.assertEqual(self.draw(renderer, frame), "\x1b[H\x1b[2J" + self.plain(frame))
+
+
 if __name__ == "__main__":
     POKEMON = ["Charmander", "Charizard", "Bulbasaur", "Venusaur",
                "Squirtle", "Blastoise", "Gastly", "Haunter", "Gengar", "Eevee"]
@@ -8,7 +8,7 @@ __docformat__ = 'reStructuredText'
 
 import unittest
 from abc import ABC, abstractmethod 
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
 from referential_array import ArrayR, T
 from stack_adt import ArrayStack
 
@@ -95,6 +95,15 @@ class CircularQueue(Queue[T]):
     def is_full(self) -> bool:
         """ True if the queue is full and no element can be appended. """
         return len(self) == len(self.array)
+
+    def __iter__(self) -> Iterator[T]:
+        """ Yields the elements from front to rear (the order serve would return them),
+        reading the array in place without copying or serving.
+        The queue must not be changed while iterating.
+        :complexity: O(1) per element, O(n) for the whole queue
+        """
+        for offset in range(self.length):
+            yield self.array[(self.front + offset) % len(self.array)]
  
     def clear(self) -> None:
         """ Clears all elements from the queue. """
@@ -181,6 +190,19 @@ class TestQueue(unittest.TestCase):
             for i in range(nitems):
                 self.assertEqual(queue.serve(), i)
                 
+    def test_iter(self):
+        """ Tests iteration goes front to rear, wraps around and leaves the queue unchanged."""
+        for queue, length in zip(self.queues, self.lengths):
+            self.assertEqual(list(queue), list(range(length)))
+            self.assertEqual(len(queue), length)
+        small = CircularQueue(3)
+        for i in range(3):
+            small.append(i)
+        small.serve()
+        small.append(3)
+        self.assertEqual(list(small), [1, 2, 3])
+        self.assertEqual(small.serve(), 1)
+
     def test_clear(self):
         for queue in self.queues:
             queue.clear()
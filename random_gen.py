@@ -4,46 +4,358 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+import unittest
+from types import MethodType
 
-class RandomGen():
+try:
+    import numpy as np
+except ImportError:  # Block methods fall back to plain lists
+    np = None
+
+
+class stream_method():
+    """
+    Method decorator: called on an instance it uses that instance's stream,
+    called on the class it uses the shared default stream `RandomGen.default`.
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.__doc__ = method.__doc__
+        self.__name__ = method.__name__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            instance = owner.default
+        return MethodType(self.method, instance)
+
+
+class RandomGenMeta(type):
+    """
+    Metaclass of RandomGen: `RandomGen.seed` reads and sets the seed of the default stream,
+    as it did before every instance had its own stream.
+    """
+
+    @property
+    def seed(cls):
+        return cls.default.seed
+
+    @seed.setter
+    def seed(cls, seed):
+        cls.default.seed = seed
+
+
+class RandomGen(metaclass=RandomGenMeta):
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
-    
-    Uses LCG method. All methods are O(1) best/worst case time complexity.
-    
+
+    Uses LCG method. All methods are O(1) best/worst case time complexity unless otherwise stated.
+
+    Every instance is an independent stream. Calling the methods on the class itself uses the
+    shared default stream, so existing code keeps working unchanged.
+
     Usage:
     ```
     RandomGen.set_seed(123)
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+
+    gen = RandomGen(123)         # Own stream, same sequence as the default stream seeded with 123
+    workers = gen.split(4)       # 4 non-overlapping substreams
+
+    gen.random_block(1000)       # The next 1000 numbers of random(), as a NumPy array
+    gen.set_buffer(4096)         # Scalar calls are now served from prefetched blocks
     ```
     """
-    
+
     MOD = pow(2, 48)
     A = 25214903917
     C = 11
-    
-    seed = time.time_ns()
-    
-    @classmethod
-    def set_seed(cls, seed=None):
+
+    # Numbers each substream may draw before running into the next one
+    STREAM_STRIDE = pow(2, 24)
+
+    default = None
+
+    # Jump coefficients for 1..n steps, grown on demand up to MAX_BLOCK and shared by every stream
+    block_coefficients = None
+    # Largest block computed at once, longer blocks are computed in chunks of this size
+    MAX_BLOCK = pow(2, 16)
+
+    def __init__(self, seed=None):
+        """Creates a stream, seeded with the current time when seed is None."""
+        self.seed = time.time_ns() if seed is None else seed
+        self.buffer_size = 0
+        # buffer[0] is the state the block was drawn from, buffer[1:] the following states
+        self.buffer = [None]
+        self.buffer_pos = 0
+
+    @stream_method
+    def set_seed(self, seed=None):
         """Seed all future calls to `random`."""
         seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
-    
-    @classmethod
-    def random(cls):
+        self.seed = seed
+
+    @stream_method
+    def random(self):
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        if self.buffer_size:
+            # The buffer is only used while nothing else has moved the seed
+            if self.buffer_pos + 1 >= len(self.buffer) or self.buffer[self.buffer_pos] != self.seed:
+                self.buffer = [self.seed] + self.state_block(self.buffer_size, self.seed)
+                self.buffer_pos = 0
+            self.buffer_pos += 1
+            self.seed = self.buffer[self.buffer_pos]
+            return self.seed >> 16
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
 
-    @classmethod
-    def randint(cls, lo, hi):
+    @stream_method
+    def randint(self, lo, hi):
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return (self.random() % (hi - lo + 1)) + lo
 
-    @classmethod
-    def random_chance(cls, ratio):
+    @stream_method
+    def random_chance(self, ratio):
         """Returns random()/2^32 < ratio"""
-        return cls.random()/(1 << 32) < ratio
+        return self.random()/(1 << 32) < ratio
+
+    @stream_method
+    def set_buffer(self, size):
+        """
+        Serves scalar random() calls from blocks of `size` prefetched numbers, 0 turns buffering off.
+        The sequence of numbers is the same either way.
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Buffer size must be a non-negative integer")
+        self.buffer_size = size
+        self.buffer = [None]
+        self.buffer_pos = 0
+
+    @classmethod
+    def jump_coefficients(cls, steps):
+        """
+        Returns (a, c) such that `steps` calls to random() map the state s to (a * s + c) % MOD.
+        O(log steps), by repeated squaring of the LCG step.
+        """
+        a, c = 1, 0
+        step_a, step_c = cls.A, cls.C
+        while steps > 0:
+            if steps & 1:
+                a = (a * step_a) % cls.MOD
+                c = (c * step_a + step_c) % cls.MOD
+            step_c = ((step_a + 1) * step_c) % cls.MOD
+            step_a = (step_a * step_a) % cls.MOD
+            steps >>= 1
+        return a, c
+
+    @stream_method
+    def advance(self, steps):
+        """Moves the stream as if random() had been called `steps` times. O(log steps)."""
+        a, c = self.jump_coefficients(steps)
+        self.seed = (a * self.seed + c) % self.MOD
+
+    @stream_method
+    def substream(self, index):
+        """
+        Returns a new stream starting (index + 1) * STREAM_STRIDE numbers ahead of this one.
+        Substreams with different indices, and the next STREAM_STRIDE numbers of this stream,
+        never overlap as long as none draws more than STREAM_STRIDE numbers. O(log index).
+        """
+        stream = RandomGen(self.seed)
+        stream.advance((index + 1) * self.STREAM_STRIDE)
+        return stream
+
+    @stream_method
+    def split(self, count):
+        """Returns `count` non-overlapping substreams, see substream. O(count * log count)."""
+        return [self.substream(index) for index in range(count)]
+
+    @classmethod
+    def step_coefficients(cls, n):
+        """
+        Returns uint64 NumPy arrays (a, c) of length n <= MAX_BLOCK where k + 1 steps map the state s
+        to (a[k] * s + c[k]) % MOD. Built by doubling in O(log n) array operations and cached.
+        """
+        if n > cls.MAX_BLOCK:
+            raise ValueError("At most MAX_BLOCK steps are computed at once")
+        cached = cls.block_coefficients
+        if cached is not None and len(cached[0]) >= n:
+            return cached[0][:n], cached[1][:n]
+        mask = np.uint64(cls.MOD - 1)
+        a = np.array([cls.A], dtype=np.uint64)
+        c = np.array([cls.C], dtype=np.uint64)
+        while len(a) < n:
+            # Steps m+1..2m are steps 1..m followed by m more steps
+            a_m, c_m = a[-1], c[-1]
+            a = np.concatenate((a, (a * a_m) & mask))
+            c = np.concatenate((c, (a[:len(c)] * c_m + c) & mask))
+        cls.block_coefficients = (a, c)
+        return a[:n], c[:n]
+
+    @classmethod
+    def state_block(cls, n, seed):
+        """Returns the n LCG states following `seed` as a list. O(n)."""
+        if np is None:
+            states = []
+            for _ in range(n):
+                seed = (cls.A * seed + cls.C) % cls.MOD
+                states.append(seed)
+            return states
+        return cls.state_array(n, seed).tolist()
+
+    @classmethod
+    def state_array(cls, n, seed):
+        """Returns the n LCG states following `seed` as a uint64 NumPy array, MAX_BLOCK at a time. O(n)."""
+        mask = np.uint64(cls.MOD - 1)
+        seed %= cls.MOD
+        chunks = []
+        while n > 0:
+            a, c = cls.step_coefficients(min(n, cls.MAX_BLOCK))
+            # uint64 products wrap modulo 2^64, the low 48 bits are exactly the LCG state
+            states = (a * np.uint64(seed) + c) & mask
+            chunks.append(states)
+            seed = int(states[-1])
+            n -= len(states)
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint64)
+
+    @stream_method
+    def random_block(self, n):
+        """
+        Returns the next n results of random() at once, and moves the stream past them.
+        A uint64 NumPy array, or a list when NumPy is not installed. O(n).
+        """
+        if n <= 0:
+            return np.zeros(0, dtype=np.uint64) if np is not None else []
+        if np is None:
+            states = self.state_block(n, self.seed)
+            self.seed = states[-1]
+            return [state >> 16 for state in states]
+        states = self.state_array(n, self.seed)
+        self.seed = int(states[-1])
+        return states >> np.uint64(16)
+
+    @stream_method
+    def randint_block(self, lo, hi, n):
+        """Returns the next n results of randint(lo, hi) at once. O(n)."""
+        block = self.random_block(n)
+        if np is None:
+            return [(number % (hi - lo + 1)) + lo for number in block]
+        return (block.astype(np.int64) % (hi - lo + 1)) + lo
+
+    @stream_method
+    def chance_block(self, ratio, n):
+        """Returns the next n results of random_chance(ratio) at once. O(n)."""
+        block = self.random_block(n)
+        if np is None:
+            return [number/(1 << 32) < ratio for number in block]
+        return block / (1 << 32) < ratio
+
+
+RandomGen.default = RandomGen()
+
+
+class TestRandomGen(unittest.TestCase):
+    """ Tests seeding the default stream through the class, jumping ahead, and the block methods and buffer against scalar calls. """
+
+    SEEDS = [2022, -12345, pow(2, 64) + 7]
+    SIZES = [0, 1, 1000, RandomGen.MAX_BLOCK + 3]
+
+    def setUp(self):
+        self.default_seed = RandomGen.default.seed
+
+    def tearDown(self):
+        RandomGen.default.seed = self.default_seed
+
+    def test_class_seed(self):
+        RandomGen.seed = 123
+        self.assertEqual(RandomGen.seed, 123)
+        first = [RandomGen.random() for _ in range(10)]
+        RandomGen.seed = 123
+        self.assertEqual([RandomGen.random() for _ in range(10)], first)
+        self.assertEqual(RandomGen(123).random(), first[0])
+        self.assertNotIn('seed', vars(RandomGen))
+
+    def test_instance_seed(self):
+        stream = RandomGen(5)
+        RandomGen.seed = 7
+        self.assertEqual(stream.seed, 5)
+        self.assertEqual(RandomGen.default.seed, 7)
+
+    def test_advance(self):
+        for seed in self.SEEDS:
+            for n in (0, 1, 1000, 100000):
+                with self.subTest(seed=seed, n=n):
+                    jumped, stepped = RandomGen(seed), RandomGen(seed)
+                    jumped.advance(n)
+                    for _ in range(n):
+                        stepped.random()
+                    self.assertEqual(jumped.seed % RandomGen.MOD, stepped.seed % RandomGen.MOD)
+                    self.assertEqual(jumped.random(), stepped.random())
+        # Large jumps compose like the steps they stand for
+        once, twice = RandomGen(2022), RandomGen(2022)
+        once.advance(pow(2, 40) + 12345)
+        twice.advance(pow(2, 40))
+        twice.advance(12345)
+        self.assertEqual(once.seed, twice.seed)
+
+    def test_substream(self):
+        stream = RandomGen(2022)
+        for index in range(4):
+            ahead = RandomGen(2022)
+            ahead.advance((index + 1) * RandomGen.STREAM_STRIDE)
+            self.assertEqual(stream.substream(index).seed, ahead.seed)
+        if np is not None:
+            stepped = RandomGen(2022)
+            stepped.random_block(RandomGen.STREAM_STRIDE)
+            self.assertEqual(stream.substream(0).seed, stepped.seed)
+        parent = RandomGen(2022)
+        outputs = [tuple(parent.random() for _ in range(100))]
+        for substream in stream.split(8):
+            outputs.append(tuple(substream.random() for _ in range(100)))
+        self.assertEqual(len(set(outputs)), len(outputs))
+        self.assertEqual(len(set(number for numbers in outputs for number in numbers)), 100 * len(outputs))
+        self.assertEqual(stream.seed, 2022)
+
+    @staticmethod
+    def as_list(block):
+        return block.tolist() if np is not None else list(block)
+
+    def test_blocks(self):
+        for seed in self.SEEDS:
+            for n in self.SIZES:
+                with self.subTest(seed=seed, n=n):
+                    block, scalar = RandomGen(seed), RandomGen(seed)
+                    self.assertEqual(self.as_list(block.random_block(n)), [scalar.random() for _ in range(n)])
+                    self.assertEqual(self.as_list(block.randint_block(1, 6, n)), [scalar.randint(1, 6) for _ in range(n)])
+                    self.assertEqual(self.as_list(block.chance_block(0.3, n)), [scalar.random_chance(0.3) for _ in range(n)])
+                    self.assertEqual(block.seed % RandomGen.MOD, scalar.seed % RandomGen.MOD)
+                    self.assertEqual(RandomGen.state_block(n, seed), self.states(seed, n))
+
+    @staticmethod
+    def states(seed, n):
+        stream = RandomGen(seed)
+        states = []
+        for _ in range(n):
+            stream.random()
+            states.append(stream.seed)
+        return states
+
+    def test_buffer(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                buffered, plain = RandomGen(seed), RandomGen(seed)
+                buffered.set_buffer(64)
+                for move in (lambda stream: None, lambda stream: stream.set_seed(99), lambda stream: stream.advance(1000)):
+                    move(buffered)
+                    move(plain)
+                    self.assertEqual([buffered.random() for _ in range(150)], [plain.random() for _ in range(150)])
+
+
+if __name__ == '__main__':
+    testtorun = TestRandomGen()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
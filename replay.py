@@ -0,0 +1,415 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+from battle import Battle, RenderPolicy
+from poke_team import Action, PokeTeam, Criterion
+from pokemon import SPECIES_TABLE
+from pokemon_base import PokemonBase
+from print_screen import print_game_screen
+from random_gen import RandomGen
+"""
+
+This file demonstrates the implementation of the compact binary replay log of battles: a ReplayWriter given to a Battle records
+every battle as fixed-width records, and a Replayer seeks straight to any turn of any battle without simulating it again.
+Also defines UnitTests checking replayed frames against the frames the battles drew.
+
+Layout (little-endian):
+    header:  magic b'PKRP', format version (uint16), record size (uint16)
+    records: RECORD_SIZE bytes each, a START record, one TURN record per turn and an END record per battle
+    trailer: the record number of every START record (uint64 each), then magic b'PKRI' and the number of battles (uint64),
+             written when the writer is closed (a file without it is indexed by scanning its records)
+
+Every record is (kind, result, turn) followed by the same six fields for team 1 and team 2:
+    TURN:  the Pokemon on the field as drawn at the start of the turn (pokedex id, level, status, hp, max hp),
+           the action its team chose (0 for none) and the team size
+    START: turn is the battle number, only the team sizes and battle modes (in the action field) are set
+    END:   result is the battle result, turn the number of turns, only the team sizes are set
+
+October 2026
+"""
+
+__author__ = "Code by Daniel Liu, Ben Abraham, Johnny Ta, Bangze Han"
+
+"""
+
+All methods have a best/worst case time complexity O(1), constant time unless otherwise stated.
+
+"""
+
+MAGIC = b'PKRP'
+INDEX_MAGIC = b'PKRI'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+# kind, result, padding, turn, then for each team: pokedex id, level, status, action, team size, padding, hp, max hp
+RECORD = struct.Struct('<BBHI' + 'BBBBBxhH' * 2)
+RECORD_SIZE = RECORD.size
+FOOTER = struct.Struct('<4sQ')
+
+START, TURN, END = 0, 1, 2
+# The status code of each status, 0 is 'free'
+STATUSES = ['free'] + PokemonBase.STATUS_BY_TYPE
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+# The Pokemon class of each pokedex id
+SPECIES_BY_ID = {species.id: PokemonBase.SPECIES[name] for name, species in SPECIES_TABLE.items()}
+
+
+class ReplayWriter:
+    """
+
+    This class writes the replay log of the battles of a Battle (see Battle's replay parameter) to a buffered binary file
+
+    Instance Attributes:
+        file (file): The binary file the records are written to
+        owns_file (bool): Whether the writer opened the file, and so closes it
+        battle_records (array): The record number of the START record of each battle, written as the trailer on close
+        records (int): The number of records written
+    """
+
+    def __init__(self, file, buffering: int = 1 << 16) -> None:
+        """
+
+        This is the constructor method for the ReplayWriter Class
+
+        Parameters:
+            file (str or file): A path to create the log at, or a binary file open for writing
+            buffering (int): The buffer size when a path is given
+        """
+
+        self.owns_file = isinstance(file, str)
+        self.file = open(file, 'wb', buffering=buffering) if self.owns_file else file
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+        self.battle_records = array('Q')
+        self.records = 0
+
+    def write(self, *fields) -> None:
+        """ Writes one record """
+        self.file.write(RECORD.pack(*fields))
+        self.records += 1
+
+    def start_battle(self, team1: PokeTeam, team2: PokeTeam) -> None:
+        """
+
+        This method writes the START record of a battle
+
+        Parameters:
+            team1, team2 (PokeTeam): The teams about to battle
+        """
+
+        self.battle_records.append(self.records)
+        self.write(START, 0, 0, len(self.battle_records) - 1,
+                   0, 0, 0, team1.battle_mode, len(team1.team_adt), 0, 0,
+                   0, 0, 0, team2.battle_mode, len(team2.team_adt), 0, 0)
+
+    def write_turn(self, turn: int, poke1: PokemonBase, poke2: PokemonBase, action1: Action | None, action2: Action | None,
+                   team1: PokeTeam, team2: PokeTeam) -> None:
+        """
+
+        This method writes the TURN record of a turn, once both teams have chosen their actions
+
+        Parameters:
+            turn (int): The turn number, from 1
+            poke1, poke2 (PokemonBase): The Pokemon on the field at the start of the turn
+            action1, action2 (Action): The actions chosen, None if a team could not choose one
+            team1, team2 (PokeTeam): The teams battling
+        """
+
+        self.write(TURN, 0, 0, turn,
+                   poke1.id, poke1.level, STATUS_CODES[poke1.status], 0 if action1 is None else action1.value,
+                   len(team1.team_adt), poke1.hp, poke1.max_hp,
+                   poke2.id, poke2.level, STATUS_CODES[poke2.status], 0 if action2 is None else action2.value,
+                   len(team2.team_adt), poke2.hp, poke2.max_hp)
+
+    def end_battle(self, result: int, turns: int, team1: PokeTeam, team2: PokeTeam) -> None:
+        """
+
+        This method writes the END record of a battle
+
+        Parameters:
+            result (int): The battle result
+            turns (int): The number of turns the battle lasted
+            team1, team2 (PokeTeam): The teams that battled
+        """
+
+        self.write(END, result, 0, turns,
+                   0, 0, 0, 0, len(team1.team_adt), 0, 0,
+                   0, 0, 0, 0, len(team2.team_adt), 0, 0)
+
+    def close(self) -> None:
+        """
+
+        This method writes the turn index trailer and closes the file if the writer opened it
+
+        Complexity analysis:
+            Best/worst case O(b) where b is the number of battles written
+        """
+
+        self.file.write(self.battle_records.tobytes())
+        self.file.write(FOOTER.pack(INDEX_MAGIC, len(self.battle_records)))
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self) -> ReplayWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Replayer:
+    """
+
+    This class reads a replay log through a memory map, finding any turn of any battle from the turn index in constant time
+
+    Instance Attributes:
+        map (mmap): The memory-mapped log
+        records (int): The number of records in the log
+        battle_records (list[int]): The record number of the START record of each battle
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+
+        This is the constructor method for the Replayer Class
+
+        Parameters:
+            path (str): The path of a replay log
+
+        Raises:
+            ValueError: If the file is not a replay log of this format
+
+        Complexity analysis:
+            Best case O(b) where b is the number of battles, reading the trailer
+            Worst case O(r) where r is the number of records, when the log was not closed and has no trailer
+        """
+
+        with open(path, 'rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) < HEADER.size:
+            raise ValueError('Not a replay log')
+        magic, version, record_size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError('Not a replay log of this format')
+        self.battle_records = self.read_index()
+        if self.battle_records is None:
+            # Without the trailer, every whole record is read to find where battles start
+            self.records = (len(self.map) - HEADER.size) // RECORD_SIZE
+            self.battle_records = [number for number in range(self.records) if self.map[self.offset(number)] == START]
+
+    def read_index(self) -> list[int] | None:
+        """ Reads the turn index from the trailer, sets records and returns the START record numbers, None without a trailer """
+        if len(self.map) < HEADER.size + FOOTER.size:
+            return None
+        magic, battles = FOOTER.unpack_from(self.map, len(self.map) - FOOTER.size)
+        index_start = len(self.map) - FOOTER.size - 8 * battles
+        if magic != INDEX_MAGIC or index_start < HEADER.size or (index_start - HEADER.size) % RECORD_SIZE != 0:
+            return None
+        self.records = (index_start - HEADER.size) // RECORD_SIZE
+        index = array('Q')
+        index.frombytes(self.map[index_start:index_start + 8 * battles])
+        return index.tolist()
+
+    @staticmethod
+    def offset(number: int) -> int:
+        """ The byte offset of a record """
+        return HEADER.size + number * RECORD_SIZE
+
+    def record(self, number: int) -> tuple:
+        """ Unpacks a record """
+        return RECORD.unpack_from(self.map, self.offset(number))
+
+    def __len__(self) -> int:
+        """ The number of battles in the log """
+        return len(self.battle_records)
+
+    def end_record(self, battle: int) -> tuple:
+        """
+
+        The END record of a battle
+
+        Raises:
+            ValueError: If the battle was not finished when the log was written
+        """
+
+        start = self.battle_records[battle]
+        stop = self.battle_records[battle + 1] if battle + 1 < len(self.battle_records) else self.records
+        end = self.record(stop - 1)
+        if stop - 1 == start or end[0] != END:
+            raise ValueError(f'Battle {battle} did not finish')
+        return end
+
+    def turns(self, battle: int) -> int:
+        """ The number of turns a battle lasted """
+        return self.end_record(battle)[3]
+
+    def result(self, battle: int) -> int:
+        """ The result of a battle, 1 or 2 for the winning team and 0 for a draw """
+        return self.end_record(battle)[1]
+
+    def frame(self, battle: int, turn: int) -> dict:
+        """
+
+        The state of a battle at the start of a turn, as the battle drew it, and the actions chosen in that turn
+
+        Parameters:
+            battle (int): The battle number, from 0
+            turn (int): The turn number, from 1
+
+        Returns:
+            dict: {'turn', 'team1', 'team2'}, each team being {'pokemon', 'id', 'level', 'status', 'hp', 'max_hp', 'action', 'remaining'}
+
+        Raises:
+            IndexError: If the battle or turn is not in the log
+        """
+
+        start = self.battle_records[battle]
+        if not 1 <= turn <= self.turns(battle):
+            raise IndexError(f'Battle {battle} has no turn {turn}')
+        fields = self.record(start + turn)
+        return {'turn': fields[3], 'team1': self.side(fields[4:11]), 'team2': self.side(fields[11:18])}
+
+    @staticmethod
+    def side(fields: tuple) -> dict:
+        """ The state of one team in a TURN record """
+        poke_id, level, status, action, remaining, hp, max_hp = fields
+        return {'pokemon': SPECIES_BY_ID[poke_id].name, 'id': poke_id, 'level': level, 'status': STATUSES[status],
+                'hp': hp, 'max_hp': max_hp, 'action': Action(action) if action else None, 'remaining': remaining}
+
+    def events(self, battle: int, turn: int) -> dict:
+        """
+
+        What happened to each team during a turn, from the frames of that turn and the next one
+
+        Parameters:
+            battle (int): The battle number, from 0
+            turn (int): The turn number, from 1
+
+        Returns:
+            dict: {'turn', 'team1', 'team2', 'result'}, each team being {'action', 'fainted', 'evolved', 'hp_change', 'status'}:
+                fainted is whether its Pokemon fainted and the next one was sent out. Unless it fainted, swapped or used its special,
+                the same Pokemon is on the field next turn, hp_change and status (before, after) then describe it and evolved is
+                whether it evolved, they are None otherwise. After the last turn only the actions and the battle result are known.
+        """
+
+        frame = self.frame(battle, turn)
+        last = turn == self.turns(battle)
+        after = None if last else self.frame(battle, turn + 1)
+        events = {'turn': turn, 'result': self.result(battle) if last else None}
+        for team in ('team1', 'team2'):
+            before = frame[team]
+            side = {'action': before['action'], 'fainted': None, 'evolved': None, 'hp_change': None, 'status': None}
+            if after is not None:
+                next_side = after[team]
+                # A fainted Pokemon is not returned to its team, the next one is taken out of it
+                side['fainted'] = next_side['remaining'] < before['remaining']
+                if not side['fainted'] and before['action'] not in (Action.SWAP, Action.SPECIAL):
+                    side['evolved'] = next_side['id'] != before['id']
+                    side['hp_change'] = next_side['hp'] - before['hp']
+                    side['status'] = (before['status'], next_side['status'])
+            events[team] = side
+        return events
+
+    def render(self, battle: int, turn: int, renderer=print_game_screen) -> None:
+        """
+
+        Draws the game screen of a turn from the log, without simulating the battle
+
+        Parameters:
+            battle (int): The battle number, from 0
+            turn (int): The turn number, from 1
+            renderer (callable): Draws the frame, taking the same arguments as print_game_screen
+        """
+
+        frame = self.frame(battle, turn)
+        team1, team2 = frame['team1'], frame['team2']
+        renderer(team1['pokemon'], team2['pokemon'], max(team1['hp'], 0), team1['max_hp'], max(team2['hp'], 0), team2['max_hp'],
+                 team1['level'], team2['level'], team1['status'], team2['status'], team1['remaining'], team2['remaining'])
+
+    def close(self) -> None:
+        self.map.close()
+
+    def __enter__(self) -> Replayer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class TestReplay(unittest.TestCase):
+    """ Tests replayed frames against the frames Battle drew, under the same seeds. """
+    SEEDS = [3, 17, 2022]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'battles.pkrp')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def play(self, writer, battles):
+        """ Plays seeded battles in every battle mode, returns the frames each battle drew and its result """
+        played = []
+        for mode in range(3):
+            for seed in self.SEEDS[:battles]:
+                random_gen = RandomGen(seed * 3 + mode)
+                team1 = PokeTeam.random_team('A', mode, criterion=Criterion.HP, random_gen=random_gen)
+                team2 = PokeTeam.random_team('B', mode, criterion=Criterion.SPD, random_gen=random_gen)
+                frames = []
+                battle = Battle(verbosity=RenderPolicy.FULL, renderer=lambda *frame: frames.append(frame), random_gen=random_gen,
+                                replay=writer)
+                played.append((frames, battle.battle(team1, team2)))
+        return played
+
+    def check_frames(self, replayer, played):
+        for number, (frames, result) in enumerate(played):
+            self.assertEqual(replayer.turns(number), len(frames))
+            self.assertEqual(replayer.result(number), result)
+            for turn, frame in enumerate(frames, 1):
+                replayed = []
+                replayer.render(number, turn, renderer=lambda *args: replayed.append(args))
+                self.assertEqual(replayed, [frame], (number, turn))
+                self.assertEqual(replayer.frame(number, turn)['turn'], turn)
+
+    def test_frames(self):
+        with ReplayWriter(self.path) as writer:
+            played = self.play(writer, len(self.SEEDS))
+        with Replayer(self.path) as replayer:
+            self.assertEqual(len(replayer), len(played))
+            self.check_frames(replayer, played)
+
+    def test_unclosed_log(self):
+        writer = ReplayWriter(self.path)
+        played = self.play(writer, 1)
+        # A battle cut short, and no trailer
+        team = PokeTeam('C', [1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        writer.start_battle(team, team)
+        writer.write_turn(1, team.retrieve_pokemon(), team.retrieve_pokemon(), Action.ATTACK, Action.ATTACK, team, team)
+        writer.file.flush()
+        try:
+            with Replayer(self.path) as replayer:
+                self.assertEqual(len(replayer), len(played) + 1)
+                self.check_frames(replayer, played)
+                with self.assertRaises(ValueError):
+                    replayer.turns(len(played))
+        finally:
+            writer.file.close()
+
+    def test_out_of_range(self):
+        with ReplayWriter(self.path) as writer:
+            played = self.play(writer, 1)
+        with Replayer(self.path) as replayer:
+            turns = replayer.turns(0)
+            for battle, turn in ((0, 0), (0, turns + 1), (len(played), 1)):
+                with self.assertRaises(IndexError):
+                    replayer.frame(battle, turn)
+
+
+if __name__ == '__main__':
+    testtorun = TestReplay()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
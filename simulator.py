@@ -0,0 +1,95 @@
+"""
+Bulk Monte Carlo simulation of battles between two team compositions.
+
+Battles are independent, so they are fanned out over a process pool. Battle i is always
+played on substream i of the simulation seed's RandomGen stream, which makes the
+aggregated results identical whatever the number of workers or the chunking.
+
+Usage:
+```
+spec_a = {"team_name": "A", "team_numbers": [2, 2, 1, 1, 0], "battle_mode": 1, "ai_type": "ALWAYS_ATTACK"}
+spec_b = {"team_name": "B", "team_numbers": [0, 1, 1, 2, 2], "battle_mode": 2, "ai_type": "RANDOM", "criterion": "HP"}
+simulate(spec_a, spec_b, 10000, workers=4, seed=123)
+```
+"""
+from __future__ import annotations
+
+__author__ = "Code by Daniel Liu, Ben Abraham, Johnny Ta, Bangze Han"
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from battle import Battle
+from poke_team import PokeTeam
+from random_gen import RandomGen
+
+def run_battles(team_spec_a: dict, team_spec_b: dict, seed: int, start: int, stop: int) -> tuple[list[int], dict[int, int]]:
+    """
+    Plays battles start..stop-1 between the two specs.
+
+    :returns: ([draws, wins of a, wins of b], {turns: number of battles that lasted that many turns})
+    Complexity: O((stop - start) * B) where B is the cost of a battle
+    """
+    stream = RandomGen(seed)
+    battle = Battle()
+    team_a = PokeTeam.from_spec(team_spec_a)
+    team_b = PokeTeam.from_spec(team_spec_b)
+    outcomes = [0, 0, 0]
+    turns = {}
+    for index in range(start, stop):
+        # O(log index) jump to the battle's own substream
+        battle.random_gen = stream.substream(index)
+        team_a.regenerate_team()
+        team_b.regenerate_team()
+        team_a.num_heals = 0
+        team_b.num_heals = 0
+        outcomes[battle.battle(team_a, team_b)] += 1
+        turns[battle.turns] = turns.get(battle.turns, 0) + 1
+    return outcomes, turns
+
+
+def simulate(team_spec_a: dict, team_spec_b: dict, n: int, workers: int | None = None, seed: int = 0, chunk_size: int | None = None) -> dict:
+    """
+    Plays n independent battles between two team specs (see PokeTeam.from_spec).
+
+    :param workers: number of processes, os.cpu_count() when None, 1 plays every battle in this process
+    :param seed: seed of the stream every battle's substream is split from
+    :param chunk_size: battles handed to a worker at a time, about 4 chunks per worker when None
+    :returns: {"battles", "wins", "draws", "losses", "turns"} where wins/losses are from team a's side
+        and turns maps a battle length to how many battles lasted that many turns, in increasing order
+    Complexity: O(n * B / workers) where B is the cost of a battle
+    """
+    if n < 0:
+        raise ValueError('n must not be negative')
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-n // (workers * 4)))
+    bounds = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+    if workers == 1 or len(bounds) <= 1:
+        results = [run_battles(team_spec_a, team_spec_b, seed, start, stop) for start, stop in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_battles, team_spec_a, team_spec_b, seed, start, stop) for start, stop in bounds]
+            results = [future.result() for future in futures]
+
+    outcomes = [0, 0, 0]
+    turns = {}
+    for chunk_outcomes, chunk_turns in results:
+        for i in range(3):
+            outcomes[i] += chunk_outcomes[i]
+        for length, count in chunk_turns.items():
+            turns[length] = turns.get(length, 0) + count
+    return {
+        "battles": n,
+        "wins": outcomes[1],
+        "draws": outcomes[0],
+        "losses": outcomes[2],
+        "turns": dict(sorted(turns.items())),
+    }
+
+
+if __name__ == "__main__":
+    spec_a = {"team_name": "A", "team_numbers": [2, 2, 1, 1, 0], "battle_mode": 1, "ai_type": "ALWAYS_ATTACK"}
+    spec_b = {"team_name": "B", "team_numbers": [0, 1, 1, 2, 2], "battle_mode": 2, "ai_type": "RANDOM", "criterion": "HP"}
+    print(simulate(spec_a, spec_b, 2000, seed=123))
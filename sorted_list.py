@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
 T = TypeVar('T')
 K = TypeVar('K')
 
@@ -47,6 +47,11 @@ class SortedList(ABC, Generic[T]):
         """ Return the size of the list. """
         return self.length
 
+    def __iter__(self) -> Iterator[ListItem]:
+        """ Iterate over the items in sorted order, without copying or removing them. """
+        for i in range(len(self)):
+            yield self[i]
+
     def __str__(self) -> str:
         """ Magic method constructing a string representation of the list object. """
         result = '['
@@ -8,7 +8,7 @@ __docformat__ = 'reStructuredText'
 
 import unittest
 from abc import ABC, abstractmethod 
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Iterator
 from referential_array import ArrayR, T
 
 class Stack(ABC, Generic[T]):
@@ -101,6 +101,15 @@ class ArrayStack(Stack[T]):
             raise Exception("Stack is empty")
         return self.array[self.length-1]
 
+    def __iter__(self) -> Iterator[T]:
+        """ Yields the elements from top to bottom (the order pop would return them),
+        reading the array in place without copying or popping.
+        The stack must not be changed while iterating.
+        :complexity: O(1) per element, O(n) for the whole stack
+        """
+        for index in range(self.length - 1, -1, -1):
+            yield self.array[index]
+
 class TestStack(unittest.TestCase):
     """ Tests for the above class."""
     EMPTY = 0
@@ -179,6 +188,15 @@ class TestStack(unittest.TestCase):
             for i in range(nitems-1, -1, -1):
                 self.assertEqual(stack.pop(), i)
                 
+    def test_iter(self):
+        """ Tests iteration goes top to bottom and leaves the stack unchanged."""
+        for stack, length in zip(self.stacks, self.lengths):
+            self.assertEqual(list(stack), list(range(length - 1, -1, -1)))
+            self.assertEqual(len(stack), length)
+        self.large_stack.pop()
+        self.large_stack.push(42)
+        self.assertEqual(list(self.large_stack)[:2], [42, self.LARGE - 2])
+
     def test_clear(self):
         for stack in self.stacks:
             stack.clear()
@@ -1,11 +1,18 @@
 from __future__ import annotations
-from stack_adt import ArrayStack
+import io
+import os
+import re
+import unittest
+from unittest import mock
+from typing import Iterable, Iterator, TextIO
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from linked_list import LinkedList
 from battle import Battle
 from poke_team import PokeTeam
+from random_gen import RandomGen
 """
 
-This file demonstrates the implementation of the Tournament class
+This file demonstrates the implementation of the Tournament class, also defining UnitTests for compiling and running tournaments
 
 September 2022
 
@@ -22,6 +29,166 @@ All methods have a best/worst case time complexity O(1), constant time unless ot
 # Various imports needed to facilitate the Tournament class implementation
 
 
+class Bracket:
+    """
+    A tournament string compiled once into its match schedule. Players hold slots, and every match is a pair of slots whose
+    winner takes the first one, so playing the matches in order plays the postfix tournament string.
+
+    Instance Attributes:
+        players (list[str]): The player names, in the order they appear in the tournament string (slot i is players[i])
+        matches (list[tuple[int, int]]): The (slot of player 1, slot of player 2) of each match, in the order they are played
+    """
+
+    def __init__(self, players: list[str], matches: list[tuple[int, int]]) -> None:
+        """
+        This is the constructor for the Bracket class
+
+        Parameters:
+            players (list[str]): The player names by slot
+            matches (list[tuple[int, int]]): The slots fighting in each match, in play order
+        """
+
+        self.players = players
+        self.matches = matches
+
+    # A token of a tournament string: a player name or '+'
+    TOKEN = re.compile(r'\S+')
+    # Characters read at a time from a file
+    CHUNK_SIZE = 1 << 16
+
+    @classmethod
+    def tokenize(cls, source: str | TextIO | Iterable[str]) -> Iterator[tuple[int, str]]:
+        """
+        Splits a tournament string into its tokens in a single pass, reading a file or iterator of strings chunk by chunk
+
+        Parameters:
+            source (str, file or iterable of str): The tournament string, a text file holding it, or its consecutive pieces
+                (a token may be split across two pieces)
+
+        Returns:
+            Iterator[tuple[int, str]]: (position, token) for each token, position being the offset of its first character
+
+        Complexity analysis:
+            Best/worst case O(n) where n is the length of the tournament string, with memory for one chunk and one token
+        """
+
+        if isinstance(source, str):
+            chunks = (source,)
+        elif hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(cls.CHUNK_SIZE), '')
+        else:
+            chunks = source
+        # A token running to the end of a chunk may continue in the next one
+        pending = ''
+        pending_start = 0
+        offset = 0
+        for chunk in chunks:
+            if pending and chunk[:1].isspace():
+                yield pending_start, pending
+                pending = ''
+            for match in cls.TOKEN.finditer(chunk):
+                token_start, token = offset + match.start(), match.group()
+                if pending:
+                    token_start, token = pending_start, pending + token
+                    pending = ''
+                if match.end() == len(chunk):
+                    pending, pending_start = token, token_start
+                else:
+                    yield token_start, token
+            offset += len(chunk)
+        if pending:
+            yield pending_start, pending
+
+    @classmethod
+    def validate(cls, source: str | TextIO | Iterable[str]) -> None:
+        """
+        Checks a tournament string in a single pass, only counting the players still in the tournament
+
+        Parameters:
+            source (str, file or iterable of str): The tournament string, see tokenize
+
+        Raises:
+            ValueError: Giving the position of the first '+' without two players before it, or if the string does not
+                end with exactly one player left
+
+        Complexity analysis:
+            Best/worst case O(n) where n is the length of the tournament string, with O(1) memory
+        """
+
+        depth = 0
+        for position, token in cls.tokenize(source):
+            if token != '+':
+                depth += 1
+            elif depth < 2:
+                raise ValueError(f"Tournament string is not valid: '+' at position {position} does not have two players before it")
+            else:
+                depth -= 1
+        if depth != 1:
+            raise ValueError(f"Tournament string is not valid: {depth} players left at the end, expected 1")
+
+    @classmethod
+    def compile(cls, source: str | TextIO | Iterable[str]) -> Bracket:
+        """
+        Compiles a postfix tournament string, validating and evaluating it in a single pass with a stack of slots
+
+        Parameters:
+            source (str, file or iterable of str): Player names and '+' separated by whitespace, each '+' is a battle between
+                the two results before it, see tokenize
+
+        Returns:
+            bracket (Bracket): The compiled bracket
+
+        Raises:
+            ValueError: As validate does
+
+        Complexity analysis:
+            Best/worst case O(n) where n is the length of the tournament string, the stack only grows with the bracket depth
+        """
+
+        players = []
+        matches = []
+        slots = []
+        for position, token in cls.tokenize(source):
+            if token == '+':
+                if len(slots) < 2:
+                    raise ValueError(f"Tournament string is not valid: '+' at position {position} does not have two players before it")
+                player2 = slots.pop()
+                player1 = slots[-1]
+                # The winner of the match stays in player 1's slot
+                matches.append((player1, player2))
+            else:
+                slots.append(len(players))
+                players.append(token)
+        if len(slots) != 1:
+            raise ValueError(f"Tournament string is not valid: {len(slots)} players left at the end, expected 1")
+        return cls(players, matches)
+
+
+def play_match(team_spec_1: dict, heals_1: int, team_spec_2: dict, heals_2: int, seed: int, index: int) -> tuple[int, int, int]:
+    """
+    Plays match `index` of a seeded tournament on its own substream, as advance_tournament does, for a worker process
+
+    Parameters:
+        team_spec_1, team_spec_2 (dict): The specs of the two teams (see PokeTeam.from_spec)
+        heals_1, heals_2 (int): The heals each team has used so far
+        seed (int): The match seed of the tournament
+        index (int): The index of the match in the bracket
+
+    Returns:
+        (res, heals_1, heals_2) (tuple): The battle result and the heals each team has used after it
+
+    Complexity analysis:
+        Best/worst case O(B + log index) where B is the cost of battling
+    """
+
+    team1 = PokeTeam.from_spec(team_spec_1)
+    team2 = PokeTeam.from_spec(team_spec_2)
+    team1.num_heals = heals_1
+    team2.num_heals = heals_2
+    res = Battle(random_gen=RandomGen(seed).substream(index)).battle(team1, team2)
+    return res, team1.num_heals, team2.num_heals
+
+
 class Tournament:
     """
     This is the class representing the Tournament object, essentially referring to the tournament in which Pokemon trainers compete in alongside their respective Pokemon 
@@ -30,15 +197,23 @@ class Tournament:
     Instance Attributes:
         battle_poke (Battle): A Battle instance that is used to create the individual battles in each tournament
         battle_mode (None): A battle mode that needs to be specified in order to determine how the pokemon team will be organised/modified/maintained.
-        tournament_adt (None): A tournament abstract data type to hold the remaining players within the tournament.
+        bracket (Bracket): The compiled tournament string, None before the tournament starts
+        teams (list[PokeTeam]): The team in each bracket slot, a slot holds the winner of its latest match
+        next_match (int): The index in bracket.matches of the next match to play
+        match_seed (int): With a random_gen, its seed once the teams are generated, match i is then played on substream i of it
+        random_gen (RandomGen): The random stream generating the teams, None for the default stream
     """
 
-    def __init__(self, battle: Battle | None = None) -> None:
+    # The name of the type at each index of team_numbers, i.e. of bit i of a type mask
+    TYPE_NAMES = ['FIRE', 'GRASS', 'WATER', 'GHOST', 'NORMAL']
+
+    def __init__(self, battle: Battle | None = None, random_gen: RandomGen | None = None) -> None:
         """
         This is the constructor for the Tournament class
 
         Parameters:
             battle (Battle): A Battle instance that is passed on to create the individual battles within a tournament
+            random_gen (RandomGen): The random stream generating the teams, also used by the battles when battle is not given
         Returns:
             None
         Complexity analysis:
@@ -49,9 +224,13 @@ class Tournament:
         # Create Battle instance if it doesn't exist
         self.battle_poke = battle
         if not battle:
-            self.battle_poke = Battle()
+            self.battle_poke = Battle(random_gen=random_gen)
+        self.random_gen = random_gen
         self.battle_mode = None
-        self.tournament_adt = None
+        self.bracket = None
+        self.teams = []
+        self.next_match = 0
+        self.match_seed = None
 
     def set_battle_mode(self, battle_mode: int) -> None:
         """
@@ -66,78 +245,53 @@ class Tournament:
 
         self.battle_mode = battle_mode
 
-    def is_valid_tournament(self, tournament_str: str) -> bool:
+    def is_valid_tournament(self, tournament_str: str | TextIO | Iterable[str]) -> bool:
         """
         This is a method that checks that the tournament string that is passed through is a valid string i.e each player has an opponent to fight against
 
         Parameters:
-            tournament_str (string): A string that represents the input of the structure of the tournament's battles, can be both in valid or invalid formats
+            tournament_str (string): A string that represents the input of the structure of the tournament's battles, can be both in valid or invalid formats,
+                or a file or iterator of strings holding it (see Bracket.tokenize)
 
         Returns:
             True or False (bool): A boolean value that is True when the tournament string is valid, and False when the tournamnet string is invalid
 
         Complexity analysis:
-            Best case O(n * comp(==)) where n is the length of the tournament_str
-            Worst case O(n * comp(==)) where n is the length of the tournament_str
-        """
-
-        array_stack = ArrayStack(len(tournament_str))
-        # Push first letter
-        # We assume that the first character is a letter and push player onto the stack (represented by 1)
-        array_stack.push(1)
-        had_first_letter = True
-        for i in range(len(tournament_str)):
-            # When the length of the stack is less than 1 there will be no winner so it is not valid
-            if len(array_stack) < 1:
-                return False
-            if tournament_str[i] == '+':  # A plus represents that there should be a winner
-                array_stack.pop()  # We pop 1 person because 1 of them should lose
-            # If the tournament string is a letter or _
-            # if the character is a letter and has not had a first letter, it is a new player.
-            elif tournament_str[i] != '+' and tournament_str[i] != ' ' and not had_first_letter:
-                array_stack.push(1)  # push new player onto stack
-                # set as true to represent the first letter of that player as being accounted for
-                had_first_letter = True
-            # if the character is a space then the next character can be a new player or a plus
-            elif tournament_str[i] == ' ':
-                had_first_letter = False  # Therefore, set had_first_letter to false
-        # if the loop iterates through the whole string and has more than 1 length, it is valid.
+            Best/worst case O(n) where n is the length of the tournament_str, only the number of players left is kept
+        """
+
+        try:
+            Bracket.validate(tournament_str)
+        except ValueError:
+            return False
         return True
 
-    def start_tournament(self, tournament_str: str) -> None:
+    def start_tournament(self, tournament_str: str | TextIO | Iterable[str]) -> None:
         """
 
-        This is the method which begins the Tournament by generating teams based on the tournament string input and inputting the teams and their respective match-ups into LinkedList
+        This is the method which begins the Tournament by compiling the tournament string input into a Bracket and generating a team for each of its players
 
         Parameters:
-            tournament_str (string): A string that represents the players in the tournament and the respective battles that they will be fighting in
+            tournament_str (string): A string that represents the players in the tournament and the respective battles that they will be fighting in,
+                or a file or iterator of strings holding it (see Bracket.tokenize)
 
         Returns:
             None
 
+        Raises:
+            ValueError: If the tournament string is not valid, giving the offending position
+
         Complexity analysis:
-            Best case O(n * comp(==) + m * comp(==)) where n is the length of the tournament_str and m is the cost of splitting a string
-            Worst case O(n * comp(==) + m * comp(==)) where n is the length of the tournament_str and m is the cost of splitting a string
-        """
-
-        if self.is_valid_tournament(tournament_str):
-            # setting the tournament_adt instance attribute to equal a LinkedList ADT object
-            self.tournament_adt = LinkedList()
-            counter = 0
-            # Iterating through a list that is created by splitting the tournamenet string input by its " "
-            for player_name in tournament_str.split():
-                if player_name != '+':  # If player_name is not an "+"
-                    team = PokeTeam.random_team(player_name, self.battle_mode)
-                    # Inserting the counter variable as a node and the team as its value
-                    self.tournament_adt.insert(counter, team)
-                    counter += 1
-                # If the player_name == '+'
-                else:
-                    # Inserting the counter variable as a node but this time the value is a + sign
-                    self.tournament_adt.insert(counter, '+')
-                    counter += 1
-        else:
-            raise ValueError("Tournament string is not valid")
+            Best/worst case O(n + p * T) where n is the length of the tournament_str, p the number of players and T the cost of random_team
+        """
+
+        # Compile the string once, in the same pass that validates it, advancing then only follows the match schedule
+        self.bracket = Bracket.compile(tournament_str)
+        self.teams = [PokeTeam.random_team(player_name, self.battle_mode, random_gen=self.random_gen)
+                      for player_name in self.bracket.players]
+        self.next_match = 0
+        # Every match gets its own substream, so matches can be played in any order (or in parallel)
+        self.match_seed = None if self.random_gen is None else self.random_gen.seed
 
     def advance_tournament(self) -> tuple[PokeTeam, PokeTeam, int] | None:
         """
@@ -150,52 +304,201 @@ class Tournament:
         Returns:
             tuple(player1, player2, res) (tuple): A tuple containing the two Poketeams that fought in a battle and the integer result for battle
 
+        Raises:
+            ValueError: If the tournament has not been started
+
         Complexity:
-            Best case O(B+P) where B is the cost of battling, P is the num of poke in party
+            Best case O(1) when every match has been played
             Worst case O(B+P) where B is the cost of battling, P is the num of poke in party
         """
 
-        try:
-            # Finds the first '+' available in the LinkedList
-            index_first_plus = self.tournament_adt.index('+')
-        except ValueError:
-            # If it can't find a +
+        if self.bracket is None:
+            raise ValueError("The tournament has not been started, call start_tournament first")
+        if self.next_match == len(self.bracket.matches):
             return None
-        else:  # If it does find a +
-            # LinkedList structure => [player1, player2, '+'] etc
-            # Finds first player to do the battling
-            player1 = self.tournament_adt[index_first_plus-2]
-            # Finds the respective opponent for player1, that is player2
-            player2 = self.tournament_adt[index_first_plus-1]
-            player1.regenerate_team()
-            player2.regenerate_team()
-            # Uses the battle method to get a result from Player1 and Player2 Battling
-            res = self.battle_poke.battle(
-                player1, player2)  # Both players battle
-            # If player 2 wins, insert player 2 into the original position of player 1. Also store player 1's team_numbers as player_2 defeated it.
-            if res == 2:
-                self.tournament_adt[index_first_plus - 2] = player2
-                if player2.poke_teams_beat is None:
-                    player2.poke_teams_beat = player1.team_numbers
-                    player1.poke_teams_beat = [0, 0, 0, 0, 0]
-                else:
-                    player2.poke_teams_beat = [
-                        player2.poke_teams_beat + player1.team_numbers for _ in range(5)]
-            # If player 1 wins or draws, no need to insert player 1 as its already in its correct position but store player2 team_numbers as player_1 defeated it.
-            else:
-                if player1.poke_teams_beat is None:
-                    player1.poke_teams_beat = player2.team_numbers
-                    player2.poke_teams_beat = [0, 0, 0, 0, 0]
-                else:
-                    player1.poke_teams_beat = [
-                        player1.poke_teams_beat + player2.team_numbers for _ in range(5)]
+        # The next match of the schedule, both its slots are decided by now
+        index = self.next_match
+        self.next_match += 1
+        slot1, slot2 = self.bracket.matches[index]
+        player1 = self.teams[slot1]
+        player2 = self.teams[slot2]
+        player1.regenerate_team()
+        player2.regenerate_team()
+        battle_stream = self.battle_poke.random_gen
+        if self.match_seed is not None:
+            self.battle_poke.random_gen = RandomGen(self.match_seed).substream(index)
+        # Uses the battle method to get a result from Player1 and Player2 Battling
+        res = self.battle_poke.battle(
+            player1, player2)  # Both players battle
+        self.battle_poke.random_gen = battle_stream
+        return self.record_result(index, res)
+
+    def record_result(self, index: int, res: int) -> tuple[PokeTeam, PokeTeam, int]:
+        """
 
-            # Either way, delete 2 things in linked list after first player (losing player and +).
-            # Deletes the first item
-            self.tournament_adt.delete_at_index(index_first_plus-1)
-            # Deletes the +
-            self.tournament_adt.delete_at_index(index_first_plus-1)
-            return (player1, player2, res)
+        This is the method which records the result of a match: the winner takes the first slot of the match and the teams it has beaten are updated
+
+        Parameters:
+            index (int): The index of the match in the bracket
+            res (int): The battle result, 2 if player 2 won
+
+        Returns:
+            tuple(player1, player2, res) (tuple): A tuple containing the two Poketeams that fought in a battle and the integer result for battle
+        """
+
+        slot1, slot2 = self.bracket.matches[index]
+        player1 = self.teams[slot1]
+        player2 = self.teams[slot2]
+        # If player 2 wins, it takes player 1's slot and adds player 1's types to the types it has beaten.
+        if res == 2:
+            self.teams[slot1] = player2
+            player2.poke_teams_beat = player2.poke_teams_beat.union(player1.type_mask())
+        # If player 1 wins or draws, it keeps its slot and adds player 2's types to the types it has beaten.
+        else:
+            player1.poke_teams_beat = player1.poke_teams_beat.union(player2.type_mask())
+        return (player1, player2, res)
+
+    def run_tournament(self, parallel: bool = False, workers: int | None = None) -> LinkedList[tuple[PokeTeam, PokeTeam]]:
+        """
+
+        This is the method which plays every remaining match, giving the same LinkedList as linked_list_of_games
+
+        With parallel, each match is sent to a process pool as soon as the matches deciding both of its players are done.
+        A tournament with a random_gen plays match i on substream i of its match seed either way, so the results are the same
+        as serial ones. The workers play with a plain headless Battle, and rebuild the teams from their specs.
+
+        Parameters:
+            parallel (bool): Whether to play independent matches in parallel
+            workers (int): The number of processes, os.cpu_count() when None, 1 plays every match in this process
+
+        Returns:
+            LinkedList[tuple[PokeTeam, PokeTeam]] (LinkedList): The matchups, the very first one at the end
+
+        Raises:
+            ValueError: If the tournament has not been started, or parallel and the tournament has no random_gen, or a team needs user input
+
+        Complexity:
+            Best/worst case O(M * B / workers) where M is the total number of matches and B is the cost of battling
+        """
+
+        if self.bracket is None:
+            raise ValueError("The tournament has not been started, call start_tournament first")
+        workers = workers or os.cpu_count() or 1
+        if not parallel or workers == 1:
+            return self.linked_list_of_games()
+        if self.match_seed is None:
+            raise ValueError("A parallel tournament needs a random_gen")
+        if any(team.ai_type == PokeTeam.AI.USER_INPUT for team in self.teams):
+            raise ValueError("Teams asking for user input cannot be played in parallel")
+
+        matches = self.bracket.matches
+        first = self.next_match
+        # The bracket DAG: a match waits for the latest earlier matches of both of its slots
+        waiting = [0] * len(matches)
+        dependents = [[] for _ in matches]
+        last_match = {}
+        for index in range(first, len(matches)):
+            for slot in matches[index]:
+                if slot in last_match:
+                    waiting[index] += 1
+                    dependents[last_match[slot]].append(index)
+            last_match[matches[index][0]] = index
+
+        games = [None] * len(matches)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            running = {}
+
+            def submit(index):
+                player1 = self.teams[matches[index][0]]
+                player2 = self.teams[matches[index][1]]
+                future = pool.submit(play_match, player1.to_spec(), player1.num_heals,
+                                     player2.to_spec(), player2.num_heals, self.match_seed, index)
+                running[future] = index
+
+            for index in range(first, len(matches)):
+                if waiting[index] == 0:
+                    submit(index)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    res, heals_1, heals_2 = future.result()
+                    self.teams[matches[index][0]].num_heals = heals_1
+                    self.teams[matches[index][1]].num_heals = heals_2
+                    games[index] = self.record_result(index, res)
+                    for dependent in dependents[index]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            submit(dependent)
+        self.next_match = len(matches)
+
+        l = LinkedList()
+        for index in range(first, len(matches)):
+            # Inserts at index 0 so the very first matchup will be at the end of the LinkedList.
+            l.insert(0, games[index][:2])
+        return l
+
+    def iter_games(self) -> Iterator[tuple[PokeTeam, PokeTeam, int]]:
+        """
+
+        This is the generator which plays the remaining matches one at a time, yielding each as soon as it is played
+
+        Parameters:
+            None
+
+        Returns:
+            Iterator[tuple[PokeTeam, PokeTeam, int]]: (player1, player2, res) for each match, in the order they are played
+
+        Complexity:
+            Best/worst case O(B) per match where B is the cost of battling, with O(1) memory kept for results
+        """
+
+        while True:
+            res = self.advance_tournament()
+            if res is None:
+                return
+            yield res
+
+    def iter_games_with_metas(self) -> Iterator[tuple[PokeTeam, PokeTeam, int, list[str]]]:
+        """
+
+        This is the generator which plays the remaining matches one at a time, yielding each with its metas (see linked_list_with_metas)
+
+        Parameters:
+            None
+
+        Returns:
+            Iterator[tuple[PokeTeam, PokeTeam, int, list[str]]]: (player1, player2, res, metas) for each match, in the order they are played
+
+        Complexity:
+            Best/worst case O(B) per match where B is the cost of battling, with O(1) memory kept for results
+        """
+
+        for player1, player2, res in self.iter_games():
+            yield player1, player2, res, self.missing_types(player1, player2)
+
+    def missing_types(self, poke_team_1: PokeTeam, poke_team_2: PokeTeam) -> list[str]:
+        """
+
+        This method returns the names of the types in a team either of the two teams has beaten, but in neither of the two teams
+
+        Parameters:
+            poke_team_1, poke_team_2 (PokeTeam): The two teams of a match
+
+        Returns:
+            list[str]: The type names, in team_numbers order
+
+        Complexity:
+            Best/worst case O(1), the types are compared as BSet masks
+        """
+
+        beaten = poke_team_1.poke_teams_beat.union(poke_team_2.poke_teams_beat)
+        missing = beaten.difference(poke_team_1.type_mask().union(poke_team_2.type_mask()))
+        lst_strings = []
+        for i in range(len(self.TYPE_NAMES)):
+            if i + 1 in missing:
+                lst_strings.append(self.TYPE_NAMES[i])
+        return lst_strings
 
     def linked_list_of_games(self) -> LinkedList[tuple[PokeTeam, PokeTeam]]:
         """
@@ -214,12 +517,9 @@ class Tournament:
         """
 
         l = LinkedList()
-        while True:
-            res = self.advance_tournament()
-            if res is None:
-                break
+        for player1, player2, _ in self.iter_games():
             # Inserts at index 0 so the very first matchup will be at the end of the LinkedList.
-            l.insert(0, (res[0], res[1]))
+            l.insert(0, (player1, player2))
         return l
 
     def linked_list_with_metas(self) -> LinkedList[tuple[PokeTeam, PokeTeam, list[str]]]:
@@ -235,38 +535,90 @@ class Tournament:
             LinkedList[tuple[PokeTeam, PokeTeam, list[str]]]
 
         Complexity:
-            Worst case O(M * P) where M is the total number of matches and P is the number of poke in team
-            Worst case O(M * P) where M is the total number of matches and P is the number of poke in team
+            Best/worst case O(M) where M is the total number of matches, the types are compared as BSet masks
         """
 
         l = LinkedList()
-        while True:
-            res = self.advance_tournament()
-            if res is None:
-                break
-
-            poke_team_1 = res[0]
-            poke_team_2 = res[1]
-
-            poke_team_lst_1 = poke_team_1.team_numbers
-            poke_team_lst_2 = poke_team_2.team_numbers
-
-            lst_strings = []
-            for i in range(5):
-                # Checks whether any of the two teams don't have a particular pokemon type
-                if poke_team_lst_1[i] == 0 and poke_team_lst_2[i] == 0:
-                    # Check whether the other teams that have been beat had that particular pokemon type
-                    if poke_team_1.poke_teams_beat[i] != 0 or poke_team_2.poke_teams_beat[i] != 0:
-                        if i == 0:
-                            lst_strings.append('FIRE')
-                        elif i == 1:
-                            lst_strings.append('GRASS')
-                        elif i == 2:
-                            lst_strings.append('WATER')
-                        elif i == 3:
-                            lst_strings.append('GHOST')
-                        else:
-                            lst_strings.append("NORMAL")
-
+        for poke_team_1, poke_team_2, _, lst_strings in self.iter_games_with_metas():
             l.insert(0, (poke_team_1, poke_team_2, lst_strings))
         return l
+
+
+class TestTournament(unittest.TestCase):
+    """ Tests compiling tournament strings, whatever pieces they are read in, and parallel tournaments against serial ones. """
+    TEXT = "Roark Gardenia + Maylene Crasher_Wake + + Fantina Byron + Candice Volkner + + +"
+
+    def compiled(self, source) -> tuple[list[str], list[tuple[int, int]]]:
+        bracket = Bracket.compile(source)
+        return bracket.players, bracket.matches
+
+    def test_sources(self):
+        expected = self.compiled(self.TEXT)
+        self.assertEqual(len(expected[0]), 8)
+        self.assertEqual(len(expected[1]), 7)
+        # Pieces of every size split tokens, and the whitespace between them, at every position
+        for size in range(1, 8):
+            with self.subTest(size=size):
+                pieces = iter([self.TEXT[i:i + size] for i in range(0, len(self.TEXT), size)])
+                self.assertEqual(self.compiled(pieces), expected)
+                with mock.patch.object(Bracket, 'CHUNK_SIZE', size):
+                    self.assertEqual(self.compiled(io.StringIO(self.TEXT)), expected)
+        self.assertEqual(self.compiled(iter(["Roark Gard", "", "enia", " +", "  Maylene Crasher_Wake + +",
+                                             " Fantina Byron + Candice Volkner + + +"])), expected)
+
+    def test_error_positions(self):
+        for source in ("A B + +", iter(["A B", " + ", "+"])):
+            with self.assertRaisesRegex(ValueError, "'\\+' at position 6 "):
+                Bracket.compile(source)
+        with self.assertRaisesRegex(ValueError, "'\\+' at position 6 "):
+            Bracket.validate("A B + +")
+        for text in ("A B C +", "A B C D +"):
+            left = len(text.split()) - 2
+            with self.assertRaisesRegex(ValueError, f" {left} players left at the end"):
+                Bracket.compile(text)
+            with self.assertRaisesRegex(ValueError, f" {left} players left at the end"):
+                Bracket.validate(text)
+
+    def test_is_valid_tournament(self):
+        tournament = Tournament()
+        self.assertTrue(tournament.is_valid_tournament(self.TEXT))
+        self.assertTrue(tournament.is_valid_tournament("A B +"))
+        self.assertFalse(tournament.is_valid_tournament("A B"))
+        self.assertFalse(tournament.is_valid_tournament("A B + +"))
+        self.assertFalse(tournament.is_valid_tournament(""))
+
+    def played(self, battle_mode: int, seed: int, parallel: bool) -> tuple[list, list]:
+        """ Runs a seeded tournament, returns its matchups in play order and the types each team has beaten """
+        tournament = Tournament(random_gen=RandomGen(seed))
+        tournament.set_battle_mode(battle_mode)
+        tournament.start_tournament(self.TEXT)
+        teams = list(tournament.teams)
+        games = tournament.run_tournament(parallel=parallel, workers=2)
+        # Serial battles leave the teams as their last battle did, the workers never touch them
+        for team in teams:
+            team.regenerate_team()
+        matchups = [(str(games[i][0]), str(games[i][1])) for i in range(len(games) - 1, -1, -1)]
+        beaten = [[kind for kind in range(1, len(Tournament.TYPE_NAMES) + 1) if kind in team.poke_teams_beat] for team in teams]
+        return matchups, beaten
+
+    def test_parallel(self):
+        for battle_mode in (0, 1):
+            for seed in (7, 2022):
+                with self.subTest(battle_mode=battle_mode, seed=seed):
+                    serial = self.played(battle_mode, seed, False)
+                    self.assertEqual(len(serial[0]), 7)
+                    self.assertEqual(self.played(battle_mode, seed, True), serial)
+
+    def test_not_started(self):
+        tournament = Tournament(random_gen=RandomGen(7))
+        for parallel in (False, True):
+            with self.assertRaises(ValueError):
+                tournament.run_tournament(parallel=parallel, workers=2)
+        with self.assertRaises(ValueError):
+            tournament.advance_tournament()
+
+
+if __name__ == '__main__':
+    testtorun = TestTournament()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -1,11 +1,15 @@
 from __future__ import annotations
+import json
+import os
+import tempfile
+import unittest
 from random_gen import RandomGen
 from queue_adt import CircularQueue
 from battle import Battle
 from poke_team import PokeTeam, Criterion
 """
 
-This is the file that demonstrates the implementation of the BattleTower
+This is the file that demonstrates the implementation of the BattleTower, also defining UnitTests for resuming a tower from a snapshot
 
 September 2022
 
@@ -31,19 +35,34 @@ class BattleTower:
     Instance Attributes:
         tower (none)/(CircularQueue): Initially set to none, but each instantiation (via it's generate teams method) changes it to a CircularQueue
         battle (battle) : A Battle object that is used to create the individual battles within the Tower
+        random_gen (RandomGen): The random stream generating the teams and lives, None for the default stream
+        rounds (int): The number of battles played in the tower so far
+        checkpoint_every (int): Save a snapshot every this many rounds, 0 to never save one automatically
+        checkpoint_path (str): The file the automatic snapshots are saved to (see save)
     """
 
-    def __init__(self, battle: Battle | None = None) -> None:
+    # Version of the snapshot format
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, battle: Battle | None = None, random_gen: RandomGen | None = None) -> None:
         """
 
         This is the constructor method of the BattleTower Class 
 
         Paramaters:
             battle (Battle): A Battle object used to create individual battles within the Tower game format
+            random_gen (RandomGen): The random stream generating the teams and lives, also used by the battles when battle is not given
         """
 
         self.tower = None
+        self.my_team = None
         self.battle = battle
+        if not battle:
+            self.battle = Battle(random_gen=random_gen)
+        self.random_gen = random_gen
+        self.rounds = 0
+        self.checkpoint_every = 0
+        self.checkpoint_path = None
 
     def set_my_team(self, team: PokeTeam) -> None:
         """
@@ -76,13 +95,14 @@ class BattleTower:
         """
 
         if n >= 1:  # Makes it user facing as it validates for the number of randomly generated teams
+            random_gen = RandomGen.default if self.random_gen is None else self.random_gen
             tower = CircularQueue(n)
             for num_gen in range(n):  # Iterating through number of teams to be created
                 # Randomly chosing a Battle Mode (0 or 1)
-                battle_mode = RandomGen.randint(0, 1)
+                battle_mode = random_gen.randint(0, 1)
                 rand_team = PokeTeam.random_team(
-                    f'Team {num_gen}', battle_mode)  # Instantiating a random PokeTeam Object
-                rand_team.num_lives = RandomGen.randint(2, 10)
+                    f'Team {num_gen}', battle_mode, random_gen=random_gen)  # Instantiating a random PokeTeam Object
+                rand_team.num_lives = random_gen.randint(2, 10)
                 # Adding the randomly generated team to the Tower (CircularQueue Object)
                 tower.append(rand_team)
             self.tower = tower
@@ -103,13 +123,158 @@ class BattleTower:
         """
 
         if self.my_team is not None:  # tower can be none for the condition that the my_team wins
-            self = BattleTowerIterator(
-                self.tower, self.my_team, self.battle)  # Getting Self to point to the BattleTowerIterator Object
-            return self
+            return BattleTowerIterator(self.tower, self.my_team, self.battle, self)
         # Cannot iterate through the tower if all teams in the tower are taken out, my_team has won
         raise ValueError('No my_team found')
 
 
+    def set_checkpoint(self, every: int, path: str | None = None) -> None:
+        """
+
+        This method makes the tower save a snapshot of itself every few rounds, so a long run can be resumed with load
+
+        Parameters:
+            every (int): The number of rounds between snapshots, 0 to stop saving them
+            path (str): The file the snapshots are saved to, each one replacing the last, only needed when every > 0
+
+        Raises:
+            ValueError: If every is not a non-negative integer, or every > 0 and no path is given
+        """
+
+        if not isinstance(every, int) or every < 0:
+            raise ValueError('every must be a non-negative integer')
+        if every > 0 and not path:
+            raise ValueError('A checkpoint path is needed to save checkpoints')
+        self.checkpoint_every = every
+        self.checkpoint_path = path
+
+    def stream_state(self, random_gen: RandomGen | None) -> int | str | None:
+        """ Encodes which stream a random_gen is: None for the default stream, 'tower' for the tower's own, otherwise its seed """
+        if random_gen is None or random_gen is RandomGen.default:
+            return None
+        if random_gen is self.random_gen:
+            return 'tower'
+        return random_gen.seed
+
+    def snapshot(self) -> dict:
+        """
+
+        This method captures the state of the tower between two rounds: the teams still in it in order with their lives, my_team,
+        the rounds played and the state of every random stream the battles use. Teams are regenerated before every battle,
+        so a team is fully described by its spec
+
+        Parameters:
+            None
+
+        Returns:
+            dict: A snapshot of plain values that can be written as JSON, see load
+
+        Complexity analysis:
+            Best/worst case O(n) where n is the number of teams left in the tower
+        """
+
+        tower = []
+        capacity = 0
+        if self.tower is not None:
+            capacity = len(self.tower.array)
+            for team in self.tower:
+                tower.append([team.to_spec(), team.num_lives])
+        return {'version': self.SNAPSHOT_VERSION,
+                'rounds': self.rounds,
+                'capacity': capacity,
+                'tower': tower,
+                'my_team': None if self.my_team is None else self.my_team.to_spec(),
+                'my_team_stream': None if self.my_team is None else self.stream_state(self.my_team.random_gen),
+                'tower_seed': None if self.random_gen is None else self.random_gen.seed,
+                'battle_stream': self.stream_state(self.battle.random_gen),
+                'default_seed': RandomGen.default.seed}
+
+    def save(self, path: str) -> None:
+        """
+
+        This method writes a snapshot of the tower as compact JSON, replacing the file only once the snapshot is fully written
+
+        Parameters:
+            path (str): The file to save to
+
+        Complexity analysis:
+            Best/worst case O(n) where n is the number of teams left in the tower
+        """
+
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self.snapshot(), file, separators=(',', ':'))
+        os.replace(temporary, path)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, battle: Battle | None = None) -> BattleTower:
+        """
+
+        This method rebuilds a tower from a snapshot, iterating it then plays exactly the rounds the snapshotted tower had left
+
+        The default stream is reseeded to its state in the snapshot.
+
+        Parameters:
+            snapshot (dict): A snapshot from the snapshot method
+            battle (Battle): The Battle to play the rounds with, its random_gen is replaced by the snapshotted one,
+                a headless Battle when not given
+
+        Returns:
+            BattleTower: The restored tower
+
+        Raises:
+            ValueError: If the snapshot is of another version
+
+        Complexity analysis:
+            Best/worst case O(n * T) where n is the number of teams left in the tower and T the cost of creating a team
+        """
+
+        if snapshot.get('version') != cls.SNAPSHOT_VERSION:
+            raise ValueError('Unsupported snapshot version')
+        random_gen = None if snapshot['tower_seed'] is None else RandomGen(snapshot['tower_seed'])
+
+        def stream(state):
+            if state is None:
+                return None
+            if state == 'tower':
+                return random_gen
+            return RandomGen(state)
+
+        if battle is None:
+            battle = Battle()
+        battle.random_gen = stream(snapshot['battle_stream'])
+        battle_tower = cls(battle, random_gen)
+        battle_tower.rounds = snapshot['rounds']
+        if snapshot['my_team'] is not None:
+            battle_tower.set_my_team(PokeTeam.from_spec(snapshot['my_team'], stream(snapshot['my_team_stream'])))
+        if snapshot['capacity']:
+            battle_tower.tower = CircularQueue(snapshot['capacity'])
+            for spec, lives in snapshot['tower']:
+                # generate_teams gives the teams the tower's stream
+                team = PokeTeam.from_spec(spec, random_gen)
+                team.num_lives = lives
+                battle_tower.tower.append(team)
+        RandomGen.default.set_seed(snapshot['default_seed'])
+        return battle_tower
+
+    @classmethod
+    def load(cls, path: str, battle: Battle | None = None) -> BattleTower:
+        """
+
+        This method rebuilds a tower from a snapshot saved with save, see from_snapshot
+
+        Parameters:
+            path (str): The file the snapshot was saved to
+            battle (Battle): The Battle to play the rounds with, a headless Battle when not given
+
+        Returns:
+            BattleTower: The restored tower
+        """
+
+        with open(path) as file:
+            return cls.from_snapshot(json.load(file), battle)
+
+
 class BattleTowerIterator:
     """
 
@@ -119,16 +284,18 @@ class BattleTowerIterator:
         battle_tower (CircularQueue): A circular Queue object that essentially just represents the tower of randomly generated teams to fight through
         my_team (PokeTeam): A PokeTeam object used to represent the team that is fighting through the battle
         battle (Battle): 
+        owner (BattleTower): The BattleTower being iterated, which counts the rounds and saves the checkpoints, None if there is none
 
     """
 
-    def __init__(self, tower: CircularQueue, my_team: PokeTeam, battle: Battle):
+    def __init__(self, tower: CircularQueue, my_team: PokeTeam, battle: Battle, owner: BattleTower | None = None):
         # setting the battle_tower instance attribute to equal tower which is a variable representing a CircularQueue object
         self.battle_tower = tower
         # setting the poke_team instance attribute to equal the my_team PokeTeam object
         self.my_poke_team = my_team
         # setting the battle_poke instance attribute to equal the battle Battle Object
         self.battle_poke = battle
+        self.owner = owner
 
     def __next__(self):
         """
@@ -162,6 +329,7 @@ class BattleTowerIterator:
             if res == 2:  # If the random team in the tower won
                 self.battle_tower.clear()
                 tower_team = team2
+                self.end_round()
                 return (res, player_team, tower_team, team2.num_lives)
             # If your team wins/draws the battle
             else:
@@ -170,6 +338,7 @@ class BattleTowerIterator:
                 if not team2.num_lives <= 0:
                     self.battle_tower.append(team2)
                 tower_team = team2
+                self.end_round()
                 return (res, player_team, tower_team, team2.num_lives)
         else:
             raise StopIteration  # End the iterator by raising a StopIteration Exception
@@ -188,6 +357,22 @@ class BattleTowerIterator:
 
         return self
 
+    def end_round(self) -> None:
+        """
+
+        This method counts a finished round on the BattleTower, saving its checkpoint when one is due
+
+        Complexity analysis:
+            Best case O(1) when no checkpoint is due
+            Worst case O(n) where n is the number of teams left in the tower
+        """
+
+        owner = self.owner
+        if owner is not None:
+            owner.rounds += 1
+            if owner.checkpoint_every and owner.rounds % owner.checkpoint_every == 0:
+                owner.save(owner.checkpoint_path)
+
     def avoid_duplicates(self):
         """
 
@@ -209,3 +394,78 @@ class BattleTowerIterator:
             poke_team = self.battle_tower.serve()
             if max(poke_team.team_numbers) <= 1:
                 self.battle_tower.append(poke_team)
+
+
+class TestBattleTower(unittest.TestCase):
+    """ Tests that a tower saved between rounds and loaded again plays the same remaining rounds. """
+    SEEDS = range(12)
+    TEAMS = 4
+
+    def setUp(self):
+        self.default_seed = RandomGen.default.seed
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'tower.json')
+
+    def tearDown(self):
+        RandomGen.default.set_seed(self.default_seed)
+        self.directory.cleanup()
+
+    def seeded_tower(self, seed: int) -> BattleTower:
+        RandomGen.default.set_seed(seed)
+        random_gen = RandomGen(seed)
+        tower = BattleTower(random_gen=random_gen)
+        tower.set_my_team(PokeTeam.random_team('Me', 2, team_size=6, criterion=Criterion.HP, random_gen=random_gen))
+        tower.generate_teams(self.TEAMS)
+        return tower
+
+    @staticmethod
+    def results(rounds) -> list:
+        return [(res, str(player_team), str(tower_team), lives) for res, player_team, tower_team, lives in rounds]
+
+    def test_resume(self):
+        resumed = 0
+        for seed in self.SEEDS:
+            full = self.results(self.seeded_tower(seed))
+            for k in (1, 2, 5):
+                if k >= len(full):
+                    continue
+                with self.subTest(seed=seed, k=k):
+                    tower = self.seeded_tower(seed)
+                    iterator = iter(tower)
+                    played = self.results(next(iterator) for _ in range(k))
+                    tower.save(self.path)
+                    RandomGen.default.set_seed(seed + 12345)
+                    loaded = BattleTower.load(self.path)
+                    self.assertEqual(loaded.rounds, k)
+                    self.assertEqual(played + self.results(loaded), full)
+                    resumed += 1
+        self.assertGreater(resumed, 0)
+
+    def test_checkpoint(self):
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed):
+                tower = self.seeded_tower(seed)
+                full = self.results(self.seeded_tower(seed))
+                if len(full) < 2:
+                    continue
+                tower.set_checkpoint(2, self.path)
+                self.assertEqual(self.results(tower), full)
+                RandomGen.default.set_seed(seed + 12345)
+                loaded = BattleTower.load(self.path)
+                rounds = loaded.rounds
+                self.assertEqual(rounds, len(full) - len(full) % 2)
+                self.assertEqual(self.results(loaded), full[rounds:])
+
+    def test_checkpoint_needs_path(self):
+        tower = BattleTower()
+        with self.assertRaises(ValueError):
+            tower.set_checkpoint(2)
+        with self.assertRaises(ValueError):
+            tower.set_checkpoint(-1, self.path)
+        tower.set_checkpoint(0)
+
+
+if __name__ == '__main__':
+    testtorun = TestBattleTower()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
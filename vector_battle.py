@@ -0,0 +1,447 @@
+""" Struct-of-arrays battle engine running many battles at once.
+
+Every Pokemon of every team of every battle is a slot in NumPy arrays of shape
+(battles, 2 sides, 6 slots), and one call to step() plays a turn of every
+unfinished battle with array operations. Each battle draws from its own LCG
+stream, so battle i gives exactly the result (and number of turns) of
+Battle(random_gen=RandomGen(seeds[i])).battle(team1, team2).
+
+Only the ALWAYS_ATTACK and SWAP_ON_SUPER_EFFECTIVE AIs are supported, as the
+other two never reach a decision without RandomGen draws or user input.
+Also defines UnitTests checking the engine against Battle.
+"""
+from __future__ import annotations
+
+__author__ = "Code by Daniel Liu, Ben Abraham, Johnny Ta, Bangze Han"
+__docformat__ = 'reStructuredText'
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from pokemon import Charmander, Charizard, Bulbasaur, Venusaur, Squirtle, Blastoise, Gastly, Haunter, Gengar, Eevee
+from pokemon_base import PokemonBase
+from random_gen import RandomGen
+
+# Species index is the pokedex id - 1
+SPECIES_CLASSES = [Charmander, Charizard, Bulbasaur, Venusaur, Squirtle,
+                   Blastoise, Gastly, Haunter, Gengar, Eevee]
+# team_numbers index -> species index of the base Pokemon
+TEAM_SPECIES = [0, 2, 4, 6, 9]
+GASTLY = 6
+# Species index of the evolved form, -1 when the species does not evolve
+EVOLVES_TO = [SPECIES_CLASSES.index(PokemonBase.SPECIES[cls.EVOLVES_INTO]) if cls.EVOLVES_INTO else -1
+              for cls in SPECIES_CLASSES]
+# Status codes, a successful status attack sets the attacker's type code + 1
+STATUS_NAMES = ['free'] + PokemonBase.STATUS_BY_TYPE
+FREE, BURN, POISON, PARALYSIS, SLEEP, CONFUSE = (STATUS_NAMES.index(name) for name in
+                                                 ('free', 'burn', 'poison', 'paralysis', 'sleep', 'confuse'))
+
+TEAM_SLOTS = 6
+EMPTY_ORDER = 1 << 62
+
+
+class SpeciesArrays:
+    """ The species constants as NumPy arrays indexed by species index. """
+
+    def __init__(self) -> None:
+        base = [cls() for cls in SPECIES_CLASSES]
+        self.id = np.array([p.id for p in base], dtype=np.int64)
+        self.type = np.array([p.type_code for p in base], dtype=np.int64)
+        self.level = np.array([p.level for p in base], dtype=np.int64)
+        self.hp = np.array([p.hp for p in base], dtype=np.int64)
+        self.attack = np.array([p.attack_damage for p in base], dtype=np.int64)
+        self.defence = np.array([p.defence for p in base], dtype=np.int64)
+        self.speed = np.array([p.speed for p in base], dtype=np.int64)
+        self.evolves_to = np.array(EVOLVES_TO, dtype=np.int64)
+        self.evolve_level = np.array([cls.EVOLUTION_LEVEL or -1 for cls in SPECIES_CLASSES], dtype=np.int64)
+        # growth[stat] = (has growth, base, multiplier, divisor) for max_hp, attack_damage, defence and speed
+        self.growth = []
+        for stat in ('hp_growth', 'attack_growth', 'defence_growth', 'speed_growth'):
+            rules = [getattr(cls.species, stat) for cls in SPECIES_CLASSES]
+            self.growth.append((np.array([r is not None for r in rules]),
+                                np.array([r[0] if r else 0 for r in rules], dtype=np.int64),
+                                np.array([r[1] if r else 0 for r in rules], dtype=np.int64),
+                                np.array([r[2] if r else 1 for r in rules], dtype=np.int64)))
+        # defend[k] = column k of Species.defend_rule
+        self.defend = [np.array(column, dtype=np.int64) for column in zip(*(cls.species.defend_rule for cls in SPECIES_CLASSES))]
+        self.multiplier = PokemonBase.effective_multiplier_array()
+
+
+class VectorBattle:
+    """
+    N battles between pairs of team specs (see PokeTeam.from_spec), advanced one turn per step().
+
+    Usage:
+    ```
+    engine = VectorBattle(specs1, specs2, seeds)
+    results, turns = engine.run()
+    ```
+
+    Attributes:
+        result (ndarray): 1 or 2 for the winning team, 0 for a draw, -1 while the battle is running
+        turns (ndarray): turns played by each battle so far
+    """
+
+    species_arrays = None
+
+    def __init__(self, team_specs_1: list[dict], team_specs_2: list[dict], seeds: list[int]) -> None:
+        """
+        :param team_specs_1: team 1's spec of each battle
+        :param team_specs_2: team 2's spec of each battle
+        :param seeds: seed of each battle's RandomGen stream
+        :raises ImportError: if NumPy is not installed
+        :raises ValueError: for an unsupported AI or an empty team
+        :complexity: O(N) where N is the number of battles
+        """
+        if np is None:
+            raise ImportError('VectorBattle requires NumPy')
+        if not len(team_specs_1) == len(team_specs_2) == len(seeds):
+            raise ValueError('Every battle needs two team specs and a seed')
+        if VectorBattle.species_arrays is None:
+            VectorBattle.species_arrays = SpeciesArrays()
+        self.sp = VectorBattle.species_arrays
+        n = len(seeds)
+        shape = (n, 2, TEAM_SLOTS)
+        self.species = np.full(shape, -1, dtype=np.int64)
+        self.uid = np.zeros(shape, dtype=np.int64)
+        self.order = np.full(shape, EMPTY_ORDER, dtype=np.int64)
+        self.in_team = np.zeros(shape, dtype=bool)
+        self.mode = np.zeros((n, 2), dtype=np.int64)
+        self.criterion = np.zeros((n, 2), dtype=np.int64)
+        self.ai_swap = np.zeros((n, 2), dtype=bool)
+
+        for b in range(n):
+            for side, spec in enumerate((team_specs_1[b], team_specs_2[b])):
+                self._load_team(b, side, spec)
+
+        sp = self.sp
+        safe = np.maximum(self.species, 0)
+        self.level = sp.level[safe]
+        self.hp = sp.hp[safe]
+        self.max_hp = sp.hp[safe]
+        self.attack = sp.attack[safe]
+        self.defence = sp.defence[safe]
+        self.speed = sp.speed[safe]
+        self.max_speed = sp.speed[safe]
+        self.status = np.zeros(shape, dtype=np.int64)
+
+        # Battle mode 2 orders by criterion, then pokedex id, then unique id
+        crit = self._criterion_values(np.arange(n)[:, None, None], np.arange(2)[None, :, None],
+                                      np.arange(TEAM_SLOTS)[None, None, :], self.criterion[:, :, None])
+        sorted_order = self._sorted_key(crit, sp.id[safe], self.uid)
+        self.order = np.where(self.in_team & (self.mode[:, :, None] == 2), sorted_order, self.order)
+
+        self.rng = np.array([seed % RandomGen.MOD for seed in seeds], dtype=np.uint64)
+        self.clock = np.zeros((n, 2), dtype=np.int64)
+        self.cur = np.full((n, 2), -1, dtype=np.int64)
+        self.result = np.full(n, -1, dtype=np.int64)
+        self.turns = np.zeros(n, dtype=np.int64)
+        everyone = np.arange(n)
+        self._retrieve(everyone, 0)
+        self._retrieve(everyone, 1)
+        if (self.cur < 0).any():
+            raise ValueError('Every team needs at least one Pokemon')
+
+    def _load_team(self, b: int, side: int, spec: dict) -> None:
+        """ Fills the slots of one team in the order create_team builds it. """
+        ai_type = spec['ai_type']
+        if isinstance(ai_type, str):
+            ai_type = PokeTeam.AI[ai_type]
+        if ai_type not in (PokeTeam.AI.ALWAYS_ATTACK, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE):
+            raise ValueError(f'Unsupported AI {ai_type.name}')
+        criterion = spec.get('criterion')
+        if isinstance(criterion, str):
+            criterion = Criterion[criterion]
+        mode = spec['battle_mode']
+        self.mode[b, side] = mode
+        self.ai_swap[b, side] = ai_type == PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE
+        if mode == 2:
+            self.criterion[b, side] = criterion.value - 1
+        slot = 0
+        for index, count in enumerate(spec['team_numbers']):
+            for k in range(count):
+                if slot == TEAM_SLOTS:
+                    raise ValueError('A team has at most 6 Pokemon')
+                self.species[b, side, slot] = TEAM_SPECIES[index]
+                self.uid[b, side, slot] = k + 1 if mode == 2 else 0
+                # Stacks and queues both hand out Pokemon in team_numbers order
+                self.order[b, side, slot] = slot
+                self.in_team[b, side, slot] = True
+                slot += 1
+
+    def _criterion_values(self, b, side, j, criterion):
+        """ Current value of each criterion (SPD, HP, LV, DEF). """
+        return np.choose(criterion, [self.speed[b, side, j], self.hp[b, side, j],
+                                     self.level[b, side, j], self.defence[b, side, j]])
+
+    @staticmethod
+    def _sorted_key(criterion_value, poke_id, uid):
+        """ Descending criterion, ties broken by ascending pokedex id then unique id. """
+        return -criterion_value * PokeTeam.CRITERION_WEIGHT + poke_id * PokeTeam.ID_WEIGHT + uid
+
+    def _chance(self, b, ratio):
+        """ random_chance(ratio) on the stream of each battle in b. """
+        state = (self.rng[b] * np.uint64(RandomGen.A) + np.uint64(RandomGen.C)) & np.uint64(RandomGen.MOD - 1)
+        self.rng[b] = state
+        return (state >> np.uint64(16)) / (1 << 32) < ratio
+
+    def _retrieve(self, b, side) -> None:
+        """ retrieve_pokemon: the team member with the smallest order goes on the field, -1 if none is left. """
+        orders = np.where(self.in_team[b, side], self.order[b, side], EMPTY_ORDER)
+        j = orders.argmin(axis=1)
+        has = self.in_team[b, side, j]
+        self.cur[b, side] = np.where(has, j, -1)
+        self.in_team[b[has], side, j[has]] = False
+
+    def _return(self, b, side) -> None:
+        """ return_pokemon: clears the status and puts the Pokemon back unless it fainted. """
+        j = self.cur[b, side]
+        para = self.status[b, side, j] == PARALYSIS
+        self.speed[b[para], side, j[para]] = self.max_speed[b[para], side, j[para]]
+        self.status[b, side, j] = FREE
+        alive = self.hp[b, side, j] > 0
+        b, j = b[alive], j[alive]
+        self.clock[b, side] += 1
+        mode = self.mode[b, side]
+        crit = self._criterion_values(b, side, j, self.criterion[b, side])
+        sorted_key = self._sorted_key(crit, self.sp.id[self.species[b, side, j]], self.uid[b, side, j])
+        # A stack pops the returned Pokemon next, a queue serves it last
+        self.order[b, side, j] = np.where(mode == 0, -self.clock[b, side],
+                                          np.where(mode == 1, TEAM_SLOTS + self.clock[b, side], sorted_key))
+        self.in_team[b, side, j] = True
+
+    def _defend(self, b, side, j, damage) -> None:
+        """ defend: the species rule of each defending Pokemon. """
+        sp = self.species[b, side, j]
+        t_mul, t_add, above, below_mul, below_div = (column[sp] for column in self.sp.defend)
+        loss = np.where(damage > t_mul * self.defence[b, side, j] + t_add,
+                        damage * above, (damage * below_mul) // below_div)
+        self.hp[b, side, j] -= loss
+
+    def _attack(self, b, side) -> None:
+        """ attack: the Pokemon of `side` attacks the other side in every battle of b. """
+        other = 1 - side
+        j = self.cur[b, side]
+        k = self.cur[b, other]
+        status = self.status[b, side, j]
+        own_type = self.sp.type[self.species[b, side, j]]
+        can_attack = status != SLEEP
+
+        confused = np.flatnonzero(status == CONFUSE)
+        if confused.size:
+            hit_self = confused[self._chance(b[confused], 0.5)]
+            can_attack[hit_self] = False
+            t = own_type[hit_self]
+            damage = np.trunc(self.sp.multiplier[t, t] * self.attack[b[hit_self], side, j[hit_self]]).astype(np.int64)
+            self._defend(b[hit_self], side, j[hit_self], damage)
+
+        b, j, k, status, own_type = b[can_attack], j[can_attack], k[can_attack], status[can_attack], own_type[can_attack]
+        other_type = self.sp.type[self.species[b, other, k]]
+        damage = self.sp.multiplier[own_type, other_type] * self.attack[b, side, j]
+        damage = np.trunc(np.where(status == BURN, damage * 0.5, damage)).astype(np.int64)
+        self._defend(b, other, k, damage)
+        self.hp[b, side, j] -= np.where(status == BURN, 1, np.where(status == POISON, 3, 0))
+        inflict = self._chance(b, 0.2)
+        self.status[b[inflict], other, k[inflict]] = own_type[inflict] + 1
+
+    def _should_evolve(self, b, side, j):
+        sp = self.species[b, side, j]
+        return (self.sp.evolves_to[sp] >= 0) & (self.level[b, side, j] == self.sp.evolve_level[sp])
+
+    def _check_evolution(self, b, side) -> None:
+        """ check_evolution: evolves the Pokemon on the field, keeping its hp difference, status and unique id. """
+        j = self.cur[b, side]
+        evolve = self._should_evolve(b, side, j) & (self.hp[b, side, j] > 0)
+        b, j = b[evolve], j[evolve]
+        new = self.sp.evolves_to[self.species[b, side, j]]
+        difference_hp = self.max_hp[b, side, j] - self.hp[b, side, j]
+        self.species[b, side, j] = new
+        self.level[b, side, j] = self.sp.level[new]
+        self.max_hp[b, side, j] = self.sp.hp[new]
+        self.hp[b, side, j] = self.sp.hp[new] - difference_hp
+        self.attack[b, side, j] = self.sp.attack[new]
+        self.defence[b, side, j] = self.sp.defence[new]
+        self.speed[b, side, j] = self.sp.speed[new]
+        self.max_speed[b, side, j] = self.sp.speed[new]
+
+    def _level_up(self, b, side) -> None:
+        """ level_up: stats grow unless the new level is the evolution level. """
+        j = self.cur[b, side]
+        self.level[b, side, j] += 1
+        grow = ~self._should_evolve(b, side, j)
+        b, j = b[grow], j[grow]
+        sp = self.species[b, side, j]
+        level = self.level[b, side, j]
+        (hp_has, hp_base, hp_mul, hp_div), atk, dfn, spd = self.sp.growth
+        difference_hp = self.max_hp[b, side, j] - self.hp[b, side, j]
+        self.max_hp[b, side, j] = np.where(hp_has[sp], hp_base[sp] + (hp_mul[sp] * level) // hp_div[sp], self.max_hp[b, side, j])
+        self.hp[b, side, j] = self.max_hp[b, side, j] - difference_hp
+        for values, (has, base, mul, div) in ((self.attack, atk), (self.defence, dfn)):
+            values[b, side, j] = np.where(has[sp], base[sp] + (mul[sp] * level) // div[sp], values[b, side, j])
+        has, base, mul, div = spd
+        new_speed = np.where(has[sp], base[sp] + (mul[sp] * level) // div[sp], self.speed[b, side, j])
+        self.speed[b, side, j] = new_speed
+        self.max_speed[b, side, j] = np.where(has[sp], new_speed, self.max_speed[b, side, j])
+
+    def _field(self, values, b, side):
+        return values[b, side, self.cur[b, side]]
+
+    def step(self) -> int:
+        """
+        Plays one turn of every unfinished battle, in the order of Battle.battle.
+        :returns: the number of battles still running
+        :complexity: O(N) array work where N is the number of battles
+        """
+        b = np.flatnonzero(self.result < 0)
+        if b.size == 0:
+            return 0
+        self.turns[b] += 1
+        sp = self.sp
+
+        # AI: SWAP_ON_SUPER_EFFECTIVE swaps when the other Pokemon hits it for 1.5x or more
+        types = [sp.type[self._field(self.species, b, side)] for side in (0, 1)]
+        swap = [self.ai_swap[b, side] & (sp.multiplier[types[1 - side], types[side]] >= 1.5) for side in (0, 1)]
+        for side in (0, 1):
+            self._return(b[swap[side]], side)
+            self._retrieve(b[swap[side]], side)
+
+        attacks = [~swap[0], ~swap[1]]
+        for side in (0, 1):
+            ab = b[attacks[side]]
+            j = self.cur[ab, side]
+            para = self.status[ab, side, j] == PARALYSIS
+            self.speed[ab[para], side, j[para]] = self.max_speed[ab[para], side, j[para]] // 2
+        speed1 = self._field(self.speed, b, 0)
+        speed2 = self._field(self.speed, b, 1)
+        self._attack(b[attacks[1] & (speed2 > speed1)], 1)
+        self._attack(b[attacks[0] & (self._field(self.hp, b, 0) > 0)], 0)
+        self._attack(b[attacks[1] & (speed2 < speed1) & (self._field(self.hp, b, 1) > 0)], 1)
+        self._attack(b[attacks[1] & (speed2 == speed1)], 1)
+
+        alive = (self._field(self.hp, b, 0) > 0) & (self._field(self.hp, b, 1) > 0)
+        for side in (0, 1):
+            j = self.cur[b[alive], side]
+            self.hp[b[alive], side, j] -= 1
+
+        for side in (0, 1):
+            gastly = (self._field(self.species, b, side) == GASTLY) & (self._field(self.hp, b, side) > 0)
+            self._check_evolution(b[gastly], side)
+
+        fainted = [self._field(self.hp, b, side) <= 0 for side in (0, 1)]
+        for side in (0, 1):
+            won = b[fainted[1 - side] & ~fainted[side]]
+            self._level_up(won, side)
+            self._check_evolution(won, side)
+            lost = b[fainted[side] & ~fainted[1 - side]]
+            self._return(lost, side)
+            self._retrieve(lost, side)
+        both = b[fainted[0] & fainted[1]]
+        self._retrieve(both, 0)
+        self._retrieve(both, 1)
+
+        out1 = self.cur[b, 0] < 0
+        out2 = self.cur[b, 1] < 0
+        self.result[b] = np.where(out1 & out2, 0, np.where(out1, 2, np.where(out2, 1, -1)))
+        return int((self.result < 0).sum())
+
+    def run(self, max_turns: int | None = None):
+        """
+        Steps until every battle is over (or max_turns turns were played).
+        :returns: (result, turns) arrays
+        """
+        played = 0
+        # The limit is checked first, so exactly max_turns turns are played
+        while (max_turns is None or played < max_turns) and self.step():
+            played += 1
+        return self.result, self.turns
+
+
+def vector_battle(team_specs_1: list[dict], team_specs_2: list[dict], seeds: list[int]):
+    """ Plays every battle to the end, returns (result, turns) arrays. """
+    return VectorBattle(team_specs_1, team_specs_2, seeds).run()
+
+
+def random_specs(n: int, random_gen: RandomGen, ai_types: tuple = (PokeTeam.AI.ALWAYS_ATTACK, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE)) -> list[dict]:
+    """ n random team specs drawn like PokeTeam.random_team, with a random battle mode, AI and criterion. """
+    specs = []
+    for i in range(n):
+        specs.append({'team_name': f'Team {i}',
+                      'team_numbers': PokeTeam.random_team_numbers(random_gen.randint(1, 6), random_gen),
+                      'battle_mode': random_gen.randint(0, 2),
+                      'ai_type': ai_types[random_gen.randint(0, len(ai_types) - 1)],
+                      'criterion': Criterion(random_gen.randint(1, len(Criterion)))})
+    return specs
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestVectorBattle(unittest.TestCase):
+    """ Tests VectorBattle against Battle.battle under the same seeds. """
+    BATTLES = 400
+
+    def check_against_battle(self, specs1, specs2, seeds):
+        results, turns = vector_battle(specs1, specs2, seeds)
+        for i in range(len(seeds)):
+            battle = Battle(random_gen=RandomGen(seeds[i]))
+            res = battle.battle(PokeTeam.from_spec(specs1[i]), PokeTeam.from_spec(specs2[i]))
+            self.assertEqual((results[i], turns[i]), (res, battle.turns), (specs1[i], specs2[i], seeds[i]))
+
+    def test_random_teams(self):
+        gen = RandomGen(2022)
+        specs1 = random_specs(self.BATTLES, gen)
+        specs2 = random_specs(self.BATTLES, gen)
+        self.check_against_battle(specs1, specs2, [gen.random() for _ in range(self.BATTLES)])
+
+    def test_always_attack(self):
+        gen = RandomGen(7)
+        specs1 = random_specs(self.BATTLES, gen, (PokeTeam.AI.ALWAYS_ATTACK,))
+        specs2 = random_specs(self.BATTLES, gen, (PokeTeam.AI.ALWAYS_ATTACK,))
+        self.check_against_battle(specs1, specs2, list(range(self.BATTLES)))
+
+    def test_swap_on_super_effective(self):
+        gen = RandomGen(11)
+        specs1 = random_specs(self.BATTLES, gen, (PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE,))
+        specs2 = random_specs(self.BATTLES, gen, (PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE,))
+        self.check_against_battle(specs1, specs2, [seed * 7919 for seed in range(self.BATTLES)])
+
+    def test_single_species_teams(self):
+        specs1, specs2, seeds = [], [], []
+        for a in range(5):
+            for b in range(5):
+                for mode in range(3):
+                    numbers1 = [0] * 5
+                    numbers2 = [0] * 5
+                    numbers1[a] = 6
+                    numbers2[b] = 6
+                    specs1.append({'team_name': 'A', 'team_numbers': numbers1, 'battle_mode': mode,
+                                   'ai_type': 'ALWAYS_ATTACK', 'criterion': 'LV'})
+                    specs2.append({'team_name': 'B', 'team_numbers': numbers2, 'battle_mode': 2 - mode,
+                                   'ai_type': 'SWAP_ON_SUPER_EFFECTIVE', 'criterion': 'DEF'})
+                    seeds.append(a * 100 + b * 10 + mode)
+        self.check_against_battle(specs1, specs2, seeds)
+
+    def test_max_turns(self):
+        gen = RandomGen(5)
+        specs1 = random_specs(50, gen)
+        specs2 = random_specs(50, gen)
+        seeds = list(range(50))
+        _, full_turns = vector_battle(specs1, specs2, seeds)
+        for max_turns in (0, 1, 3):
+            _, turns = VectorBattle(specs1, specs2, seeds).run(max_turns)
+            self.assertEqual(list(turns), [min(t, max_turns) for t in full_turns])
+
+    def test_random_ai_rejected(self):
+        spec = {'team_name': 'A', 'team_numbers': [1, 0, 0, 0, 0], 'battle_mode': 0, 'ai_type': 'RANDOM'}
+        with self.assertRaises(ValueError):
+            VectorBattle([spec], [spec], [1])
+
+
+if __name__ == '__main__':
+    testtorun = TestVectorBattle()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)